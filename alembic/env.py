@@ -11,10 +11,7 @@ from app.core.config import get_settings
 from app.core.database import Base
 
 # Import all models to ensure they are registered
-from app.jobs.models import JobRecord
-from app.candidates.models import ApplicantRecord, PrescreeningResponseRecord
-from app.interviews.models import InterviewRecord
-from app.auth.models import User
+import app.models  # noqa: F401
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
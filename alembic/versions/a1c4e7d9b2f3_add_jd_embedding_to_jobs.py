@@ -0,0 +1,32 @@
+"""Add jd_embedding column to jobs table
+
+Revision ID: a1c4e7d9b2f3
+Revises: f8a3b2c4d5e6
+Create Date: 2026-10-14 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a1c4e7d9b2f3"
+down_revision: Union[str, None] = "f8a3b2c4d5e6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # L2-normalized JD embedding, written when the JD is approved
+    op.add_column(
+        "jobs",
+        sa.Column("jd_embedding", postgresql.ARRAY(sa.Float()), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("jobs", "jd_embedding")
@@ -0,0 +1,29 @@
+"""Add jsonld_cached column to jobs table
+
+Revision ID: b7e2d4f6a8c1
+Revises: a1c4e7d9b2f3
+Create Date: 2026-10-14 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e2d4f6a8c1"
+down_revision: Union[str, None] = "a1c4e7d9b2f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serialized JSON-LD rendered at approval; backfill with
+    # scripts/backfill_jsonld.py for jobs approved before this revision
+    op.add_column("jobs", sa.Column("jsonld_cached", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("jobs", "jsonld_cached")
@@ -0,0 +1,38 @@
+"""Add processing_state column to applicants table
+
+Revision ID: c3d9e1f5a7b2
+Revises: b7e2d4f6a8c1
+Create Date: 2026-10-14 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3d9e1f5a7b2"
+down_revision: Union[str, None] = "b7e2d4f6a8c1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing applicants were scored synchronously, so they start as "done";
+    # new rows get "pending" from the application until scoring finishes
+    op.add_column(
+        "applicants",
+        sa.Column(
+            "processing_state",
+            sa.String(length=20),
+            nullable=False,
+            server_default="done",
+        ),
+    )
+    op.alter_column("applicants", "processing_state", server_default=None)
+
+
+def downgrade() -> None:
+    op.drop_column("applicants", "processing_state")
@@ -0,0 +1,38 @@
+"""Add partial index for public job listings
+
+Revision ID: d4e8f2a6b9c3
+Revises: c3d9e1f5a7b2
+Create Date: 2026-10-14 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e8f2a6b9c3"
+down_revision: Union[str, None] = "c3d9e1f5a7b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Only published jobs are indexed, so the index stays small; built
+    # concurrently to avoid locking the jobs table during deploys
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_jobs_public",
+            "jobs",
+            [sa.text("created_at DESC")],
+            postgresql_where=sa.text(
+                "jd_approval_status = 'approved' AND generated_jd IS NOT NULL"
+            ),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_jobs_public", table_name="jobs", postgresql_concurrently=True)
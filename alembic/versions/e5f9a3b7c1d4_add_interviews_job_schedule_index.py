@@ -0,0 +1,40 @@
+"""Add covering index for a job's interview schedule
+
+Revision ID: e5f9a3b7c1d4
+Revises: d4e8f2a6b9c3
+Create Date: 2026-10-14 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "e5f9a3b7c1d4"
+down_revision: Union[str, None] = "d4e8f2a6b9c3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # INCLUDE makes schedule listings index-only; built concurrently to
+    # avoid locking the interviews table during deploys
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_interviews_job_sched",
+            "interviews",
+            ["job_id", sa.text("scheduled_datetime DESC")],
+            postgresql_include=["meeting_link", "interviewer_email", "status"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_interviews_job_sched",
+            table_name="interviews",
+            postgresql_concurrently=True,
+        )
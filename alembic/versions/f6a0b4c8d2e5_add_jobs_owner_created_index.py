@@ -0,0 +1,48 @@
+"""Add covering index for the per-user job list
+
+Revision ID: f6a0b4c8d2e5
+Revises: e5f9a3b7c1d4
+Create Date: 2026-10-14 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "f6a0b4c8d2e5"
+down_revision: Union[str, None] = "e5f9a3b7c1d4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Ordered by created_at so paginated listings need no sort; INCLUDE
+    # holds the list-view columns so the heap is not touched. Built
+    # concurrently to avoid locking the jobs table during deploys
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_jobs_owner_created",
+            "jobs",
+            ["owner_id", sa.text("created_at DESC")],
+            postgresql_include=[
+                "id",
+                "role_title",
+                "company_name",
+                "current_node",
+                "jd_approval_status",
+                "updated_at",
+            ],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_jobs_owner_created",
+            table_name="jobs",
+            postgresql_concurrently=True,
+        )
@@ -69,6 +69,13 @@ def get_openai_client() -> AsyncOpenAI:
     return AsyncOpenAI(api_key=settings.openai_api_key)
 
 
+async def close_openai_client() -> None:
+    """Close the cached OpenAI client's connection pool, if one was created."""
+    if get_openai_client.cache_info().currsize:
+        await get_openai_client().close()
+        get_openai_client.cache_clear()
+
+
 def get_embedding_dimension() -> int:
     """
     Get the embedding dimension for the active provider.
@@ -80,3 +87,16 @@ def get_embedding_dimension() -> int:
     if is_bedrock_provider():
         return settings.bedrock_embedding_dimension
     return settings.openai_embedding_dimension
+
+
+def get_embedding_model() -> str:
+    """
+    Get the embedding model ID for the active provider.
+
+    Returns:
+        The OpenAI embedding model or the Bedrock embedding model ID
+    """
+    settings = get_settings()
+    if is_bedrock_provider():
+        return settings.bedrock_embedding_model_id
+    return settings.openai_embedding_model
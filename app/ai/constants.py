@@ -51,6 +51,9 @@ class VoiceCallSettings:
     MAX_RESPONSE_DURATION_SECONDS = 120
     PAUSE_BETWEEN_QUESTIONS_SECONDS = 1
     DEFAULT_VOICE = "Polly.Joanna"
+    CALL_TIMEOUT_SECONDS = 900  # Give up waiting for a call to finish
+    STATUS_POLL_INTERVAL_SECONDS = 30  # Fallback when no status callback arrives
+    STATUS_CALLBACK_PATH = "/interviews/webhooks/twilio/status"
 
 
 class PDFParsingSettings:
@@ -58,3 +61,27 @@ class PDFParsingSettings:
 
     MAX_LINE_LENGTH = 500
     MAX_TOTAL_LENGTH = 50000
+
+
+class LLMCacheSettings:
+    """LLM response cache configuration."""
+
+    KEY_PREFIX = "llm:score:"
+    SCORE_TTL_SECONDS = 86400  # 1 day
+
+
+class RateLimitSettings:
+    """OpenAI request batcher tuning."""
+
+    WINDOW_SECONDS = 60.0  # RPM/TPM are per-minute limits
+    APPROX_CHARS_PER_TOKEN = 4  # Rough estimate for English prompts
+    DEFAULT_COMPLETION_TOKENS = 512  # Reserved when max_tokens is not given
+    MAX_RETRIES = 3
+    BACKOFF_BASE_SECONDS = 1.0
+
+
+class KeywordScoringSettings:
+    """Thresholds for scoring answers on keywords alone, without the LLM."""
+
+    FULL_MATCH_RATIO = 0.9  # Share of expected keywords that earns max score
+    MIN_TRANSCRIPT_WORDS = 5  # Shorter answers with no keywords score 0
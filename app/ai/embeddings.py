@@ -194,6 +194,20 @@ async def generate_jd_embedding(jd: GeneratedJD) -> List[float]:
     return await generate_embedding(combined_text)
 
 
+def normalize_embedding(embedding: List[float]) -> List[float]:
+    """
+    Scale an embedding to unit L2 length.
+
+    Stored unit vectors let cosine similarity reduce to a dot product.
+    Zero vectors are returned unchanged.
+    """
+    vec = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vec))
+    if norm == 0.0:
+        return list(embedding)
+    return (vec / norm).tolist()
+
+
 async def rank_candidates_by_similarity(
     jd: GeneratedJD, applicants: List[Applicant]
 ) -> List[Applicant]:
@@ -0,0 +1,87 @@
+"""
+LLM Response Cache
+
+Caches deterministic LLM scoring results so identical answers to the same
+question are only sent to the model once. Keys hash the question, the
+normalized transcript and the model name.
+
+Redis is treated as optional: on connection errors every read is a miss
+and every write is skipped, so callers fall back to the LLM.
+"""
+
+import hashlib
+import re
+from typing import Any, Protocol
+from uuid import UUID
+
+import orjson
+from redis.exceptions import RedisError
+
+from app.ai.constants import LLMCacheSettings
+from app.core.locking import get_redis
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING_PUNCTUATION = ".,!?;:"
+
+
+class CacheBackend(Protocol):
+    """Protocol for LLM response cache implementations."""
+
+    async def get_many(self, keys: list[str]) -> list[dict[str, Any] | None]: ...
+    async def set_many(self, items: dict[str, dict[str, Any]], ttl: int) -> None: ...
+
+
+class RedisCacheBackend:
+    """LLM response cache on the shared Redis used for distributed locks."""
+
+    async def get_many(self, keys: list[str]) -> list[dict[str, Any] | None]:
+        """
+        Look up several entries in one round trip.
+
+        Returns:
+            One decoded entry per key, None for misses (all None on Redis failure)
+        """
+        if not keys:
+            return []
+        try:
+            redis = await get_redis()
+            cached = await redis.mget(keys)
+            return [orjson.loads(value) if value else None for value in cached]
+        except (RedisError, OSError) as e:
+            logger.warning(f"LLM cache read failed: {e}")
+            return [None] * len(keys)
+
+    async def set_many(self, items: dict[str, dict[str, Any]], ttl: int) -> None:
+        """Store several entries, each expiring after ttl seconds."""
+        if not items:
+            return
+        try:
+            redis = await get_redis()
+            async with redis.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(key, orjson.dumps(value), ex=ttl)
+                await pipe.execute()
+        except (RedisError, OSError) as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+
+def normalize_transcript(transcript: str) -> str:
+    """Lowercase, collapse whitespace and drop trailing punctuation."""
+    collapsed = _WHITESPACE.sub(" ", transcript.lower()).strip()
+    return collapsed.rstrip(_TRAILING_PUNCTUATION).rstrip()
+
+
+def score_cache_key(question_id: UUID, transcript: str, model: str) -> str:
+    """Cache key for a scored (question, transcript) pair."""
+    payload = orjson.dumps(
+        {
+            "qid": str(question_id),
+            "t": normalize_transcript(transcript),
+            "model": model,
+        },
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return LLMCacheSettings.KEY_PREFIX + hashlib.sha256(payload).hexdigest()
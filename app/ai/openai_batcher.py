@@ -0,0 +1,142 @@
+"""
+OpenAI Request Batcher
+
+Runs OpenAI requests concurrently while keeping them under the account's
+requests-per-minute and tokens-per-minute limits, so a fan-out of scoring
+calls is smoothed out instead of bursting into 429s.
+
+Token counts are estimated from prompt length and the completion budget,
+then corrected from the response's reported usage.
+"""
+
+import asyncio
+from collections import deque
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from openai import RateLimitError
+
+from app.ai.constants import RateLimitSettings
+from app.core.config import get_settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+def estimate_tokens(request: dict[str, Any]) -> int:
+    """Estimate prompt plus completion tokens for a chat completion request."""
+    prompt_chars = sum(
+        len(message.get("content") or "") for message in request.get("messages", [])
+    )
+    completion = (
+        request.get("max_tokens") or RateLimitSettings.DEFAULT_COMPLETION_TOKENS
+    )
+    return prompt_chars // RateLimitSettings.APPROX_CHARS_PER_TOKEN + completion
+
+
+def _retry_after_seconds(error: RateLimitError) -> Optional[float]:
+    """Delay requested by a 429 response's headers, if any."""
+    headers = getattr(error.response, "headers", None) or {}
+    for header, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        try:
+            return float(headers[header]) * scale
+        except (KeyError, TypeError, ValueError):
+            continue
+    return None
+
+
+class Batcher:
+    """
+    Concurrency- and rate-limited runner for OpenAI requests.
+
+    Usage:
+        batcher = Batcher(rpm=500, tpm=30000, workers=16)
+        response = await batcher.add(client.chat.completions.create, **request)
+    """
+
+    def __init__(self, rpm: int, tpm: int, workers: int) -> None:
+        self.rpm = rpm
+        self.tpm = tpm
+        self._workers = asyncio.Semaphore(workers)
+        self._lock = asyncio.Lock()
+        # [started_at, tokens] per request in the last window
+        self._window: deque[list[float]] = deque()
+        self._window_tokens = 0
+
+    async def add(self, func: Callable[..., Awaitable[T]], /, **request: Any) -> T:
+        """
+        Run one request once the rate limits allow it.
+
+        429 responses are retried after the server's Retry-After delay, or
+        with exponential backoff when no delay is given.
+
+        Raises:
+            RateLimitError: If the request is still rate limited after retries
+        """
+        async with self._workers:
+            for attempt in range(RateLimitSettings.MAX_RETRIES + 1):
+                entry = await self._reserve(estimate_tokens(request))
+                try:
+                    response = await func(**request)
+                except RateLimitError as e:
+                    if attempt == RateLimitSettings.MAX_RETRIES:
+                        raise
+                    delay = _retry_after_seconds(e)
+                    if delay is None:
+                        delay = RateLimitSettings.BACKOFF_BASE_SECONDS * 2**attempt
+                    logger.warning(f"OpenAI rate limited, retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+                    continue
+                self._record_usage(entry, response)
+                return response
+
+    async def _reserve(self, tokens: int) -> list[float]:
+        """Wait until a request of this size fits in the window, then claim it."""
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            while True:
+                now = loop.time()
+                while (
+                    self._window
+                    and now - self._window[0][0] >= RateLimitSettings.WINDOW_SECONDS
+                ):
+                    self._window_tokens -= self._window.popleft()[1]
+                # An empty window always admits, so oversized requests still run
+                if not self._window or (
+                    len(self._window) < self.rpm
+                    and self._window_tokens + tokens <= self.tpm
+                ):
+                    break
+                await asyncio.sleep(
+                    self._window[0][0] + RateLimitSettings.WINDOW_SECONDS - now
+                )
+            entry = [now, tokens]
+            self._window.append(entry)
+            self._window_tokens += tokens
+            return entry
+
+    def _record_usage(self, entry: list[float], response: Any) -> None:
+        """Replace a request's estimate with the token count OpenAI reported."""
+        total = getattr(getattr(response, "usage", None), "total_tokens", None)
+        in_window = any(item is entry for item in self._window)
+        if isinstance(total, int) and in_window:
+            self._window_tokens += total - entry[1]
+            entry[1] = total
+
+
+@lru_cache(maxsize=1)
+def get_openai_batcher() -> Batcher:
+    """
+    Get the process-wide OpenAI batcher.
+
+    The rate limits are per account, so every caller in the process must
+    share one window rather than each getting its own.
+    """
+    settings = get_settings()
+    return Batcher(
+        rpm=settings.openai_rpm_limit,
+        tpm=settings.openai_tpm_limit,
+        workers=settings.openai_max_concurrency,
+    )
@@ -5,36 +5,64 @@ Extracts text content from PDF resumes for embedding and analysis.
 """
 
 import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 import pdfplumber
 
+from app.core.config import get_settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+_pdf_pool: ProcessPoolExecutor | None = None
 
-async def extract_text_from_pdf(pdf_path: str) -> Optional[str]:
-    """
-    Extract text content from a PDF file.
 
-    Args:
-        pdf_path: Path to the PDF file
+def start_pdf_pool() -> ProcessPoolExecutor:
+    """
+    Create the process pool used for PDF parsing, if not already running.
 
-    Returns:
-        Extracted text content or None if extraction fails
+    Call at startup. Workers come from a forkserver rather than a fork of
+    the running server, so they never inherit its threads' held locks or
+    its open database and Redis sockets.
     """
+    global _pdf_pool
+    if _pdf_pool is None:
+        workers = get_settings().pdf_parser_workers or os.cpu_count()
+        _pdf_pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+    return _pdf_pool
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Get the PDF pool, starting it for entry points without a lifespan."""
+    return _pdf_pool or start_pdf_pool()
+
+
+def shutdown_pdf_pool() -> None:
+    """Stop the PDF parsing worker processes."""
+    global _pdf_pool
+    if _pdf_pool is not None:
+        _pdf_pool.shutdown(wait=False, cancel_futures=True)
+        _pdf_pool = None
+
+
+async def _run_in_pool(func: Callable[[str], str], pdf_path: str) -> Optional[str]:
+    """Run a sync extractor in the process pool, returning None on failure."""
     try:
         path = Path(pdf_path)
         if not path.exists():
             return None
 
-        # Run PDF extraction in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        text = await loop.run_in_executor(None, _extract_sync, str(path))
-
-        return text
+        # pdfplumber parsing is CPU-bound, so it runs in worker processes
+        # where concurrent applications are not serialized by the GIL
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_pdf_pool(), func, str(path))
 
     except Exception as e:
         logger.error(
@@ -44,6 +72,32 @@ async def extract_text_from_pdf(pdf_path: str) -> Optional[str]:
         return None
 
 
+async def extract_text_from_pdf(pdf_path: str) -> Optional[str]:
+    """
+    Extract text content from a PDF file.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        Extracted text content or None if extraction fails
+    """
+    return await _run_in_pool(_extract_sync, pdf_path)
+
+
+async def extract_resume_text(pdf_path: str) -> Optional[str]:
+    """
+    Extract and clean resume text in a single worker round trip.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        Cleaned text content or None if extraction fails
+    """
+    return await _run_in_pool(_extract_and_clean, pdf_path)
+
+
 def _extract_sync(pdf_path: str) -> str:
     """Synchronous PDF text extraction."""
     text_parts = []
@@ -57,6 +111,11 @@ def _extract_sync(pdf_path: str) -> str:
     return "\n".join(text_parts)
 
 
+def _extract_and_clean(pdf_path: str) -> str:
+    """Synchronous extraction + cleanup, run inside a pool worker."""
+    return clean_resume_text(_extract_sync(pdf_path))
+
+
 async def extract_text_from_multiple_pdfs(
     pdf_paths: list[str],
 ) -> dict[str, Optional[str]]:
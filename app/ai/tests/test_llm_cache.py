@@ -0,0 +1,33 @@
+"""
+LLM Cache Tests
+
+Unit tests for score cache keys.
+"""
+
+from uuid import uuid4
+
+from app.ai.llm_cache import normalize_transcript, score_cache_key
+
+
+class TestScoreCacheKey:
+    """Tests for score cache key construction."""
+
+    def test_normalize_transcript(self):
+        """Case, spacing and trailing punctuation should not matter."""
+        assert normalize_transcript("  Three   YEARS!\n") == "three years"
+
+    def test_equivalent_transcripts_share_a_key(self):
+        """Normalized-equal answers to one question should hit the same entry."""
+        question_id = uuid4()
+
+        assert score_cache_key(question_id, "Yes.", "gpt-4o") == score_cache_key(
+            question_id, "yes", "gpt-4o"
+        )
+
+    def test_question_and_model_are_part_of_the_key(self):
+        """The same answer to another question or model should not collide."""
+        question_id = uuid4()
+        key = score_cache_key(question_id, "yes", "gpt-4o")
+
+        assert key != score_cache_key(uuid4(), "yes", "gpt-4o")
+        assert key != score_cache_key(question_id, "yes", "gpt-4o-mini")
@@ -0,0 +1,73 @@
+"""
+OpenAI Batcher Tests
+
+Unit tests for rate-limited OpenAI request running.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from openai import RateLimitError
+
+from app.ai import openai_batcher
+from app.ai.openai_batcher import Batcher, estimate_tokens
+
+
+def _rate_limit_error(headers: dict) -> RateLimitError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(429, headers=headers, request=request)
+    return RateLimitError("rate limited", response=response, body=None)
+
+
+class TestEstimateTokens:
+    """Tests for request token estimates."""
+
+    def test_counts_prompt_and_completion_budget(self):
+        """Estimate should be prompt chars / 4 plus max_tokens."""
+        request = {"messages": [{"content": "x" * 400}], "max_tokens": 50}
+
+        assert estimate_tokens(request) == 150
+
+
+class TestBatcher:
+    """Tests for Batcher.add."""
+
+    @pytest.mark.asyncio
+    async def test_requests_over_rpm_wait_for_the_window(self):
+        """A request beyond the RPM cap should wait until the window moves on."""
+        batcher = Batcher(rpm=1, tpm=10**6, workers=4)
+        func = AsyncMock(return_value="ok")
+        loop = asyncio.get_running_loop()
+
+        with patch.object(openai_batcher.RateLimitSettings, "WINDOW_SECONDS", 0.05):
+            started = loop.time()
+            await asyncio.gather(batcher.add(func), batcher.add(func))
+
+        assert func.await_count == 2
+        assert loop.time() - started >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_429_is_retried_after_retry_after(self):
+        """A rate-limited request should be retried after the server's delay."""
+        batcher = Batcher(rpm=100, tpm=10**6, workers=1)
+        func = AsyncMock(side_effect=[_rate_limit_error({"retry-after-ms": "5"}), "ok"])
+
+        with patch("app.ai.openai_batcher.asyncio.sleep", AsyncMock()) as sleep:
+            assert await batcher.add(func, model="gpt-4o") == "ok"
+
+        sleep.assert_awaited_once_with(0.005)
+        assert func.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self):
+        """Persistent 429s should eventually be raised to the caller."""
+        batcher = Batcher(rpm=100, tpm=10**6, workers=1)
+        func = AsyncMock(side_effect=_rate_limit_error({}))
+
+        with patch("app.ai.openai_batcher.asyncio.sleep", AsyncMock()):
+            with pytest.raises(RateLimitError):
+                await batcher.add(func)
+
+        assert func.await_count == openai_batcher.RateLimitSettings.MAX_RETRIES + 1
@@ -0,0 +1,65 @@
+"""
+Voice Agent Tests
+
+Unit tests for Twilio call completion handling.
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.ai import voice_agent
+from app.ai.voice_agent import TwilioVoiceProvider, resolve_call_status
+
+
+@pytest.fixture
+def provider():
+    provider = TwilioVoiceProvider.__new__(TwilioVoiceProvider)
+    provider.client = MagicMock()
+    provider.client.recordings.list.return_value = []
+    provider.webhook_base_url = ""
+    return provider
+
+
+class TestCallCompletion:
+    """Tests for waiting on a Twilio call to end."""
+
+    @pytest.mark.asyncio
+    async def test_status_callback_wakes_waiter(self, provider):
+        """A completed status callback should end the wait without polling."""
+        waiter = asyncio.create_task(provider.get_call_results("CA1"))
+        await asyncio.sleep(0)
+
+        assert resolve_call_status("CA1", "completed")
+        assert await asyncio.wait_for(waiter, timeout=1) == []
+        provider.client.calls.assert_not_called()
+        assert "CA1" not in voice_agent._pending_calls
+
+    @pytest.mark.asyncio
+    async def test_unfetched_call_is_not_left_registered(self, provider):
+        """A call whose results are never fetched must not stay pending."""
+        provider.from_number = "+15550000000"
+        provider.client.calls.create.return_value.sid = "CA3"
+
+        call_sid = await provider.initiate_call("+15551111111", [], "Ann", "Engineer")
+
+        assert call_sid == "CA3"
+        assert "CA3" not in voice_agent._pending_calls
+
+    def test_non_terminal_or_unknown_calls_are_ignored(self):
+        """Only a final status for a call we are waiting on should resolve."""
+        assert not resolve_call_status("CA-unknown", "completed")
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_polling_call_status(self, provider):
+        """Without a callback, call status should be fetched periodically."""
+        provider.client.calls.return_value.fetch.return_value.status = "no-answer"
+
+        with patch.object(
+            voice_agent.VoiceCallSettings, "STATUS_POLL_INTERVAL_SECONDS", 0.01
+        ):
+            await asyncio.wait_for(provider.get_call_results("CA2"), timeout=1)
+
+        provider.client.calls.assert_called_with("CA2")
+        assert "CA2" not in voice_agent._pending_calls
@@ -0,0 +1,56 @@
+"""
+Voice Scoring Tests
+
+Unit tests for the keyword pre-pass that runs before LLM scoring.
+"""
+
+from app.ai.voice_scoring import keyword_prescore
+from app.interviews.schemas import PrescreeningQuestion
+
+
+def _question(*keywords: str) -> PrescreeningQuestion:
+    return PrescreeningQuestion(
+        question_text="Which tools do you use?",
+        expected_keywords=list(keywords),
+        max_score=80,
+    )
+
+
+class TestKeywordPrescore:
+    """Tests for keyword_prescore."""
+
+    def test_all_keywords_earn_max_score(self):
+        """Mentioning every keyword should skip the LLM with full marks."""
+        question = _question("Python", "C++", "machine learning")
+
+        score = keyword_prescore("I use python, c++ and Machine Learning.", question)
+
+        assert score == (80, "All keywords matched")
+
+    def test_short_answer_without_keywords_scores_zero(self):
+        """A short reply with no expected keyword should score 0."""
+        assert keyword_prescore("Not really", _question("Python")) == (
+            0,
+            "No relevant content",
+        )
+
+    def test_ambiguous_answers_go_to_the_llm(self):
+        """Partial matches and long keyword-less answers need the LLM."""
+        question = _question("Python", "Django", "Postgres")
+
+        assert keyword_prescore("Mostly Python these days", question) is None
+        assert (
+            keyword_prescore("I build web backends with a few frameworks", question)
+            is None
+        )
+
+    def test_keywords_match_whole_words_only(self):
+        """A keyword inside a longer word should not count."""
+        assert keyword_prescore("Javascript", _question("Java")) == (
+            0,
+            "No relevant content",
+        )
+
+    def test_questions_without_keywords_are_not_prescored(self):
+        """Without expected keywords there is nothing to match against."""
+        assert keyword_prescore("Yes", _question()) is None
@@ -26,6 +26,29 @@ from app.ai.constants import VoiceCallSettings
 
 logger = get_logger(__name__)
 
+# Final CallStatus values Twilio reports for a call
+TERMINAL_CALL_STATUSES = frozenset(
+    {"completed", "busy", "failed", "no-answer", "canceled"}
+)
+
+# Call SID -> future completed by the status-callback webhook. Module-level
+# so every provider instance in this worker shares it with the router.
+_pending_calls: dict[str, asyncio.Future] = {}
+
+
+def resolve_call_status(call_sid: str, call_status: str) -> bool:
+    """
+    Complete a pending call from Twilio's status callback.
+
+    Returns:
+        True if a waiter in this worker was woken
+    """
+    future = _pending_calls.get(call_sid)
+    if future is None or future.done() or call_status not in TERMINAL_CALL_STATUSES:
+        return False
+    future.set_result(call_status)
+    return True
+
 
 # ============================================================================
 # Voice Provider Abstraction
@@ -81,11 +104,10 @@ class TwilioVoiceProvider(VoiceProvider):
     """Twilio-based voice provider."""
 
     def __init__(self):
-        settings = get_settings()
-        self.client = TwilioClient(
-            settings.twilio_account_sid, settings.twilio_auth_token
-        )
-        self.from_number = settings.twilio_phone_number
+        twilio = get_settings().twilio
+        self.client = TwilioClient(twilio.account_sid, twilio.auth_token)
+        self.from_number = twilio.phone_number
+        self.webhook_base_url = twilio.webhook_base_url.rstrip("/")
 
     async def initiate_call(
         self,
@@ -102,6 +124,13 @@ class TwilioVoiceProvider(VoiceProvider):
         # Build TwiML for the call
         twiml = self._build_twiml(questions, candidate_name, job_title)
 
+        # Completion is pushed to us instead of polled when a public URL is set
+        callback_options = {}
+        if self.webhook_base_url:
+            callback_options["status_callback"] = (
+                self.webhook_base_url + VoiceCallSettings.STATUS_CALLBACK_PATH
+            )
+
         # Create the call
         loop = asyncio.get_event_loop()
         call = await loop.run_in_executor(
@@ -112,9 +141,9 @@ class TwilioVoiceProvider(VoiceProvider):
                 twiml=twiml,
                 record=True,
                 recording_status_callback="/webhooks/twilio/recording",
+                **callback_options,
             ),
         )
-
         return call.sid
 
     def _build_twiml(
@@ -151,8 +180,44 @@ class TwilioVoiceProvider(VoiceProvider):
 
         return "\n".join(twiml_parts)
 
+    async def _wait_for_completion(self, call_id: str) -> None:
+        """
+        Wait until the call has ended.
+
+        The status callback normally resolves the wait. Call status is only
+        fetched every STATUS_POLL_INTERVAL_SECONDS as a fallback, e.g. when
+        the callback is not configured, reached another worker or arrived
+        before this wait began. The call is only registered for callbacks
+        here, so the entry can't outlive its waiter.
+        """
+        loop = asyncio.get_running_loop()
+        future = _pending_calls[call_id] = loop.create_future()
+        deadline = loop.time() + VoiceCallSettings.CALL_TIMEOUT_SECONDS
+        try:
+            while not future.done():
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    logger.warning(f"Timed out waiting for call {call_id} to end")
+                    return
+                try:
+                    await asyncio.wait_for(
+                        asyncio.shield(future),
+                        timeout=min(
+                            remaining, VoiceCallSettings.STATUS_POLL_INTERVAL_SECONDS
+                        ),
+                    )
+                except asyncio.TimeoutError:
+                    call = await loop.run_in_executor(
+                        None, lambda: self.client.calls(call_id).fetch()
+                    )
+                    if call.status in TERMINAL_CALL_STATUSES:
+                        return
+        finally:
+            _pending_calls.pop(call_id, None)
+
     async def get_call_results(self, call_id: str) -> list[dict]:
-        """Get recordings and transcriptions for a call."""
+        """Get recordings and transcriptions for a call once it has ended."""
+        await self._wait_for_completion(call_id)
         loop = asyncio.get_event_loop()
 
         # Fetch recordings
@@ -5,16 +5,70 @@ AI-powered scoring of candidate voice responses.
 """
 
 import json
+import re
+from functools import lru_cache
+from typing import Optional
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.ai.client import get_openai_client
+from app.ai.constants import KeywordScoringSettings
 from app.ai.prompts import VOICE_RESPONSE_SCORING_PROMPT
 from app.interviews.schemas import PrescreeningQuestion
 
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _keyword_pattern(keywords: tuple[str, ...]) -> re.Pattern:
+    """
+    One compiled alternation per keyword set, matched in a single pass.
+    
+    Longest keywords come first so "machine learning" wins over "machine";
+    lookarounds instead of \\b keep keywords like "C++" matchable.
+    """
+    alternation = "|".join(
+        re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True)
+    )
+    return re.compile(rf"(?<!\w)(?:{alternation})(?!\w)", re.IGNORECASE)
+
+
+def keyword_prescore(
+    transcript: str,
+    question: PrescreeningQuestion,
+) -> Optional[tuple[int, str]]:
+    """
+    Score clear-cut answers from expected keywords alone.
+    
+    Args:
+        transcript: Transcribed response from the candidate
+        question: The prescreening question that was asked
+        
+    Returns:
+        (score, rationale) when nearly every keyword is present or a short
+        answer has none, None when it needs the LLM
+    """
+    keywords = tuple(
+        keyword.strip().lower()
+        for keyword in question.expected_keywords
+        if keyword.strip()
+    )
+    if not keywords:
+        return None
+    
+    hits = {
+        match.group(0).lower()
+        for match in _keyword_pattern(keywords).finditer(transcript)
+    }
+    if len(hits) / len(set(keywords)) >= KeywordScoringSettings.FULL_MATCH_RATIO:
+        return question.max_score, "All keywords matched"
+    # Longer answers without keywords may use synonyms; leave those to the LLM
+    word_count = len(transcript.split())
+    if not hits and word_count < KeywordScoringSettings.MIN_TRANSCRIPT_WORDS:
+        return 0, "No relevant content"
+    return None
+
+
 async def score_voice_response(
     transcript: str,
     question: PrescreeningQuestion,
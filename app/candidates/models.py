@@ -38,6 +38,8 @@ class ApplicantRecord(Base):
     resume_text = Column(Text)
     similarity_score = Column(Float, index=True)
     shortlisted = Column(Boolean, default=False)
+    # "pending" until resume parsing/scoring finishes after the response
+    processing_state = Column(String(20), nullable=False, default="pending")
     applied_at = Column(DateTime(timezone=True), nullable=False, index=True)
 
     # Relationships
@@ -5,10 +5,10 @@ Data access layer for Candidate-related database operations.
 Follows the Repository pattern for clean separation of concerns.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 from uuid import UUID
 
-from sqlalchemy import update
+from sqlalchemy import Row, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
@@ -47,6 +47,34 @@ class CandidateRepository:
         )
         return list(result.scalars().all())
 
+    async def get_applicants_by_job_list_view(self, job_id: UUID) -> Sequence[Row]:
+        """
+        Get the columns needed for a job's applicant list.
+
+        Skips resume_text, which can be several KB per row and is not
+        shown in list views.
+
+        Args:
+            job_id: The UUID of the job
+
+        Returns:
+            Rows with id, name, email, phone, resume_path,
+            similarity_score, shortlisted and applied_at
+        """
+        result = await self.session.execute(
+            select(
+                ApplicantRecord.id,
+                ApplicantRecord.name,
+                ApplicantRecord.email,
+                ApplicantRecord.phone,
+                ApplicantRecord.resume_path,
+                ApplicantRecord.similarity_score,
+                ApplicantRecord.shortlisted,
+                ApplicantRecord.applied_at,
+            ).where(ApplicantRecord.job_id == job_id)
+        )
+        return result.all()
+
     async def get_applicant_by_id(
         self, job_id: UUID, candidate_id: UUID
     ) -> Optional[ApplicantRecord]:
@@ -87,6 +115,32 @@ class CandidateRepository:
         )
         return list(result.scalars().all())
 
+    async def get_prescreening_responses_with_summary(
+        self, candidate_id: UUID
+    ) -> Tuple[List[PrescreeningResponseRecord], int]:
+        """
+        Get a candidate's prescreening responses with their total score.
+
+        The total is computed by the database as a window aggregate over
+        the same result set, so rows and score come back in one round trip.
+
+        Args:
+            candidate_id: The UUID of the candidate
+
+        Returns:
+            Tuple of (responses, total ai_score across responses)
+        """
+        result = await self.session.execute(
+            select(
+                PrescreeningResponseRecord,
+                func.coalesce(func.sum(PrescreeningResponseRecord.ai_score).over(), 0),
+            ).where(PrescreeningResponseRecord.candidate_id == candidate_id)
+        )
+        rows = result.all()
+        if not rows:
+            return [], 0
+        return [row[0] for row in rows], int(rows[0][1])
+
     async def update_shortlist_status(
         self, job_id: UUID, candidate_id: UUID, shortlisted: bool
     ) -> None:
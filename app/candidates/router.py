@@ -3,7 +3,10 @@ Candidates App Router (API Routes)
 """
 
 from typing import Optional
+from uuid import UUID
+
 from fastapi import APIRouter, Depends, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -13,7 +16,10 @@ from app.candidates.services import CandidateService
 from app.candidates.repository import CandidateRepository
 from app.candidates.schemas import CandidateResponsesResponse, ScheduleInterviewRequest
 
-router = APIRouter()
+# Candidate rosters can be large, so list endpoints hand plain dicts straight
+# to orjson instead of going through response-model validation and
+# FastAPI's jsonable_encoder.
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 def get_candidate_repository(
@@ -50,7 +56,7 @@ async def get_all_candidates(
     Returns candidates with their associated job title for easy identification.
     Sorted by application date (newest first) by default.
     """
-    return await service.get_all_candidates()
+    return ORJSONResponse(await service.get_all_candidates())
 
 
 @router.get(
@@ -59,22 +65,22 @@ async def get_all_candidates(
     tags=["Candidates"],
 )
 async def get_applicants(
-    job_id: str,
+    job_id: UUID,
     service: CandidateService = Depends(get_candidate_service),
 ):
     """Get all applicants for a job."""
-    return await service.get_applicants(job_id)
+    return ORJSONResponse(await service.get_applicants(job_id))
 
 
 @router.get(
     "/jobs/{job_id}/candidates/{candidate_id}/responses",
-    response_model=CandidateResponsesResponse,
+    responses={200: {"model": CandidateResponsesResponse}},
     summary="Get prescreening responses",
     tags=["Candidates"],
 )
 async def get_candidate_responses(
-    job_id: str,
-    candidate_id: str,
+    job_id: UUID,
+    candidate_id: UUID,
     service: CandidateService = Depends(get_candidate_service),
 ):
     """
@@ -82,7 +88,7 @@ async def get_candidate_responses(
 
     Returns transcripts, AI scores, and audio URLs.
     """
-    return await service.get_candidate_responses(job_id, candidate_id)
+    return ORJSONResponse(await service.get_candidate_responses(job_id, candidate_id))
 
 
 @router.post(
@@ -91,8 +97,8 @@ async def get_candidate_responses(
     tags=["Candidates"],
 )
 async def schedule_interview(
-    job_id: str,
-    candidate_id: str,
+    job_id: UUID,
+    candidate_id: UUID,
     request: ScheduleInterviewRequest,
     background_tasks: BackgroundTasks,
     service: CandidateService = Depends(get_candidate_service),
@@ -114,8 +120,8 @@ async def schedule_interview(
     tags=["Candidates"],
 )
 async def reject_candidate(
-    job_id: str,
-    candidate_id: str,
+    job_id: UUID,
+    candidate_id: UUID,
     reason: Optional[str] = None,
     service: CandidateService = Depends(get_candidate_service),
 ):
@@ -0,0 +1,28 @@
+"""
+Candidates App Fast Schemas
+
+Lightweight slotted dataclasses for read-only list endpoints. Rows come
+straight from our own database, so they skip Pydantic validation and are
+serialized natively by orjson. Keep Pydantic models (schemas.py) on the
+input-validation boundary.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass(slots=True)
+class ApplicantFast:
+    """Applicant row as returned by list endpoints."""
+
+    id: UUID
+    name: str
+    email: str
+    phone: str | None = None
+    resume_path: str | None = None
+    resume_text: str | None = None
+    embedding: list[float] | None = None
+    similarity_score: float | None = None
+    shortlisted: bool = False
+    applied_at: datetime | None = None
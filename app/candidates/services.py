@@ -18,12 +18,8 @@ from app.core.logging import get_logger
 
 from app.candidates.models import ApplicantRecord
 from app.candidates.repository import CandidateRepository
-from app.candidates.schemas import (
-    Applicant,
-    CandidateResponsesResponse,
-    CandidateResponse,
-    ScheduleInterviewRequest,
-)
+from app.candidates.schemas import ScheduleInterviewRequest
+from app.candidates.schemas_fast import ApplicantFast
 from app.jobs.schemas import GeneratedJD
 
 
@@ -35,6 +31,8 @@ class CandidateService:
     All dependencies are injected for testability.
     """
 
+    logger = get_logger(__name__)
+
     def __init__(
         self,
         session: AsyncSession,
@@ -52,7 +50,6 @@ class CandidateService:
         self.session = session
         self.settings = settings
         self.repository = repository
-        self.logger = get_logger(__name__)
 
     def _log_operation(self, operation: str, success: bool, details: dict = None):
         """Log an operation with its outcome."""
@@ -61,27 +58,26 @@ class CandidateService:
         status = "success" if success else "failed"
         self.logger.info(f"Operation {operation} {status}", extra=details)
 
-    async def get_applicants(self, job_id: str) -> dict:
+    async def get_applicants(self, job_id: UUID) -> dict:
         """Get all applicants for a job."""
-        applicants_db = await self.repository.get_applicants_by_job(UUID(job_id))
+        applicants_db = await self.repository.get_applicants_by_job_list_view(job_id)
 
         applicants = []
         shortlisted = []
 
         for rec in applicants_db:
-            app_schema = Applicant(
-                id=rec.id,
-                name=rec.name,
-                email=rec.email,
-                phone=rec.phone,
-                resume_path=rec.resume_path,
-                resume_text=rec.resume_text,
-                embedding=None,  # Loaded from Pinecone if needed
-                similarity_score=rec.similarity_score,
-                shortlisted=rec.shortlisted,
-                applied_at=rec.applied_at,
+            applicants.append(
+                ApplicantFast(
+                    id=rec.id,
+                    name=rec.name,
+                    email=rec.email,
+                    phone=rec.phone,
+                    resume_path=rec.resume_path,
+                    similarity_score=rec.similarity_score,
+                    shortlisted=rec.shortlisted,
+                    applied_at=rec.applied_at,
+                )
             )
-            applicants.append(app_schema)
             if rec.shortlisted:
                 shortlisted.append(rec.id)
 
@@ -141,68 +137,67 @@ class CandidateService:
             "candidates": candidates,
         }
 
-    async def get_candidate_responses(
-        self, job_id: str, candidate_id: str
-    ) -> CandidateResponsesResponse:
-        """Get prescreening responses for a candidate."""
+    async def get_candidate_responses(self, job_id: UUID, candidate_id: UUID) -> dict:
+        """
+        Get prescreening responses for a candidate.
+
+        Returns a plain dict shaped like CandidateResponsesResponse; rows come
+        from our own database, so they are serialized without re-validation.
+        """
         # Get Candidate
-        candidate = await self.repository.get_applicant_by_id(
-            UUID(job_id), UUID(candidate_id)
-        )
+        candidate = await self.repository.get_applicant_by_id(job_id, candidate_id)
         if not candidate:
-            raise RecordNotFoundError("Candidate", candidate_id)
+            raise RecordNotFoundError("Candidate", str(candidate_id))
 
         # Get Responses
-        responses_db = await self.repository.get_prescreening_responses(
-            UUID(candidate_id)
+        responses_db, total_score = (
+            await self.repository.get_prescreening_responses_with_summary(candidate_id)
         )
 
         responses = [
-            CandidateResponse(
-                id=r.id,
-                candidate_id=r.candidate_id,
-                question_id=r.question_id,
-                question_text=r.question_text,
-                transcript=r.transcript,
-                audio_url=r.audio_url,
-                ai_score=r.ai_score,
-                scoring_rationale=r.scoring_rationale,
-                call_duration_seconds=r.call_duration_seconds,
-                recorded_at=r.recorded_at,
-            )
+            {
+                "id": r.id,
+                "candidate_id": r.candidate_id,
+                "question_id": r.question_id,
+                "question_text": r.question_text,
+                "transcript": r.transcript,
+                "audio_url": r.audio_url,
+                "ai_score": r.ai_score,
+                "scoring_rationale": r.scoring_rationale,
+                "call_duration_seconds": r.call_duration_seconds,
+                "recorded_at": r.recorded_at,
+            }
             for r in responses_db
         ]
 
-        # Calculate scores
-        total_score = sum(r.ai_score for r in responses)
-        max_score = len(responses) * 100
-        percentage = (total_score / max_score * 100) if max_score > 0 else 0
+        # Total score is aggregated by the database alongside the rows
+        n = len(responses_db)
+        max_score = n * 100
+        percentage = (total_score * 100.0 / max_score) if n else 0.0
 
         self.logger.info(f"Retrieved responses for candidate {candidate_id}")
 
-        return CandidateResponsesResponse(
-            candidate_id=candidate.id,
-            candidate_name=candidate.name,
-            candidate_email=candidate.email,
-            total_score=total_score,
-            max_possible_score=max_score,
-            percentage_score=percentage,
-            responses=responses,
-        )
+        return {
+            "candidate_id": candidate.id,
+            "candidate_name": candidate.name,
+            "candidate_email": candidate.email,
+            "total_score": total_score,
+            "max_possible_score": max_score,
+            "percentage_score": percentage,
+            "responses": responses,
+        }
 
     async def schedule_interview(
         self,
-        job_id: str,
-        candidate_id: str,
+        job_id: UUID,
+        candidate_id: UUID,
         request: ScheduleInterviewRequest,
     ) -> dict:
         """Schedule an interview for a candidate."""
-        candidate = await self.repository.get_applicant_by_id(
-            UUID(job_id), UUID(candidate_id)
-        )
+        candidate = await self.repository.get_applicant_by_id(job_id, candidate_id)
 
         if not candidate:
-            raise RecordNotFoundError("Candidate", candidate_id)
+            raise RecordNotFoundError("Candidate", str(candidate_id))
 
         if not candidate.shortlisted:
             raise ValidationError(
@@ -212,7 +207,7 @@ class CandidateService:
         self._log_operation(
             "schedule_interview",
             success=True,
-            details={"candidate_id": candidate_id},
+            details={"candidate_id": str(candidate_id)},
         )
 
         return {
@@ -222,24 +217,22 @@ class CandidateService:
         }
 
     async def reject_candidate(
-        self, job_id: str, candidate_id: str, reason: Optional[str]
+        self, job_id: UUID, candidate_id: UUID, reason: Optional[str]
     ) -> dict:
         """Reject a candidate."""
-        candidate = await self.repository.get_applicant_by_id(
-            UUID(job_id), UUID(candidate_id)
-        )
+        candidate = await self.repository.get_applicant_by_id(job_id, candidate_id)
 
         if not candidate:
-            raise RecordNotFoundError("Candidate", candidate_id)
+            raise RecordNotFoundError("Candidate", str(candidate_id))
 
         await self.repository.update_shortlist_status(
-            UUID(job_id), UUID(candidate_id), shortlisted=False
+            job_id, candidate_id, shortlisted=False
         )
 
         self._log_operation(
             "reject_candidate",
             success=True,
-            details={"candidate_id": candidate_id, "reason": reason},
+            details={"candidate_id": str(candidate_id), "reason": reason},
         )
 
         return {"message": f"Candidate {candidate_id} rejected", "reason": reason}
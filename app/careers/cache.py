@@ -0,0 +1,229 @@
+"""
+Careers Response Cache
+
+Redis cache for rendered public careers payloads (job list JSON, XML feed).
+Entries are keyed on a version counter that job mutations bump, so
+invalidation is a single INCR and readers never see a half-cleared cache.
+
+Redis is treated as optional: on connection errors every read is a miss
+and every write is skipped, so the endpoints fall back to the database.
+"""
+
+import hashlib
+
+import orjson
+from redis.exceptions import RedisError
+
+from app.careers.constants import (
+    CAREERS_CACHE_TTL_SECONDS,
+    CAREERS_FEED_REBUILD_LOCK_SECONDS,
+    CAREERS_FEED_STALE_TTL_SECONDS,
+    JD_EMBEDDING_CACHE_TTL_SECONDS,
+    RESUME_EMBEDDING_CACHE_TTL_SECONDS,
+    CareersCacheKeys,
+)
+from app.ai.client import (
+    get_ai_provider,
+    get_embedding_dimension,
+    get_embedding_model,
+)
+from app.core.locking import get_redis
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+async def get_cache_version() -> int | None:
+    """
+    Read the cache version counter.
+
+    Callers read the version before rendering and store under that version,
+    so a payload rendered across an invalidation is never filed as current.
+
+    Returns:
+        Current version (0 if never bumped), or None if Redis is unavailable
+    """
+    try:
+        redis = await get_redis()
+        version = await redis.get(CareersCacheKeys.VERSION)
+        return int(version) if version else 0
+    except (RedisError, OSError) as e:
+        logger.warning(f"Careers cache version read failed: {e}")
+        return None
+
+
+async def get_cached_payload(name: str, version: int) -> str | None:
+    """
+    Get a rendered payload for a cache version.
+
+    Args:
+        name: Payload name (CareersCacheKeys.LIST / FEED)
+        version: Version from get_cache_version
+
+    Returns:
+        Cached payload, or None on miss or Redis failure
+    """
+    try:
+        redis = await get_redis()
+        return await redis.get(CareersCacheKeys.payload(name, version))
+    except (RedisError, OSError) as e:
+        logger.warning(f"Careers cache read failed for {name}: {e}")
+        return None
+
+
+async def get_stale_payload(name: str) -> str | None:
+    """Get the last rendered payload regardless of cache version."""
+    try:
+        redis = await get_redis()
+        return await redis.get(CareersCacheKeys.stale(name))
+    except (RedisError, OSError) as e:
+        logger.warning(f"Careers stale cache read failed for {name}: {e}")
+        return None
+
+
+async def store_payload(
+    name: str, version: int, content: str | bytes, keep_stale: bool = False
+) -> None:
+    """
+    Store a rendered payload under a cache version.
+
+    Args:
+        name: Payload name (CareersCacheKeys.LIST / FEED)
+        version: Version read before the payload was rendered
+        content: Serialized payload, stored as-is (UTF-8 bytes are not re-encoded)
+        keep_stale: Also keep a long-lived copy for stale-while-revalidate
+    """
+    try:
+        redis = await get_redis()
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.set(
+                CareersCacheKeys.payload(name, version),
+                content,
+                ex=CAREERS_CACHE_TTL_SECONDS,
+            )
+            if keep_stale:
+                pipe.set(
+                    CareersCacheKeys.stale(name),
+                    content,
+                    ex=CAREERS_FEED_STALE_TTL_SECONDS,
+                )
+            await pipe.execute()
+    except (RedisError, OSError) as e:
+        logger.warning(f"Careers cache write failed for {name}: {e}")
+
+
+async def claim_rebuild(name: str) -> bool:
+    """
+    Claim the right to rebuild a payload in the background.
+
+    Returns:
+        True if this caller should schedule the rebuild
+    """
+    try:
+        redis = await get_redis()
+        return bool(
+            await redis.set(
+                CareersCacheKeys.rebuild(name),
+                "1",
+                nx=True,
+                ex=CAREERS_FEED_REBUILD_LOCK_SECONDS,
+            )
+        )
+    except (RedisError, OSError) as e:
+        logger.warning(f"Careers cache rebuild claim failed for {name}: {e}")
+        return False
+
+
+async def release_rebuild(name: str) -> None:
+    """Release a rebuild claim taken with claim_rebuild."""
+    try:
+        redis = await get_redis()
+        await redis.delete(CareersCacheKeys.rebuild(name))
+    except (RedisError, OSError) as e:
+        logger.warning(f"Careers cache rebuild release failed for {name}: {e}")
+
+
+async def invalidate_careers_cache() -> None:
+    """
+    Invalidate all cached careers payloads.
+
+    Call after any mutation that changes what the public careers pages
+    show (JD approval, JD edits, job deletion).
+    """
+    try:
+        redis = await get_redis()
+        await redis.incr(CareersCacheKeys.VERSION)
+    except (RedisError, OSError) as e:
+        logger.warning(f"Careers cache invalidation failed: {e}")
+
+
+def jd_digest(generated_jd: dict) -> str:
+    """Stable digest of JD content, identical across workers and restarts."""
+    payload = orjson.dumps(generated_jd, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
+def _embedding_space() -> str:
+    """
+    Vector space of the active embedding provider.
+
+    Part of every embedding key, so switching provider, model or dimension
+    never serves a vector from another space.
+    """
+    return CareersCacheKeys.embedding_space(
+        get_ai_provider(), get_embedding_model(), get_embedding_dimension()
+    )
+
+
+async def get_cached_jd_embedding(job_id: str, digest: str) -> list[float] | None:
+    """Get a JD embedding shared by all workers, or None on miss."""
+    try:
+        redis = await get_redis()
+        cached = await redis.get(
+            CareersCacheKeys.jd_embedding(_embedding_space(), job_id, digest)
+        )
+        return orjson.loads(cached) if cached else None
+    except (RedisError, OSError) as e:
+        logger.warning(f"JD embedding cache read failed for {job_id}: {e}")
+        return None
+
+
+async def store_cached_jd_embedding(
+    job_id: str, digest: str, embedding: list[float]
+) -> None:
+    """Share a JD embedding with other workers."""
+    try:
+        redis = await get_redis()
+        await redis.set(
+            CareersCacheKeys.jd_embedding(_embedding_space(), job_id, digest),
+            orjson.dumps(embedding),
+            ex=JD_EMBEDDING_CACHE_TTL_SECONDS,
+        )
+    except (RedisError, OSError) as e:
+        logger.warning(f"JD embedding cache write failed for {job_id}: {e}")
+
+
+async def get_cached_resume_embedding(digest: str) -> list[float] | None:
+    """Get the embedding of a previously seen resume, or None on miss."""
+    try:
+        redis = await get_redis()
+        cached = await redis.get(
+            CareersCacheKeys.resume_embedding(_embedding_space(), digest)
+        )
+        return orjson.loads(cached) if cached else None
+    except (RedisError, OSError) as e:
+        logger.warning(f"Resume embedding cache read failed for {digest}: {e}")
+        return None
+
+
+async def store_cached_resume_embedding(digest: str, embedding: list[float]) -> None:
+    """Remember a resume embedding for later byte-identical uploads."""
+    try:
+        redis = await get_redis()
+        await redis.set(
+            CareersCacheKeys.resume_embedding(_embedding_space(), digest),
+            orjson.dumps(embedding),
+            ex=RESUME_EMBEDDING_CACHE_TTL_SECONDS,
+        )
+    except (RedisError, OSError) as e:
+        logger.warning(f"Resume embedding cache write failed for {digest}: {e}")
@@ -7,6 +7,8 @@ UPLOADS_DIR = Path("uploads/resumes")
 MAX_RESUME_SIZE_MB = 10
 MAX_RESUME_SIZE_BYTES = MAX_RESUME_SIZE_MB * 1024 * 1024
 ALLOWED_RESUME_EXTENSIONS = {".pdf"}
+PDF_MAGIC = b"%PDF"
+RESUME_UPLOAD_CHUNK_SIZE = 64 * 1024  # Streamed to disk, never held whole
 
 # Application Status
 APPLICATION_STATUS_PENDING = "pending"
@@ -14,6 +16,62 @@ APPLICATION_STATUS_REVIEWED = "reviewed"
 APPLICATION_STATUS_SHORTLISTED = "shortlisted"
 APPLICATION_STATUS_REJECTED = "rejected"
 
+# Application Processing (resume parsing + scoring runs after the 202)
+APPLICATION_PROCESSING_PENDING = "pending"
+APPLICATION_PROCESSING_DONE = "done"
+APPLICATION_PROCESSING_FAILED = "failed"  # No resume text/embedding, or job crashed
+
 # Similarity Score Thresholds
 SIMILARITY_HIGH_THRESHOLD = 0.80  # 80%+
 SIMILARITY_MEDIUM_THRESHOLD = 0.50  # 50-79%
+
+# Response Cache
+CAREERS_CACHE_TTL_SECONDS = 60  # Fresh window for cached list/feed payloads
+CAREERS_FEED_STALE_TTL_SECONDS = 24 * 60 * 60  # Last good feed kept for SWR
+CAREERS_FEED_REBUILD_LOCK_SECONDS = 30
+JD_EMBEDDING_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60  # Fallback tier for unsaved vectors
+RESUME_EMBEDDING_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60  # Keyed by resume content hash
+
+# Lets CDNs absorb repeated crawler hits on job detail pages
+JOB_DETAIL_CACHE_CONTROL = "public, s-maxage=300"
+
+# XML Feed
+FEED_STREAM_BATCH_SIZE = 100  # Rows fetched per server-side cursor round trip
+
+
+class CareersCacheKeys:
+    """Factory for careers response cache keys."""
+
+    VERSION = "careers:ver"
+    LIST = "list"
+    FEED = "feed"
+
+    @staticmethod
+    def payload(name: str, version: int) -> str:
+        """Key for a rendered payload at a given cache version."""
+        return f"careers:{name}:v{version}"
+
+    @staticmethod
+    def stale(name: str) -> str:
+        """Key for the last rendered payload regardless of version."""
+        return f"careers:{name}:stale"
+
+    @staticmethod
+    def rebuild(name: str) -> str:
+        """Key guarding a single in-flight background rebuild."""
+        return f"careers:{name}:rebuild"
+
+    @staticmethod
+    def embedding_space(provider: str, model: str, dimension: int) -> str:
+        """Key segment naming the vector space an embedding belongs to."""
+        return f"{provider}:{model}:{dimension}"
+
+    @staticmethod
+    def jd_embedding(space: str, job_id: str, jd_digest: str) -> str:
+        """Key for a JD embedding, versioned by a digest of the JD content."""
+        return f"jd:{space}:{job_id}:v{jd_digest}"
+
+    @staticmethod
+    def resume_embedding(space: str, resume_digest: str) -> str:
+        """Key for a resume embedding, shared by byte-identical uploads."""
+        return f"resume:{space}:{resume_digest}:emb"
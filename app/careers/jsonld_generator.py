@@ -9,6 +9,7 @@ import json
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
+import orjson
 from pydantic import BaseModel
 
 from app.jobs.schemas import GeneratedJD
@@ -74,8 +75,8 @@ def generate_job_posting_jsonld(
             "name": company_name,
             "value": job_id,
         },
-        "datePosted": date_posted.strftime("%Y-%m-%d"),
-        "validThrough": valid_through.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "datePosted": date_posted.date().isoformat(),
+        "validThrough": valid_through.isoformat(timespec="seconds"),
         "employmentType": employment_type,
         "hiringOrganization": {
             "@type": "Organization",
@@ -112,6 +113,32 @@ def generate_job_posting_jsonld(
     )
 
 
+def serialize_job_jsonld(
+    job_id: str,
+    generated_jd: GeneratedJD,
+    company_name: str,
+    company_description: str | None,
+    date_posted: datetime,
+) -> str:
+    """
+    Render a job's JSON-LD and serialize it for storage.
+
+    Used at approval time to fill JobRecord.jsonld_cached so public detail
+    requests can skip the generator entirely.
+
+    Returns:
+        JSON string of the schema.org JobPosting
+    """
+    result = generate_job_posting_jsonld(
+        job_id=job_id,
+        generated_jd=generated_jd,
+        company_name=company_name,
+        company_description=company_description,
+        date_posted=date_posted,
+    )
+    return orjson.dumps(result.jsonld).decode("utf-8")
+
+
 def _build_description_html(jd: GeneratedJD) -> str:
     """Build HTML description from GeneratedJD sections."""
     parts = [f"<p>{jd.summary}</p>"]
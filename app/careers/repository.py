@@ -4,14 +4,28 @@ Careers Repository
 Database access layer for public job listings.
 """
 
+from typing import AsyncIterator, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
+from app.careers.constants import FEED_STREAM_BATCH_SIZE
 from app.jobs.models import JobRecord
 from app.jobs.schemas.enums import ApprovalStatus
 
+# WHERE clause shared by every public listing query. The status is inlined
+# rather than bound so generic prepared-statement plans can still prove the
+# ix_jobs_public partial index predicate. The job_title check also drops
+# JSON 'null' documents, which IS NOT NULL lets through.
+_PUBLIC_JOB_CRITERIA = (
+    JobRecord.jd_approval_status
+    == literal(ApprovalStatus.APPROVED.value, literal_execute=True),
+    JobRecord.generated_jd.isnot(None),
+    JobRecord.generated_jd["job_title"].astext.isnot(None),
+)
+
 
 class CareersRepository:
     """Repository for public careers data access."""
@@ -20,21 +34,81 @@ class CareersRepository:
         self.session = session
 
     async def get_approved_jobs(self) -> list[JobRecord]:
-        """Get all jobs with approved JDs for public display."""
+        """Get all approved jobs that have a generated JD, for public display."""
         result = await self.session.execute(
             select(JobRecord)
-            .where(JobRecord.jd_approval_status == ApprovalStatus.APPROVED.value)
+            .where(*_PUBLIC_JOB_CRITERIA)
             .order_by(JobRecord.created_at.desc())
         )
         return list(result.scalars().all())
 
-    async def get_public_job(self, job_id: UUID) -> JobRecord | None:
-        """Get a single job by ID if it's approved for public display."""
+    async def list_approved_job_summaries(self) -> Sequence[Row]:
+        """
+        Get the list-view fields of approved jobs, projected in SQL.
+
+        Reads only the JD keys the listing shows via JSONB ->> so the full
+        generated_jd document never leaves Postgres.
+
+        Returns:
+            Rows with job_id, company_name, posted_at, job_title,
+            location, salary_range and summary
+        """
+        jd = JobRecord.generated_jd
         result = await self.session.execute(
+            select(
+                JobRecord.id.label("job_id"),
+                JobRecord.company_name,
+                JobRecord.created_at.label("posted_at"),
+                jd["job_title"].astext.label("job_title"),
+                jd["location"].astext.label("location"),
+                jd["salary_range"].astext.label("salary_range"),
+                jd["summary"].astext.label("summary"),
+            )
+            .where(*_PUBLIC_JOB_CRITERIA)
+            .order_by(JobRecord.created_at.desc())
+        )
+        return result.all()
+
+    async def stream_approved_jobs(self) -> AsyncIterator[JobRecord]:
+        """
+        Stream approved jobs with a generated JD from a server-side cursor.
+
+        Rows are fetched in batches so only a small window of JobRecords
+        is materialized at any time.
+        """
+        result = await self.session.stream_scalars(
+            select(JobRecord)
+            .where(*_PUBLIC_JOB_CRITERIA)
+            .order_by(JobRecord.created_at.desc())
+            .execution_options(yield_per=FEED_STREAM_BATCH_SIZE)
+        )
+        async for job in result:
+            yield job
+
+    async def get_public_job(
+        self,
+        job_id: UUID,
+        include_embedding: bool = False,
+        include_jsonld: bool = False,
+    ) -> JobRecord | None:
+        """
+        Get a single job by ID if it's approved for public display.
+
+        Args:
+            job_id: The job UUID
+            include_embedding: Also load the deferred jd_embedding column
+            include_jsonld: Also load the deferred jsonld_cached column
+        """
+        query = (
             select(JobRecord)
             .where(JobRecord.id == job_id)
             .where(JobRecord.jd_approval_status == ApprovalStatus.APPROVED.value)
         )
+        if include_embedding:
+            query = query.options(undefer(JobRecord.jd_embedding))
+        if include_jsonld:
+            query = query.options(undefer(JobRecord.jsonld_cached))
+        result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
     async def get_applicant_by_email(self, job_id: UUID, email: str):
@@ -53,3 +127,43 @@ class CareersRepository:
         self.session.add(applicant)
         await self.session.commit()
         await self.session.refresh(applicant)
+
+    async def get_applicant(self, applicant_id: UUID):
+        """Get an applicant record by ID."""
+        from app.candidates.models import ApplicantRecord
+
+        return await self.session.get(ApplicantRecord, applicant_id)
+
+    async def update_applicant_processing(
+        self,
+        applicant_id: UUID,
+        resume_text: str,
+        similarity_score: float | None,
+        processing_state: str,
+    ) -> None:
+        """Store background processing results for an applicant in one UPDATE."""
+        from app.candidates.models import ApplicantRecord
+
+        await self.session.execute(
+            update(ApplicantRecord)
+            .where(ApplicantRecord.id == applicant_id)
+            .values(
+                resume_text=resume_text,
+                similarity_score=similarity_score,
+                processing_state=processing_state,
+            )
+        )
+        await self.session.commit()
+
+    async def set_applicant_processing_state(
+        self, applicant_id: UUID, processing_state: str
+    ) -> None:
+        """Set only an applicant's processing_state in one UPDATE."""
+        from app.candidates.models import ApplicantRecord
+
+        await self.session.execute(
+            update(ApplicantRecord)
+            .where(ApplicantRecord.id == applicant_id)
+            .values(processing_state=processing_state)
+        )
+        await self.session.commit()
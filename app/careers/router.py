@@ -3,21 +3,43 @@ Careers Router
 
 Public job listing endpoints for Google indexing and careers pages.
 These endpoints do NOT require authentication.
+
+Response compression for the listing, detail and feed payloads is provided
+by the application-wide GZipMiddleware installed in app.main.
 """
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Response, Form, File, UploadFile
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Response,
+    Form,
+    File,
+    UploadFile,
+)
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
+from app.careers.constants import JOB_DETAIL_CACHE_CONTROL, PDF_MAGIC
 from app.careers.dependencies import get_careers_service
-from app.careers.service import CareersService
+from app.careers.service import (
+    CareersService,
+    process_application,
+    refresh_feed_cache,
+    save_resume_upload,
+)
 from app.jobs.schemas import (
-    PublicJobListItem,
     PublicJobListResponse,
     PublicJobResponse,
 )
 
-router = APIRouter(prefix="/careers", tags=["Public Careers"])
+router = APIRouter(
+    prefix="/careers",
+    tags=["Public Careers"],
+    default_response_class=ORJSONResponse,
+)
 
 
 @router.get(
@@ -34,13 +56,11 @@ async def list_public_jobs(
     This endpoint is unauthenticated and intended for:
     - Public careers pages
     - Google for Jobs crawler
-    """
-    job_items, total = await service.list_public_jobs()
 
-    return PublicJobListResponse(
-        jobs=[PublicJobListItem(**job) for job in job_items],
-        total=total,
-    )
+    Served from the Redis response cache; invalidated on job mutations.
+    """
+    content = await service.render_public_jobs()
+    return Response(content=content, media_type="application/json")
 
 
 @router.get(
@@ -49,13 +69,23 @@ async def list_public_jobs(
     response_class=Response,
 )
 async def get_job_feed(
+    background_tasks: BackgroundTasks,
     service: CareersService = Depends(get_careers_service),
 ):
     """
     Get XML feed of all jobs for integration with Indeed/LinkedIn.
     Success response is application/xml.
+
+    An expired feed is served stale while it is rebuilt in the background.
     """
-    xml_content = await service.generate_feed()
+    xml_content, needs_refresh = await service.get_cached_feed()
+    if xml_content is None:
+        # Cache miss: stream straight from the DB cursor and fill the cache
+        return StreamingResponse(
+            service.iter_feed(populate_cache=True), media_type="application/xml"
+        )
+    if needs_refresh:
+        background_tasks.add_task(refresh_feed_cache)
     return Response(content=xml_content, media_type="application/xml")
 
 
@@ -82,15 +112,20 @@ async def get_public_job(
     if not job_detail:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    return PublicJobResponse(**job_detail)
+    # orjson handles the UUID/datetime fields natively
+    return ORJSONResponse(
+        job_detail, headers={"Cache-Control": JOB_DETAIL_CACHE_CONTROL}
+    )
 
 
 @router.post(
     "/{job_id}/apply",
+    status_code=202,
     summary="Apply for a job",
 )
 async def apply_for_job(
     job_id: UUID,
+    background_tasks: BackgroundTasks,
     name: str = Form(
         ..., min_length=2, max_length=100, description="Applicant full name"
     ),
@@ -106,30 +141,32 @@ async def apply_for_job(
 
     - Accepts multipart/form-data
     - Resume must be a PDF file (max 10MB)
-    - Returns applicant_id on success
-    - Automatically calculates resume-JD similarity score
+    - Returns 202 with applicant_id once the application is recorded
+    - Resume-JD similarity is calculated in the background afterwards
     """
     # Validate file type
     if not resume.filename or not resume.filename.lower().endswith(".pdf"):
         raise HTTPException(status_code=400, detail="Resume must be a PDF file")
 
-    # Validate file size (10MB limit)
-    content = await resume.read()
-    max_size = 10 * 1024 * 1024  # 10MB
-    if len(content) > max_size:
-        raise HTTPException(
-            status_code=400, detail="Resume file too large. Maximum size is 10MB."
-        )
+    # Reject non-PDF payloads before anything touches the disk
+    head = await resume.read(len(PDF_MAGIC))
+    if head != PDF_MAGIC:
+        raise HTTPException(status_code=400, detail="Resume must be a PDF file")
 
     try:
+        # Reject before streaming, so a refused request leaves stored resumes alone
+        await service.validate_application(job_id, email)
+        # Streamed in chunks; aborts as soon as the 10MB limit is crossed
+        resume_path = await save_resume_upload(resume, head)
         result = await service.create_application(
             job_id=job_id,
             name=name,
             email=email,
             phone=phone,
-            resume_content=content,
-            resume_filename=resume.filename,
+            resume_path=resume_path,
         )
-        return result
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+    background_tasks.add_task(process_application, result["applicant_id"])
+    return result
@@ -4,26 +4,86 @@ Careers Service
 Business logic for public career pages.
 """
 
+import asyncio
+import hashlib
+import math
 import os
+import secrets
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, AsyncIterator
 from uuid import UUID, uuid4
 
+import aiofiles
 import numpy as np
+import orjson
+from fastapi import UploadFile
+from pydantic import TypeAdapter
 
 from app.careers.repository import CareersRepository
-from app.careers.jsonld_generator import generate_job_posting_jsonld
-from app.careers.constants import UPLOADS_DIR, MAX_RESUME_SIZE_MB
-from app.jobs.schemas import GeneratedJD
+from app.careers.jsonld_generator import serialize_job_jsonld
+from app.careers.constants import (
+    UPLOADS_DIR,
+    MAX_RESUME_SIZE_MB,
+    MAX_RESUME_SIZE_BYTES,
+    RESUME_UPLOAD_CHUNK_SIZE,
+    APPLICATION_PROCESSING_DONE,
+    APPLICATION_PROCESSING_FAILED,
+    APPLICATION_PROCESSING_PENDING,
+    CareersCacheKeys,
+)
+from app.careers.cache import (
+    claim_rebuild,
+    get_cache_version,
+    get_cached_jd_embedding,
+    get_cached_payload,
+    get_cached_resume_embedding,
+    get_stale_payload,
+    jd_digest,
+    release_rebuild,
+    store_cached_jd_embedding,
+    store_cached_resume_embedding,
+    store_payload,
+)
+from app.jobs.schemas import GeneratedJD, PublicJobListResponse
 from app.jobs.models import JobRecord
+from app.core.database import get_session_factory
 from app.core.logging import get_logger
-from app.ai.pdf_parser import extract_text_from_pdf, clean_resume_text
+from app.ai.pdf_parser import extract_resume_text
 from app.ai.embeddings import generate_embedding, generate_jd_embedding, PineconeService
 from app.candidates.models import ApplicantRecord
 from app.candidates.schemas import Applicant as ApplicantSchema
 
 logger = get_logger(__name__)
 
+# Bound once so the similarity path skips the model attribute lookup
+_JD_VALIDATOR = GeneratedJD.__pydantic_validator__
+_PUBLIC_JOB_LIST = TypeAdapter(PublicJobListResponse)
+
+
+def _unit_cosine_similarity(unit_vec: np.ndarray, vec: np.ndarray) -> float | None:
+    """Cosine similarity when the first vector is already L2-normalized."""
+    norm_sq = float(np.dot(vec, vec))
+    if norm_sq <= 0.0:
+        return None
+    return float(np.dot(unit_vec, vec)) / math.sqrt(norm_sq)
+
+
+def _cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float | None:
+    """
+    Cosine similarity of two float32 vectors.
+
+    Computes a.b, a.a and b.b as BLAS dot products and takes a single
+    square root, rather than dot plus two linalg.norm calls.
+
+    Returns:
+        Similarity in [-1, 1], or None if either vector is all zeros
+    """
+    denom = float(np.dot(vec1, vec1)) * float(np.dot(vec2, vec2))
+    if denom <= 0.0:
+        return None
+    return float(np.dot(vec1, vec2)) / math.sqrt(denom)
+
 
 class CareersService:
     """Service layer for public careers operations."""
@@ -38,59 +98,126 @@ class CareersService:
         Returns:
             Tuple of (job_list, total_count)
         """
-        jobs = await self.repository.get_approved_jobs()
-
-        job_items = []
-        for job in jobs:
-            if job.generated_jd:
-                jd = GeneratedJD.model_validate(job.generated_jd)
-                job_items.append(
-                    {
-                        "job_id": job.id,
-                        "job_title": jd.job_title,
-                        "company_name": job.company_name,
-                        "location": jd.location,
-                        "salary_range": jd.salary_range,
-                        "summary": jd.summary,
-                        "posted_at": job.created_at,
-                    }
-                )
+        rows = await self.repository.list_approved_job_summaries()
+        job_items = [row._asdict() for row in rows]
 
         return job_items, len(job_items)
 
-    async def generate_feed(self) -> str:
+    async def generate_feed(self) -> bytes:
         """
-        Generate XML feed for all approved jobs.
+        Generate XML feed for all approved jobs as UTF-8 bytes.
         """
-        from app.careers.xml_generator import generate_xml_feed
+        buf = bytearray()
+        async for chunk in self.iter_feed():
+            buf.extend(chunk)
+        return bytes(buf)
 
-        jobs = await self.repository.get_approved_jobs()
+    async def iter_feed(self, populate_cache: bool = False) -> AsyncIterator[bytes]:
+        """
+        Stream the XML feed for all approved jobs.
+
+        Args:
+            populate_cache: Also store the completed feed in the response
+                cache once the last chunk has been produced
+
+        Yields:
+            Encoded XML chunks
+        """
+        from app.careers.xml_generator import iter_xml_feed
+
+        version = await get_cache_version() if populate_cache else None
         # TODO: Get base URL from settings
         # Standard generic XML feeds often need the base site URL
         base_url = "http://localhost:3000"
-        return generate_xml_feed(jobs, base_url)
+        chunks = iter_xml_feed(self.repository.stream_approved_jobs(), base_url)
+
+        if version is None:
+            async for chunk in chunks:
+                yield chunk
+            return
+
+        rendered = []
+        async for chunk in chunks:
+            rendered.append(chunk)
+            yield chunk
+        await store_payload(
+            CareersCacheKeys.FEED, version, b"".join(rendered), keep_stale=True
+        )
+
+    async def render_public_jobs(self) -> str | bytes:
+        """
+        Get the public job list as serialized JSON, served from cache when fresh.
+
+        Returns:
+            JSON body of a PublicJobListResponse, ready to send without
+            re-serialization
+        """
+        version = await get_cache_version()
+        if version is not None:
+            cached = await get_cached_payload(CareersCacheKeys.LIST, version)
+            if cached is not None:
+                return cached
+
+        job_items, total = await self.list_public_jobs()
+        # One validator call for the whole page instead of one model per job
+        response = _PUBLIC_JOB_LIST.validate_python({"jobs": job_items, "total": total})
+        content = _PUBLIC_JOB_LIST.dump_json(response)
+
+        if version is not None:
+            await store_payload(CareersCacheKeys.LIST, version, content)
+        return content
+
+    async def get_cached_feed(self) -> tuple[str | None, bool]:
+        """
+        Get the cached XML feed, using stale-while-revalidate on expiry.
+
+        When the current version is missing but a previous feed exists, the
+        previous feed is returned immediately and the caller is asked to
+        schedule refresh_feed_cache() so crawlers never wait on the DB.
+        On a full miss the caller should stream iter_feed(populate_cache=True).
+
+        Returns:
+            Tuple of (xml_content or None on miss, needs_background_refresh)
+        """
+        version = await get_cache_version()
+        if version is None:
+            return None, False
+
+        cached = await get_cached_payload(CareersCacheKeys.FEED, version)
+        if cached is not None:
+            return cached, False
+
+        stale = await get_stale_payload(CareersCacheKeys.FEED)
+        if stale is not None:
+            return stale, await claim_rebuild(CareersCacheKeys.FEED)
+
+        return None, False
 
     async def get_public_job_detail(self, job_id: UUID) -> dict | None:
         """
         Get full job details with JSON-LD for Google indexing.
 
+        Fields are read straight from the stored generated_jd document and
+        the JSON-LD rendered at approval is embedded as an orjson Fragment,
+        so the hot path neither builds a GeneratedJD nor re-parses JSON-LD.
+
         Args:
             job_id: The job UUID
 
         Returns:
-            Job detail dict with JSON-LD, or None if not found/not approved
+            Job detail dict with JSON-LD (for ORJSONResponse), or None if
+            not found/not approved
         """
-        job = await self.repository.get_public_job(job_id)
+        job = await self.repository.get_public_job(job_id, include_jsonld=True)
 
-        if not job or not job.generated_jd:
+        jd = job.generated_jd if job else None
+        if not jd:
             return None
 
-        jd = GeneratedJD.model_validate(job.generated_jd)
-
-        # Generate JSON-LD for Google
-        jsonld_data = generate_job_posting_jsonld(
+        # JSON-LD is rendered at approval; generate on demand for older rows
+        jsonld = job.jsonld_cached or serialize_job_jsonld(
             job_id=str(job.id),
-            generated_jd=jd,
+            generated_jd=job.parsed_jd,
             company_name=job.company_name,
             company_description=job.company_description,
             date_posted=job.created_at,
@@ -98,129 +225,126 @@ class CareersService:
 
         return {
             "job_id": job.id,
-            "job_title": jd.job_title,
+            "job_title": jd["job_title"],
             "company_name": job.company_name,
             "company_description": job.company_description,
-            "location": jd.location,
-            "salary_range": jd.salary_range,
-            "summary": jd.summary,
-            "description": jd.description,
-            "responsibilities": jd.responsibilities,
-            "requirements": jd.requirements,
-            "nice_to_have": jd.nice_to_have,
-            "benefits": jd.benefits,
+            "location": jd.get("location"),
+            "salary_range": jd.get("salary_range"),
+            "summary": jd["summary"],
+            "description": jd["description"],
+            "responsibilities": jd.get("responsibilities", []),
+            "requirements": jd.get("requirements", []),
+            "nice_to_have": jd.get("nice_to_have", []),
+            "benefits": jd.get("benefits", []),
             "posted_at": job.created_at,
-            "jsonld": jsonld_data.jsonld,
+            "jsonld": orjson.Fragment(jsonld),
         }
 
-    async def _calculate_similarity(
+    def _calculate_similarity(
         self,
         resume_embedding: list[float],
-        generated_jd: dict,
+        job: JobRecord,
+        jd_embedding: list[float] | None = None,
     ) -> float | None:
         """
         Calculate cosine similarity between resume and job description embeddings.
 
+        Uses the unit JD vector persisted at approval time. Jobs approved
+        before that column existed pass an embedding fetched with
+        _get_jd_embedding instead.
+
         Args:
             resume_embedding: Resume text embedding vector
-            generated_jd: Generated JD data dict
+            job: Job record (with jd_embedding loaded)
+            jd_embedding: Fallback JD embedding when job.jd_embedding is unset
 
         Returns:
             Similarity score (0.0-1.0) or None if calculation fails
         """
         try:
-            jd_obj = GeneratedJD.model_validate(generated_jd)
-            jd_embedding = await generate_jd_embedding(jd_obj)
-
-            vec1 = np.array(jd_embedding)
-            vec2 = np.array(resume_embedding)
-
-            dot_product = np.dot(vec1, vec2)
-            norm1 = np.linalg.norm(vec1)
-            norm2 = np.linalg.norm(vec2)
-
-            if norm1 > 0 and norm2 > 0:
-                return float(dot_product / (norm1 * norm2))
-            return None
+            resume_vec = np.asarray(resume_embedding, dtype=np.float32)
+            if job.jd_embedding:
+                return _unit_cosine_similarity(
+                    np.asarray(job.jd_embedding, dtype=np.float32), resume_vec
+                )
+            if jd_embedding is None:
+                return None
+            return _cosine_similarity(
+                np.asarray(jd_embedding, dtype=np.float32), resume_vec
+            )
         except Exception as e:
             logger.error(f"Failed to calculate similarity: {e}")
             return None
 
-    async def create_application(
-        self,
-        job_id: UUID,
-        name: str,
-        email: str,
-        phone: str | None,
-        resume_content: bytes,
-        resume_filename: str,
-    ) -> dict:
+    async def _get_jd_embedding(self, job: JobRecord) -> list[float]:
+        """Get a JD embedding from the shared cache, generating it on a miss."""
+        job_id = str(job.id)
+        digest = jd_digest(job.generated_jd)
+
+        embedding = await get_cached_jd_embedding(job_id, digest)
+        if embedding is None:
+            jd_obj = _JD_VALIDATOR.validate_python(job.generated_jd)
+            embedding = await generate_jd_embedding(jd_obj)
+            await store_cached_jd_embedding(job_id, digest, embedding)
+        return embedding
+
+    async def _get_resume_embedding(
+        self, resume_path: str, resume_text: str
+    ) -> list[float]:
+        """Get a resume embedding, reusing one from a byte-identical upload."""
+        # Stored resumes are named by their content digest
+        digest = Path(resume_path).stem
+        embedding = await get_cached_resume_embedding(digest)
+        if embedding is None:
+            embedding = await generate_embedding(resume_text)
+            await store_cached_resume_embedding(digest, embedding)
+        else:
+            logger.info(f"Reusing embedding for resume {digest}")
+        return embedding
+
+    async def validate_application(self, job_id: UUID, email: str) -> None:
         """
-        Process a new job application.
+        Check that an application can be accepted, before the resume upload.
 
-        1. Verify job exists and is approved
-        2. Check for duplicate application
-        3. Save resume file
-        4. Extract text from PDF
-        5. Generate embedding
-        6. Create applicant record
-        7. Store in Pinecone
+        Running this before anything is written means a rejected request
+        never touches a stored resume; content-addressed files may already
+        belong to another applicant.
 
-        Returns:
-            Dict with applicant_id and job_id
+        Raises:
+            ValueError: If the job isn't published or the email already applied
         """
-        # 1. Verify job exists and is approved
         job = await self.repository.get_public_job(job_id)
         if not job:
             raise ValueError(f"Job {job_id} not found or not published")
 
-        # 2. Check for duplicate application
         existing = await self.repository.get_applicant_by_email(job_id, email)
         if existing:
             raise ValueError(
                 f"An application with email {email} already exists for this job"
             )
 
-        # 3. Save resume file
-        UPLOADS_DIR.mkdir(parents=True, exist_ok=True)
-
-        applicant_id = uuid4()
-        safe_filename = f"{applicant_id}_{resume_filename}"
-        resume_path = UPLOADS_DIR / safe_filename
+    async def create_application(
+        self,
+        job_id: UUID,
+        name: str,
+        email: str,
+        phone: str | None,
+        resume_path: Path,
+    ) -> dict:
+        """
+        Record a job application that passed validate_application().
 
-        with open(resume_path, "wb") as f:
-            f.write(resume_content)
+        Takes ownership of the resume already streamed to resume_path and
+        creates a pending applicant record. Resume parsing, scoring and the
+        Pinecone upsert are left to process_application(), which callers
+        schedule after responding.
 
+        Returns:
+            Dict with applicant_id and job_id
+        """
         logger.info(f"Saved resume to {resume_path}")
 
-        # 4. Extract text from PDF
-        resume_text = await extract_text_from_pdf(str(resume_path))
-        if resume_text:
-            resume_text = clean_resume_text(resume_text)
-        else:
-            resume_text = ""
-            logger.warning(f"Could not extract text from resume: {resume_filename}")
-
-        # 5. Generate embedding
-        embedding = None
-        similarity_score = None
-        if resume_text:
-            try:
-                embedding = await generate_embedding(resume_text)
-                logger.info(f"Generated embedding with {len(embedding)} dimensions")
-
-                # Calculate similarity with JD if available
-                if job.generated_jd:
-                    similarity_score = await self._calculate_similarity(
-                        embedding, job.generated_jd
-                    )
-                    if similarity_score:
-                        logger.info(f"Similarity score: {similarity_score:.4f}")
-
-            except Exception as e:
-                logger.error(f"Failed to generate embedding: {e}")
-
-        # 6. Create applicant record in database
+        applicant_id = uuid4()
         applicant = ApplicantRecord(
             id=applicant_id,
             job_id=job_id,
@@ -228,40 +352,223 @@ class CareersService:
             email=email,
             phone=phone,
             resume_path=str(resume_path),
-            resume_text=resume_text,
-            similarity_score=similarity_score,
+            similarity_score=None,
             shortlisted=False,
+            processing_state=APPLICATION_PROCESSING_PENDING,
             applied_at=datetime.now(timezone.utc),
         )
 
         await self.repository.create_applicant(applicant)
         logger.info(f"Created applicant {applicant_id} for job {job_id}")
 
-        # 7. Store in Pinecone (optional, depends on config)
-        if embedding:
-            try:
-                applicant_schema = ApplicantSchema(
-                    id=applicant_id,
-                    name=name,
-                    email=email,
-                    phone=phone,
-                    resume_path=str(resume_path),
-                    resume_text=resume_text,
-                    embedding=embedding,
-                    similarity_score=similarity_score,
-                    shortlisted=False,
-                    applied_at=applicant.applied_at,
-                )
-                pinecone_service = PineconeService()
-                await pinecone_service.upsert_applicant(applicant_schema, str(job_id))
-                logger.info(
-                    f"Stored embedding in Pinecone for applicant {applicant_id}"
-                )
-            except Exception as e:
-                logger.warning(f"Failed to store in Pinecone (non-fatal): {e}")
-
         return {
             "applicant_id": applicant_id,
             "job_id": job_id,
             "message": "Application submitted successfully",
         }
+
+    async def score_application(self, applicant_id: UUID) -> None:
+        """
+        Parse, embed and score a pending application.
+
+        1. Extract text from PDF
+        2. Generate embedding (JD fallback embedding fetched concurrently)
+        3. Store text, similarity and processing_state in a single UPDATE
+           (failed when no resume embedding could be produced)
+        4. Store in Pinecone (optional, depends on config)
+
+        Args:
+            applicant_id: ID returned by create_application()
+        """
+        applicant = await self.repository.get_applicant(applicant_id)
+        if not applicant:
+            logger.warning(f"Applicant {applicant_id} not found for processing")
+            return
+
+        job = await self.repository.get_public_job(
+            applicant.job_id, include_embedding=True
+        )
+
+        # 1. Extract text from PDF
+        # Parsed and cleaned in a worker process, off the event loop
+        resume_text = await extract_resume_text(applicant.resume_path)
+        if not resume_text:
+            resume_text = ""
+            logger.warning(
+                f"Could not extract text from resume: {applicant.resume_path}"
+            )
+
+        # 2. Generate embedding
+        embedding = None
+        similarity_score = None
+        if resume_text:
+            has_jd = job is not None and bool(job.generated_jd)
+            needs_jd_embedding = has_jd and not job.jd_embedding
+            resume_result, jd_result = await asyncio.gather(
+                self._get_resume_embedding(applicant.resume_path, resume_text),
+                self._get_jd_embedding(job) if needs_jd_embedding else _none(),
+                return_exceptions=True,
+            )
+
+            if isinstance(resume_result, Exception):
+                logger.error(f"Failed to generate embedding: {resume_result}")
+            else:
+                embedding = resume_result
+                logger.info(f"Generated embedding with {len(embedding)} dimensions")
+
+                if isinstance(jd_result, Exception):
+                    logger.error(f"Failed to get JD embedding: {jd_result}")
+                    jd_result = None
+
+                # Calculate similarity with JD if available
+                if has_jd:
+                    similarity_score = self._calculate_similarity(
+                        embedding, job, jd_result
+                    )
+                    if similarity_score:
+                        logger.info(f"Similarity score: {similarity_score:.4f}")
+
+        # 3. Persist results
+        # Without a resume embedding the application can never be scored
+        await self.repository.update_applicant_processing(
+            applicant_id,
+            resume_text=resume_text,
+            similarity_score=similarity_score,
+            processing_state=(
+                APPLICATION_PROCESSING_DONE
+                if embedding
+                else APPLICATION_PROCESSING_FAILED
+            ),
+        )
+
+        # 4. Store in Pinecone
+        if embedding:
+            applicant_schema = ApplicantSchema(
+                id=applicant_id,
+                name=applicant.name,
+                email=applicant.email,
+                phone=applicant.phone,
+                resume_path=applicant.resume_path,
+                resume_text=resume_text,
+                embedding=embedding,
+                similarity_score=similarity_score,
+                shortlisted=False,
+                applied_at=applicant.applied_at,
+            )
+            await _store_applicant_vector(applicant_schema, str(applicant.job_id))
+
+
+async def save_resume_upload(resume: UploadFile, head: bytes = b"") -> Path:
+    """
+    Stream an uploaded resume to UPLOADS_DIR in fixed-size chunks.
+
+    Files are named by a BLAKE2b digest of their content, computed while
+    streaming, so byte-identical resumes are stored once and the filename
+    never contains user input.
+
+    A stored ``{digest}.pdf`` may be shared by several applicants, so only
+    this upload's ``.part`` file is ever removed here; files left without an
+    applicant are for an offline sweep.
+
+    Args:
+        resume: The uploaded file, positioned after any bytes in ``head``
+        head: Bytes already consumed from the upload (e.g. the PDF magic)
+
+    Returns:
+        Path of the stored file (``{digest}.pdf``)
+
+    Raises:
+        ValueError: If the upload exceeds MAX_RESUME_SIZE_BYTES
+    """
+    UPLOADS_DIR.mkdir(parents=True, exist_ok=True)
+    partial_path = UPLOADS_DIR / f".{secrets.token_urlsafe(12)}.part"
+
+    hasher = hashlib.blake2b(head, digest_size=16)
+    total = len(head)
+    try:
+        async with aiofiles.open(partial_path, "wb") as f:
+            await f.write(head)
+            while chunk := await resume.read(RESUME_UPLOAD_CHUNK_SIZE):
+                total += len(chunk)
+                if total > MAX_RESUME_SIZE_BYTES:
+                    raise ValueError(
+                        "Resume file too large. "
+                        f"Maximum size is {MAX_RESUME_SIZE_MB}MB."
+                    )
+                hasher.update(chunk)
+                await f.write(chunk)
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
+
+    resume_path = UPLOADS_DIR / f"{hasher.hexdigest()}.pdf"
+    if resume_path.exists():
+        partial_path.unlink()
+        logger.info(f"Reusing stored resume {resume_path.name}")
+    else:
+        os.replace(partial_path, resume_path)
+    return resume_path
+
+
+async def _none() -> None:
+    """Placeholder awaitable for optional gather() slots."""
+    return None
+
+
+async def _store_applicant_vector(applicant: ApplicantSchema, job_id: str) -> None:
+    """Upsert an applicant's resume embedding into Pinecone (best effort)."""
+    try:
+        pinecone_service = PineconeService()
+        await pinecone_service.upsert_applicant(applicant, job_id)
+        logger.info(f"Stored embedding in Pinecone for applicant {applicant.id}")
+    except Exception as e:
+        logger.warning(f"Failed to store in Pinecone (non-fatal): {e}")
+
+
+async def refresh_feed_cache() -> None:
+    """
+    Rebuild the cached XML feed in the background.
+
+    Runs after the response has been sent, so it opens its own session
+    rather than reusing the request-scoped one.
+    """
+    try:
+        version = await get_cache_version()
+        if version is None:
+            return
+        factory = get_session_factory()
+        async with factory() as session:
+            service = CareersService(CareersRepository(session))
+            xml_content = await service.generate_feed()
+        await store_payload(
+            CareersCacheKeys.FEED, version, xml_content, keep_stale=True
+        )
+    except Exception as e:
+        logger.error(f"Failed to refresh careers feed cache: {e}")
+    finally:
+        await release_rebuild(CareersCacheKeys.FEED)
+
+
+async def process_application(applicant_id: UUID) -> None:
+    """
+    Score a submitted application in the background.
+
+    Runs after the 202 response has been sent, so it opens its own session
+    rather than reusing the request-scoped one. A crash marks the applicant
+    as failed instead of leaving it pending forever.
+    """
+    try:
+        factory = get_session_factory()
+        async with factory() as session:
+            service = CareersService(CareersRepository(session))
+            await service.score_application(applicant_id)
+    except Exception as e:
+        logger.error(f"Failed to process application {applicant_id}: {e}")
+        try:
+            factory = get_session_factory()
+            async with factory() as session:
+                await CareersRepository(session).set_applicant_processing_state(
+                    applicant_id, APPLICATION_PROCESSING_FAILED
+                )
+        except Exception as e:
+            logger.error(f"Failed to mark application {applicant_id} failed: {e}")
@@ -111,14 +111,7 @@ class TestApplicationCreation:
         service = CareersService(repository=mock_repository)
 
         with pytest.raises(ValueError) as exc_info:
-            await service.create_application(
-                job_id=uuid4(),
-                name="John Doe",
-                email="existing@example.com",
-                phone=None,
-                resume_content=b"PDF content",
-                resume_filename="resume.pdf",
-            )
+            await service.validate_application(uuid4(), "existing@example.com")
 
         assert "already exists" in str(exc_info.value)
 
@@ -132,16 +125,182 @@ class TestApplicationCreation:
         service = CareersService(repository=mock_repository)
 
         with pytest.raises(ValueError) as exc_info:
-            await service.create_application(
+            await service.validate_application(uuid4(), "john@example.com")
+
+        assert "not found" in str(exc_info.value)
+
+    def test_rejected_application_never_streams_resume(self, mock_repository):
+        """A refused application must be turned away before any file is written."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from app.careers.dependencies import get_careers_service
+        from app.careers.router import router
+        from app.careers.service import CareersService
+
+        mock_repository.get_applicant_by_email.return_value = MagicMock()
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_careers_service] = lambda: CareersService(
+            repository=mock_repository
+        )
+
+        with patch("app.careers.router.save_resume_upload") as save:
+            response = TestClient(app).post(
+                f"/careers/{uuid4()}/apply",
+                data={"name": "John Doe", "email": "existing@example.com"},
+                files={"resume": ("resume.pdf", b"%PDF-1.4 content")},
+            )
+
+        assert response.status_code == 400
+        save.assert_not_called()
+        mock_repository.create_applicant.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_application_recorded_pending_without_scoring(
+        self, mock_repository, tmp_path
+    ):
+        """Submission should only insert a pending row; scoring runs later."""
+        from app.careers.service import CareersService
+
+        resume_path = tmp_path / "resume.pdf"
+        resume_path.write_bytes(b"%PDF content")
+        service = CareersService(repository=mock_repository)
+
+        with patch("app.careers.service.generate_embedding") as embed:
+            result = await service.create_application(
                 job_id=uuid4(),
                 name="John Doe",
                 email="john@example.com",
                 phone=None,
-                resume_content=b"PDF content",
-                resume_filename="resume.pdf",
+                resume_path=resume_path,
             )
 
-        assert "not found" in str(exc_info.value)
+        applicant = mock_repository.create_applicant.await_args.args[0]
+        assert applicant.id == result["applicant_id"]
+        assert applicant.processing_state == "pending"
+        assert applicant.similarity_score is None
+        embed.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_score_application_updates_once(self, mock_repository):
+        """Background scoring should persist its results in a single update."""
+        from datetime import datetime, timezone
+
+        from app.candidates.models import ApplicantRecord
+        from app.careers.service import CareersService
+
+        applicant_id = uuid4()
+        mock_repository.get_applicant.return_value = ApplicantRecord(
+            id=applicant_id,
+            job_id=uuid4(),
+            name="John Doe",
+            email="john@example.com",
+            resume_path="resume.pdf",
+            applied_at=datetime.now(timezone.utc),
+        )
+        mock_repository.get_public_job.return_value = None
+        service = CareersService(repository=mock_repository)
+
+        with (
+            patch("app.careers.service.extract_resume_text", return_value="Python"),
+            patch("app.careers.service.get_cached_resume_embedding", return_value=None),
+            patch("app.careers.service.store_cached_resume_embedding"),
+            patch("app.careers.service.generate_embedding", return_value=[0.1, 0.2]),
+            patch("app.careers.service._store_applicant_vector") as store_vector,
+        ):
+            await service.score_application(applicant_id)
+
+        mock_repository.update_applicant_processing.assert_awaited_once_with(
+            applicant_id,
+            resume_text="Python",
+            similarity_score=None,
+            processing_state="done",
+        )
+        store_vector.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unreadable_resume_marked_failed(self, mock_repository):
+        """A resume with no extractable text should not be recorded as done."""
+        from datetime import datetime, timezone
+
+        from app.candidates.models import ApplicantRecord
+        from app.careers.service import CareersService
+
+        applicant_id = uuid4()
+        mock_repository.get_applicant.return_value = ApplicantRecord(
+            id=applicant_id,
+            job_id=uuid4(),
+            name="John Doe",
+            email="john@example.com",
+            resume_path="missing.pdf",
+            applied_at=datetime.now(timezone.utc),
+        )
+        service = CareersService(repository=mock_repository)
+
+        with (
+            patch("app.careers.service.extract_resume_text", return_value=None),
+            patch("app.careers.service._store_applicant_vector") as store_vector,
+        ):
+            await service.score_application(applicant_id)
+
+        mock_repository.update_applicant_processing.assert_awaited_once_with(
+            applicant_id,
+            resume_text="",
+            similarity_score=None,
+            processing_state="failed",
+        )
+        store_vector.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_crashed_processing_marked_failed(self):
+        """A background job that raises should leave the applicant failed."""
+        from app.careers import service as careers_service
+
+        applicant_id = uuid4()
+        repository = AsyncMock()
+        session_factory = MagicMock()
+        session_factory.return_value.__aenter__ = AsyncMock()
+        session_factory.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        with (
+            patch.object(
+                careers_service, "get_session_factory", return_value=session_factory
+            ),
+            patch.object(careers_service, "CareersRepository", return_value=repository),
+            patch.object(
+                careers_service.CareersService,
+                "score_application",
+                AsyncMock(side_effect=RuntimeError("db gone")),
+            ),
+        ):
+            await careers_service.process_application(applicant_id)
+
+        repository.set_applicant_processing_state.assert_awaited_once_with(
+            applicant_id, "failed"
+        )
+
+    @pytest.mark.asyncio
+    async def test_known_resume_skips_embedding_call(self, mock_repository):
+        """A resume seen before should reuse its embedding by content digest."""
+        from app.careers.service import CareersService
+
+        service = CareersService(repository=mock_repository)
+
+        with (
+            patch(
+                "app.careers.service.get_cached_resume_embedding",
+                return_value=[0.1, 0.2],
+            ) as get_cached,
+            patch("app.careers.service.generate_embedding") as embed,
+        ):
+            embedding = await service._get_resume_embedding(
+                "uploads/resumes/abc123.pdf", "Python"
+            )
+
+        assert embedding == [0.1, 0.2]
+        get_cached.assert_awaited_once_with("abc123")
+        embed.assert_not_called()
 
 
 class TestResumeValidation:
@@ -169,6 +328,65 @@ class TestResumeValidation:
         assert len(small_file) <= max_bytes
         assert len(large_file) > max_bytes
 
+    @pytest.mark.asyncio
+    async def test_upload_streamed_to_disk(self, tmp_path):
+        """Uploads should land on disk byte-for-byte, including the sniffed head."""
+        import hashlib
+        import io
+        from fastapi import UploadFile
+        from app.careers.service import save_resume_upload
+
+        body = b"%PDF-1.7" + b"x" * 200_000
+        upload = UploadFile(io.BytesIO(body), filename="../resume.pdf")
+        head = await upload.read(4)
+
+        with patch("app.careers.service.UPLOADS_DIR", tmp_path):
+            resume_path = await save_resume_upload(upload, head)
+
+        assert resume_path.parent == tmp_path
+        assert (
+            resume_path.name
+            == f"{hashlib.blake2b(body, digest_size=16).hexdigest()}.pdf"
+        )
+        assert resume_path.read_bytes() == body
+
+    @pytest.mark.asyncio
+    async def test_identical_uploads_stored_once(self, tmp_path):
+        """Byte-identical resumes should resolve to a single stored file."""
+        import io
+        from fastapi import UploadFile
+        from app.careers.service import save_resume_upload
+
+        body = b"%PDF-1.7 same resume"
+        with patch("app.careers.service.UPLOADS_DIR", tmp_path):
+            first = await save_resume_upload(
+                UploadFile(io.BytesIO(body), filename="a.pdf")
+            )
+            second = await save_resume_upload(
+                UploadFile(io.BytesIO(body), filename="b.pdf")
+            )
+
+        assert first == second
+        assert list(tmp_path.iterdir()) == [first]
+
+    @pytest.mark.asyncio
+    async def test_oversized_upload_removed(self, tmp_path):
+        """Uploads over the limit should be rejected and not left on disk."""
+        import io
+        from fastapi import UploadFile
+        from app.careers.service import save_resume_upload
+
+        upload = UploadFile(io.BytesIO(b"%PDF" + b"x" * 5000), filename="resume.pdf")
+
+        with (
+            patch("app.careers.service.UPLOADS_DIR", tmp_path),
+            patch("app.careers.service.MAX_RESUME_SIZE_BYTES", 1024),
+            pytest.raises(ValueError, match="too large"),
+        ):
+            await save_resume_upload(upload)
+
+        assert list(tmp_path.iterdir()) == []
+
 
 class TestSimilarityCalculation:
     """Tests for resume-JD similarity calculation."""
@@ -198,3 +416,222 @@ class TestSimilarityCalculation:
         similarity = dot / (norm * norm)
 
         assert abs(similarity - 1.0) < 0.0001
+
+
+class TestJsonLdRendering:
+    """Tests for JSON-LD rendering."""
+
+    @pytest.fixture
+    def generated_jd(self):
+        """Valid generated JD."""
+        from app.jobs.schemas import GeneratedJD
+
+        return GeneratedJD(
+            job_title="Software Engineer",
+            summary="Build and maintain backend services for our hiring platform.",
+            description=(
+                "You will design APIs, own data pipelines and work closely with "
+                "product to ship features used by recruiters every day."
+            ),
+            responsibilities=["Design APIs", "Review code"],
+            requirements=["Python experience", "SQL knowledge"],
+        )
+
+    def test_same_inputs_render_identically(self, generated_jd):
+        """Identical inputs should render the same posting."""
+        from datetime import datetime, timezone
+
+        from app.careers.jsonld_generator import generate_job_posting_jsonld
+
+        posted = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        first = generate_job_posting_jsonld(
+            "job-1", generated_jd, "TechCorp", date_posted=posted
+        )
+        second = generate_job_posting_jsonld(
+            "job-1", generated_jd, "TechCorp", date_posted=posted
+        )
+
+        assert first == second
+        assert first.jsonld["datePosted"] == "2024-01-01"
+
+    def test_jd_change_reflected_in_render(self, generated_jd):
+        """Editing the JD should change the rendered posting."""
+        from datetime import datetime, timezone
+
+        from app.careers.jsonld_generator import generate_job_posting_jsonld
+
+        posted = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        first = generate_job_posting_jsonld(
+            "job-2", generated_jd, "TechCorp", date_posted=posted
+        )
+        edited = generated_jd.model_copy(update={"job_title": "Staff Engineer"})
+        second = generate_job_posting_jsonld(
+            "job-2", edited, "TechCorp", date_posted=posted
+        )
+
+        assert first != second
+        assert second.jsonld["title"] == "Staff Engineer"
+
+
+class TestPublicJobDetail:
+    """Tests for the public job detail payload."""
+
+    @pytest.mark.asyncio
+    async def test_cached_jsonld_embedded_without_reparse(self):
+        """Stored JSON-LD should be embedded verbatim in the ORJSON body."""
+        from datetime import datetime, timezone
+
+        import orjson
+
+        from app.careers.service import CareersService
+        from app.jobs.models import JobRecord
+
+        job = JobRecord(
+            id=uuid4(),
+            company_name="TechCorp",
+            created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            generated_jd={
+                "job_title": "Software Engineer",
+                "summary": "Build services.",
+                "description": "Design APIs.",
+            },
+            jsonld_cached='{"@type":"JobPosting","title":"Software Engineer"}',
+        )
+        repository = AsyncMock()
+        repository.get_public_job.return_value = job
+        service = CareersService(repository=repository)
+
+        with patch("app.careers.service.serialize_job_jsonld") as serialize:
+            detail = await service.get_public_job_detail(job.id)
+
+        serialize.assert_not_called()
+        assert detail["job_title"] == "Software Engineer"
+        assert detail["responsibilities"] == []
+        body = orjson.loads(orjson.dumps(detail))
+        assert body["jsonld"] == {"@type": "JobPosting", "title": "Software Engineer"}
+
+
+class TestCareersResponseCache:
+    """Tests for cached careers payloads."""
+
+    @pytest.mark.asyncio
+    async def test_cached_job_list_skips_database(self):
+        """A fresh cache entry should be returned without querying jobs."""
+        from app.careers.service import CareersService
+
+        repository = AsyncMock()
+        service = CareersService(repository=repository)
+
+        with (
+            patch("app.careers.service.get_cache_version", return_value=3),
+            patch(
+                "app.careers.service.get_cached_payload",
+                return_value='{"jobs":[],"total":0}',
+            ) as get_cached,
+        ):
+            content = await service.render_public_jobs()
+
+        assert content == '{"jobs":[],"total":0}'
+        get_cached.assert_awaited_once_with("list", 3)
+        repository.list_approved_job_summaries.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_expired_feed_served_stale_with_refresh(self):
+        """An expired feed should be served stale and flagged for rebuild."""
+        from app.careers.service import CareersService
+
+        repository = AsyncMock()
+        service = CareersService(repository=repository)
+
+        with (
+            patch("app.careers.service.get_cache_version", return_value=4),
+            patch("app.careers.service.get_cached_payload", return_value=None),
+            patch("app.careers.service.get_stale_payload", return_value="<jobs/>"),
+            patch("app.careers.service.claim_rebuild", return_value=True),
+        ):
+            content, needs_refresh = await service.get_cached_feed()
+
+        assert content == "<jobs/>"
+        assert needs_refresh is True
+        repository.stream_approved_jobs.assert_not_called()
+
+
+class TestXmlFeed:
+    """Tests for the streamed XML feed."""
+
+    @pytest.mark.asyncio
+    async def test_generate_feed_streams_approved_jobs(self):
+        """Feed should render every streamed job (SQL filters unpublished ones)."""
+        from datetime import datetime
+
+        from app.careers.service import CareersService
+        from app.jobs.models import JobRecord
+
+        job = JobRecord(
+            id=uuid4(),
+            company_name="TechCorp",
+            created_at=datetime(2024, 1, 1),
+            generated_jd={
+                "job_title": "Software Engineer",
+                "summary": "Build and maintain backend services for our platform.",
+                "description": (
+                    "You will design APIs, own data pipelines and work closely "
+                    "with product to ship features used by recruiters every day."
+                ),
+                "responsibilities": ["Design APIs"],
+                "requirements": ["Python experience"],
+            },
+        )
+
+        async def stream():
+            yield job
+
+        repository = MagicMock()
+        repository.stream_approved_jobs = stream
+        service = CareersService(repository=repository)
+
+        xml_content = await service.generate_feed()
+
+        assert xml_content.startswith(b'<?xml version="1.0" encoding="utf-8"?>')
+        assert xml_content.endswith(b"</source>")
+        assert xml_content.count(b"<job>") == 1
+        assert f"<referencenumber>{job.id}</referencenumber>".encode() in xml_content
+
+
+class TestJdEmbeddingReuse:
+    """Tests for reusing the JD embedding persisted at approval."""
+
+    def test_stored_jd_embedding_used_directly(self):
+        """A persisted unit JD vector should be used without a fallback."""
+        from app.careers.service import CareersService
+        from app.jobs.models import JobRecord
+
+        job = JobRecord(id=uuid4(), generated_jd={}, jd_embedding=[0.6, 0.8, 0.0])
+        service = CareersService(repository=AsyncMock())
+
+        score = service._calculate_similarity([3.0, 4.0, 0.0], job)
+
+        assert abs(score - 1.0) < 0.0001
+
+    @pytest.mark.asyncio
+    async def test_embedding_keys_scoped_to_provider_space(self):
+        """Switching embedding model must not serve vectors from the old space."""
+        from app.careers import cache
+
+        redis = AsyncMock()
+        redis.get.return_value = None
+
+        with (
+            patch.object(cache, "get_redis", AsyncMock(return_value=redis)),
+            patch.object(cache, "get_ai_provider", return_value="bedrock"),
+            patch.object(cache, "get_embedding_model", return_value="nova"),
+            patch.object(cache, "get_embedding_dimension", return_value=1024),
+        ):
+            await cache.get_cached_resume_embedding("abc123")
+            await cache.get_cached_jd_embedding("job-1", "d1")
+
+        keys = [call.args[0] for call in redis.get.await_args_list]
+        assert keys == [
+            "resume:bedrock:nova:1024:abc123:emb",
+            "jd:bedrock:nova:1024:job-1:vd1",
+        ]
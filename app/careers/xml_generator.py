@@ -5,98 +5,141 @@ Generates an XML feed compatible with major job boards (Indeed, LinkedIn, Glassd
 Format follows the standard referential schema often used for generic XML feeds.
 """
 
-from datetime import datetime
-from xml.sax.saxutils import escape
+from email.utils import formatdate
+from typing import AsyncIterator
+from xml.etree.ElementTree import Element, SubElement, tostring
 
 from app.jobs.schemas import GeneratedJD
 from app.jobs.models import JobRecord
 
 
+async def iter_xml_feed(
+    jobs: AsyncIterator[JobRecord], base_url: str = "https://aarlp.com"
+) -> AsyncIterator[bytes]:
+    """
+    Stream the XML feed as UTF-8 chunks, one per job.
+
+    Only one job is rendered at a time, so memory stays flat regardless
+    of how many jobs the feed contains.
+
+    Args:
+        jobs: Async iterator of published JobRecords (generated_jd set)
+        base_url: The base URL of the public career site
+
+    Yields:
+        Encoded XML chunks ready to be written to the response
+    """
+    yield _render_header(base_url)
+
+    async for job in jobs:
+        yield _render_job(job, base_url)
+
+    yield b"</source>"
+
+
 def generate_xml_feed(
     jobs: list[JobRecord], base_url: str = "https://aarlp.com"
-) -> str:
+) -> bytes:
     """
-    Generate XML feed string for a list of jobs.
+    Generate the XML feed for a list of jobs.
 
     Args:
-        jobs: List of JobRecord objects
+        jobs: Published JobRecords (generated_jd set)
         base_url: The base URL of the public career site
 
     Returns:
-        XML string ready for response
+        UTF-8 encoded XML, ready to be sent without re-encoding
     """
-    xml_parts = [
-        '<?xml version="1.0" encoding="utf-8"?>',
-        "<source>",
-        f'<publisher>{escape("AARLP Recruitment")}</publisher>',
-        f"<publisherurl>{escape(base_url)}</publisherurl>",
-        f'<lastBuildDate>{datetime.utcnow().strftime("%a, %d %b %Y %H:%M:%S GMT")}</lastBuildDate>',
-    ]
-
+    buf = bytearray(_render_header(base_url))
     for job in jobs:
-        if not job.generated_jd:
-            continue
+        buf.extend(_render_job(job, base_url))
+    buf.extend(b"</source>")
+    return bytes(buf)
+
+
+def _render_header(base_url: str) -> bytes:
+    """Render the feed preamble up to the first job."""
+    # RFC 1123 date in GMT, same shape as the previous strftime format
+    build_date = formatdate(usegmt=True)
+    source = Element("source")
+    _add_text(source, "publisher", "AARLP Recruitment")
+    _add_text(source, "publisherurl", base_url)
+    _add_text(source, "lastBuildDate", build_date)
+
+    parts = [b'<?xml version="1.0" encoding="utf-8"?>', b"<source>"]
+    parts.extend(tostring(child, encoding="utf-8") for child in source)
+    return b"".join(parts)
+
+
+def _render_job(job: JobRecord, base_url: str) -> bytes:
+    """Render a single <job> element."""
+    jd = job.parsed_jd
 
-        jd = GeneratedJD.model_validate(job.generated_jd)
-        job_url = f"{base_url}/careers/{job.id}"
+    # Format date as required (often similar to RSS or specific per board,
+    # but ISO dates or standard RSS Dates are usually accepted)
+    date_posted = job.created_at.strftime("%Y-%m-%d")
 
-        # Format date as required (often similar to RSS or specific per board,
-        # but ISO dates or standard RSS Dates are usually accepted)
-        date_posted = job.created_at.strftime("%Y-%m-%d")
+    job_el = Element("job")
+    _add_text(job_el, "title", jd.job_title)
+    _add_text(job_el, "date", date_posted)
+    _add_text(job_el, "referencenumber", str(job.id))
+    _add_text(job_el, "url", f"{base_url}/careers/{job.id}")
+    _add_text(job_el, "company", job.company_name)
 
-        # Build description with CDATA to preserve HTML
-        description = f"<![CDATA[{_build_description_html(jd)}]]>"
+    if job.company_description:
+        _add_text(job_el, "companydescription", job.company_description)
 
-        xml_parts.append("<job>")
-        xml_parts.append(f"<title>{escape(jd.job_title)}</title>")
-        xml_parts.append(f"<date>{escape(date_posted)}</date>")
-        xml_parts.append(f"<referencenumber>{escape(str(job.id))}</referencenumber>")
-        xml_parts.append(f"<url>{escape(job_url)}</url>")
-        xml_parts.append(f"<company>{escape(job.company_name)}</company>")
+    _add_text(job_el, "city", jd.location or "Remote")
+    _add_text(job_el, "country", "US")  # Defaulting to US for now, could be dynamic
+    # HTML is carried as escaped text; parsers read it back identically to
+    # CDATA and it cannot be broken by a stray "]]>" in the JD
+    _add_text(job_el, "description", _build_description_html(jd))
 
-        if job.company_description:
-            xml_parts.append(
-                f"<companydescription>{escape(job.company_description)}</companydescription>"
-            )
+    if jd.salary_range:
+        _add_text(job_el, "salary", jd.salary_range)
 
-        xml_parts.append(f'<city>{escape(jd.location or "Remote")}</city>')
-        xml_parts.append(
-            "<country>US</country>"
-        )  # Defaulting to US for now, could be dynamic
-        xml_parts.append(f"<description>{description}</description>")
+    return tostring(job_el, encoding="utf-8")
 
-        if jd.salary_range:
-            xml_parts.append(f"<salary>{escape(jd.salary_range)}</salary>")
 
-        xml_parts.append("</job>")
+def _add_text(parent: Element, tag: str, text: str) -> None:
+    """Append a child element holding text; escaping is done by the serializer."""
+    SubElement(parent, tag).text = text
 
-    xml_parts.append("</source>")
-    return "".join(xml_parts)
+
+_DESCRIPTION_SECTIONS = (
+    ("responsibilities", b"<h3>Responsibilities</h3><ul>"),
+    ("requirements", b"<h3>Requirements</h3><ul>"),
+    ("benefits", b"<h3>Benefits</h3><ul>"),
+)
 
 
 def _build_description_html(jd: GeneratedJD) -> str:
-    """Build simple HTML description from JD sections."""
-    parts = [f"<p>{jd.summary}</p>"]
+    """Build simple HTML description from JD sections.
+
+    Writes pre-encoded markup into one bytearray instead of joining a list
+    of per-bullet f-strings, so long bullet lists don't churn small strings.
+    """
+    buf = bytearray()
+    append = buf.extend
+
+    append(b"<p>")
+    append(jd.summary.encode())
+    append(b"</p>")
 
     if jd.description:
-        parts.append(f"<p>{jd.description}</p>")
-
-    if jd.responsibilities:
-        parts.append("<h3>Responsibilities</h3><ul>")
-        for item in jd.responsibilities:
-            parts.append(f"<li>{item}</li>")
-        parts.append("</ul>")
-
-    if jd.requirements:
-        parts.append("<h3>Requirements</h3><ul>")
-        for item in jd.requirements:
-            parts.append(f"<li>{item}</li>")
-        parts.append("</ul>")
-
-    if jd.benefits:
-        parts.append("<h3>Benefits</h3><ul>")
-        for item in jd.benefits:
-            parts.append(f"<li>{item}</li>")
-        parts.append("</ul>")
-
-    return "".join(parts)
+        append(b"<p>")
+        append(jd.description.encode())
+        append(b"</p>")
+
+    for field, heading in _DESCRIPTION_SECTIONS:
+        items = getattr(jd, field)
+        if not items:
+            continue
+        append(heading)
+        for item in items:
+            append(b"<li>")
+            append(item.encode())
+            append(b"</li>")
+        append(b"</ul>")
+
+    return buf.decode()
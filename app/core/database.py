@@ -8,12 +8,13 @@ PostgreSQL + pgvector setup for:
 """
 
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import AsyncGenerator
 
-from sqlalchemy import Column, String, Text, Float, DateTime, Boolean, Integer, text
+from sqlalchemy import Column, String, Text, Float, DateTime, Boolean, Integer, event, text
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import Session, declarative_base
 
 from app.core.config import get_settings
 
@@ -25,35 +26,71 @@ Base = declarative_base()
 # Database Connection
 # ============================================================================
 
-_engine = None
-_session_factory = None
+_HAS_WRITES = "has_writes"
 
 
-def get_engine():
-    """Get or create the async engine."""
-    global _engine
-    if _engine is None:
-        settings = get_settings()
-        _engine = create_async_engine(
-            settings.database_url,
-            echo=settings.debug,
-            pool_size=5,
-            max_overflow=10,
-        )
-    return _engine
+class _WriteTrackingSession(Session):
+    """Session that notes in ``info`` whether its transaction has written."""
+
+
+@event.listens_for(_WriteTrackingSession, "after_flush")
+def _mark_flushed(session, flush_context):
+    session.info[_HAS_WRITES] = True
+
+
+@event.listens_for(_WriteTrackingSession, "do_orm_execute")
+def _mark_statement(orm_execute_state):
+    # Anything but an ORM select (bulk DML, raw text) counts as a write
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[_HAS_WRITES] = True
 
 
+@event.listens_for(_WriteTrackingSession, "after_commit")
+@event.listens_for(_WriteTrackingSession, "after_rollback")
+def _clear_writes(session):
+    session.info.pop(_HAS_WRITES, None)
+
+
+def _has_pending_writes(session: AsyncSession) -> bool:
+    """True if committing would persist anything."""
+    return bool(
+        session.info.get(_HAS_WRITES)
+        or session.new
+        or session.dirty
+        or session.deleted
+    )
+
+
+@lru_cache(maxsize=1)
+def get_engine():
+    """Get or create the async engine."""
+    # Register every model with Base.metadata; the models import Base from
+    # here, so this can't live at module top without a circular import
+    import app.models  # noqa: F401
+
+    settings = get_settings()
+    # PgBouncer in transaction mode can't keep per-connection prepared statements
+    connect_args = {"statement_cache_size": 0} if settings.db_pgbouncer else {}
+    return create_async_engine(
+        settings.database_url,
+        echo=settings.debug,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args=connect_args,
+    )
+
+
+@lru_cache(maxsize=1)
 def get_session_factory():
     """Get or create the session factory."""
-    global _session_factory
-    if _session_factory is None:
-        engine = get_engine()
-        _session_factory = async_sessionmaker(
-            engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
-    return _session_factory
+    return async_sessionmaker(
+        get_engine(),
+        class_=AsyncSession,
+        sync_session_class=_WriteTrackingSession,
+        expire_on_commit=False,
+    )
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -62,7 +99,10 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     async with factory() as session:
         try:
             yield session
-            await session.commit()
+            # Read-only requests skip the flush/COMMIT; closing the session
+            # ends their transaction
+            if session.in_transaction() and _has_pending_writes(session):
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -73,19 +113,14 @@ async def init_database():
     engine = get_engine()
     
     async with engine.begin() as conn:
-        # Import all models to ensure they are registered with Base.metadata
-        from app.jobs.models import JobRecord
-        from app.candidates.models import ApplicantRecord, PrescreeningResponseRecord
-        from app.interviews.models import InterviewRecord
-        from app.auth.models import User
-        
         # Create all tables
         await conn.run_sync(Base.metadata.create_all)
 
 
 async def close_database():
     """Close database connections."""
-    global _engine
-    if _engine:
-        await _engine.dispose()
-        _engine = None
+    if get_engine.cache_info().currsize:
+        await get_engine().dispose()
+    # The next caller gets a fresh engine and a factory bound to it
+    get_engine.cache_clear()
+    get_session_factory.cache_clear()
@@ -11,6 +11,9 @@ from typing import Any, Optional
 class AARLPException(Exception):
     """Base exception for all AARLP errors."""
 
+    # Slots keep raised errors from allocating an instance __dict__
+    __slots__ = ("message", "error_code", "details")
+
     def __init__(
         self,
         message: str,
@@ -30,6 +33,40 @@ class AARLPException(Exception):
             "details": self.details,
         }
 
+    def __reduce__(self):
+        # BaseException pickles only args and __dict__, which would drop the
+        # slot values and re-call subclass __init__ with the wrong arguments
+        return (
+            _restore_exception,
+            (
+                type(self),
+                self.args,
+                self.message,
+                self.error_code,
+                self.details,
+                getattr(self, "__dict__", None),
+            ),
+        )
+
+
+def _restore_exception(
+    cls: type[AARLPException],
+    args: tuple,
+    message: str,
+    error_code: str,
+    details: dict[str, Any],
+    state: Optional[dict[str, Any]],
+) -> AARLPException:
+    """Unpickle an AARLPException without re-running its __init__."""
+    exc = cls.__new__(cls)
+    exc.args = args
+    exc.message = message
+    exc.error_code = error_code
+    exc.details = details
+    if state:
+        exc.__dict__.update(state)
+    return exc
+
 
 # ============================================================================
 # Configuration Exceptions
@@ -39,6 +76,8 @@ class AARLPException(Exception):
 class ConfigurationError(AARLPException):
     """Raised when configuration is invalid or missing."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, config_key: Optional[str] = None) -> None:
         super().__init__(
             message=message,
@@ -55,6 +94,8 @@ class ConfigurationError(AARLPException):
 class DatabaseError(AARLPException):
     """Base exception for database-related errors."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, operation: Optional[str] = None) -> None:
         super().__init__(
             message=message,
@@ -66,6 +107,8 @@ class DatabaseError(AARLPException):
 class RecordNotFoundError(DatabaseError):
     """Raised when a requested record is not found."""
 
+    __slots__ = ()
+
     def __init__(self, resource: str, resource_id: str) -> None:
         super().__init__(
             message=f"{resource} with ID {resource_id} not found",
@@ -78,6 +121,8 @@ class RecordNotFoundError(DatabaseError):
 class DuplicateRecordError(DatabaseError):
     """Raised when attempting to create a duplicate record."""
 
+    __slots__ = ()
+
     def __init__(self, resource: str, identifier: str) -> None:
         super().__init__(
             message=f"{resource} with identifier {identifier} already exists",
@@ -94,6 +139,8 @@ class DuplicateRecordError(DatabaseError):
 class ExternalServiceError(AARLPException):
     """Base exception for external service failures."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         service: str,
@@ -115,6 +162,8 @@ class ExternalServiceError(AARLPException):
 class ForbiddenError(AARLPException):
     """Raised when a user attempts to access a resource they do not own."""
 
+    __slots__ = ()
+
     def __init__(self, resource: str, user_id: str) -> None:
         super().__init__(
             message="You do not have permission to access this resource",
@@ -131,6 +180,8 @@ class ForbiddenError(AARLPException):
 class ValidationError(AARLPException):
     """Raised when input validation fails."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, field: Optional[str] = None) -> None:
         super().__init__(
             message=message,
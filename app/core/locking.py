@@ -6,11 +6,14 @@ when multiple workers try to process the same job update simultaneously.
 """
 
 import asyncio
-import uuid
+import itertools
+import os
+import secrets
 from contextlib import asynccontextmanager
 from typing import Optional
 
-from redis.asyncio import Redis
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.commands.core import AsyncScript
 from redis.exceptions import LockError, ConnectionError, TimeoutError
 
 from app.core.config import get_settings
@@ -19,30 +22,96 @@ from app.core.logging import get_logger
 logger = get_logger("locking")
 
 _redis_client: Optional[Redis] = None
+_release_script: Optional[AsyncScript] = None
+_extend_script: Optional[AsyncScript] = None
+
+# Waiters block on this list instead of polling; a release pushes one wake-up
+LOCK_SIGNAL_TTL_SECONDS = 10  # Unconsumed wake-ups don't linger
+# Upper bound on a single wait, so locks freed by TTL expiry are still noticed;
+# must stay below the client socket_timeout
+LOCK_WAKEUP_INTERVAL_SECONDS = 1.0
+
+# Only delete if WE hold the lock (value matches lock_id), then wake one
+# waiter. The signal list is reset first so it never holds more than one token.
+LUA_RELEASE = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    redis.call("del", KEYS[1])
+    redis.call("del", KEYS[2])
+    redis.call("lpush", KEYS[2], "1")
+    redis.call("expire", KEYS[2], ARGV[2])
+    return 1
+else
+    return 0
+end
+"""
+
+# Only push the expiry out if WE still hold the lock
+LUA_EXTEND = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("expire", KEYS[1], ARGV[2])
+else
+    return 0
+end
+"""
+
+
+def _new_token_source() -> tuple[str, "itertools.count[int]"]:
+    """Random per-process prefix plus a counter for lock tokens."""
+    return f"{os.getpid()}:{secrets.token_hex(4)}", itertools.count()
+
+
+# Tokens only need to be unique among holders during the lock TTL. The random
+# prefix keeps them distinct across hosts (where PIDs can collide); the
+# counter avoids an os.urandom() call per acquisition.
+_TOKEN_PREFIX, _LOCK_SEQ = _new_token_source()
+
+
+def _reset_token_source() -> None:
+    """Start a fresh token sequence (run in forked children)."""
+    global _TOKEN_PREFIX, _LOCK_SEQ
+    _TOKEN_PREFIX, _LOCK_SEQ = _new_token_source()
+
+
+# Forked workers must not replay the parent's token sequence
+os.register_at_fork(after_in_child=_reset_token_source)
 
 
 async def get_redis() -> Redis:
     """Get or create singleton Redis client."""
-    global _redis_client
+    global _redis_client, _release_script, _extend_script
     if _redis_client is None:
         settings = get_settings()
-        _redis_client = Redis(
+        # Blocking pool: a burst of lock waiters queues for a free connection
+        # instead of failing with "Too many connections" and running unlocked
+        pool = BlockingConnectionPool(
             host=settings.redis_host,
             port=settings.redis_port,
             db=settings.redis_db,
+            password=settings.redis_password or None,
+            max_connections=settings.redis_max_connections,
+            timeout=2.0,
+            health_check_interval=30,
+            socket_keepalive=True,
             decode_responses=True,
             socket_timeout=2.0,
             socket_connect_timeout=2.0,
         )
+        # from_pool hands ownership to the client, so close() disconnects it
+        _redis_client = Redis.from_pool(pool)
+        # Sent by SHA after the first call (EVALSHA with EVAL fallback)
+        _release_script = _redis_client.register_script(LUA_RELEASE)
+        _extend_script = _redis_client.register_script(LUA_EXTEND)
     return _redis_client
 
 
 async def close_redis():
     """Close Redis connection. Call on app shutdown."""
-    global _redis_client
+    global _redis_client, _release_script, _extend_script
     if _redis_client:
         await _redis_client.close()
         _redis_client = None
+        _release_script = None
+        _extend_script = None
 
 
 @asynccontextmanager
@@ -50,6 +119,7 @@ async def distributed_lock(
     key: str,
     timeout: int = 300,  # 5 minutes max lock duration (safety valve)
     blocking_timeout: int = 5,  # Wait up to 5s for lock
+    keep_alive: bool = False,
 ):
     """
     Acquire a distributed lock for the given key.
@@ -62,6 +132,9 @@ async def distributed_lock(
         key: Unique lock identifier
         timeout: Auto-expiry in seconds (prevents deadlocks if worker crashes)
         blocking_timeout: How long to wait to acquire lock
+        keep_alive: Re-arm the expiry every timeout/3 seconds while held, so
+            work that outlives timeout keeps the lock (expiry still frees it
+            if this process dies)
 
     Raises:
         LockError: If lock cannot be acquired
@@ -76,26 +149,41 @@ async def distributed_lock(
         yield
         return
 
-    lock_id = str(uuid.uuid4())
+    # Bound now so a concurrent close_redis() can't swap it out before release
+    release_script = _release_script
+    extend_script = _extend_script
+    lock_id = f"{_TOKEN_PREFIX}:{next(_LOCK_SEQ)}"
     lock_key = f"lock:{key}"
+    signal_key = f"{lock_key}:release"
     acquired = False
+    renewer: Optional[asyncio.Task] = None
 
     try:
         try:
             # 1. Try to acquire
             logger.debug(f"Acquiring lock {lock_key}...")
 
+            # Raw SET NX EX, built once and reused by every retry; the SET
+            # response callback still maps "OK" to True and a miss to None
+            set_command = ("SET", lock_key, lock_id, "NX", "EX", timeout)
+
             # Fast path: try once
-            acquired = await redis.set(lock_key, lock_id, nx=True, ex=timeout)
+            acquired = await redis.execute_command(*set_command)
 
-            # Slow path: poll if allowed
+            # Slow path: block until the holder signals release (or timeout)
             if not acquired and blocking_timeout > 0:
-                start_time = asyncio.get_event_loop().time()
+                loop = asyncio.get_running_loop()
+                deadline = loop.time() + blocking_timeout
                 while not acquired:
-                    if asyncio.get_event_loop().time() - start_time > blocking_timeout:
+                    remaining = deadline - loop.time()
+                    # Redis truncates to whole ms and treats 0 as "forever"
+                    if remaining < 0.01:
                         break
-                    await asyncio.sleep(0.1)
-                    acquired = await redis.set(lock_key, lock_id, nx=True, ex=timeout)
+                    await redis.blpop(
+                        [signal_key],
+                        timeout=min(remaining, LOCK_WAKEUP_INTERVAL_SECONDS),
+                    )
+                    acquired = await redis.execute_command(*set_command)
         except (ConnectionError, TimeoutError, OSError) as e:
             logger.warning(
                 f"Redis unavailable during lock acquisition, skipping lock for {key}: {e}"
@@ -109,21 +197,36 @@ async def distributed_lock(
             )
 
         logger.debug(f"Lock acquired: {lock_key}")
+        if keep_alive:
+            renewer = asyncio.create_task(
+                _keep_lock_alive(extend_script, lock_key, lock_id, timeout)
+            )
         yield
 
     finally:
-        # 2. Key release (Lua script for atomicity)
+        if renewer is not None:
+            renewer.cancel()
+        # 2. Key release (registered Lua script for atomicity)
         if acquired:
             try:
-                # Only delete if WE hold the lock (value matches lock_id)
-                script = """
-                if redis.call("get", KEYS[1]) == ARGV[1] then
-                    return redis.call("del", KEYS[1])
-                else
-                    return 0
-                end
-                """
-                await redis.eval(script, 1, lock_key, lock_id)
+                await release_script(
+                    keys=[lock_key, signal_key],
+                    args=[lock_id, LOCK_SIGNAL_TTL_SECONDS],
+                )
                 logger.debug(f"Lock released: {lock_key}")
             except Exception as e:
                 logger.error(f"Error releasing lock {lock_key}: {e}")
+
+
+async def _keep_lock_alive(
+    extend_script: AsyncScript, lock_key: str, lock_id: str, timeout: int
+) -> None:
+    """Re-arm a held lock's expiry until cancelled."""
+    while True:
+        await asyncio.sleep(timeout / 3)
+        try:
+            if not await extend_script(keys=[lock_key], args=[lock_id, timeout]):
+                logger.warning(f"Lost lock {lock_key} before it could be renewed")
+                return
+        except Exception as e:
+            logger.warning(f"Could not renew lock {lock_key}: {e}")
@@ -9,32 +9,61 @@ Structured logging setup using Python's logging module with:
 - Performance metrics logging
 """
 
+import asyncio
+import atexit
+import copy
 import logging
+import queue
 import sys
-from datetime import datetime
-from typing import Any
-import json
+import time
+from typing import Any, Callable, TypeVar
 from contextvars import ContextVar
-from logging.handlers import RotatingFileHandler
+from functools import lru_cache, wraps
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+import orjson
+
 from app.core.config import get_settings
 
 
 # Context variable for request correlation ID
 correlation_id_var: ContextVar[str] = ContextVar("correlation_id", default="")
 
+# Background thread draining queued records into the file handlers
+_log_listener: QueueListener | None = None
+
+
+def _record_correlation_id(record: logging.LogRecord) -> str:
+    """Correlation ID captured at enqueue time, else the current context's."""
+    return getattr(record, "correlation_id", None) or correlation_id_var.get()
+
 
 class JSONFormatter(logging.Formatter):
     """JSON log formatter for structured logging in production."""
-    
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # (epoch second, "YYYY-MM-DDTHH:MM:SS") for the last second formatted
+        self._second_cache: tuple[int, str] = (-1, "")
+
+    def _format_timestamp(self, created: float) -> str:
+        """ISO 8601 UTC timestamp with microseconds, reusing the date part."""
+        second = int(created)
+        cached_second, prefix = self._second_cache
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second_cache = (second, prefix)
+        micros = min(round((created - second) * 1_000_000), 999_999)
+        return f"{prefix}.{micros:06d}Z"
+
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
-            "correlation_id": correlation_id_var.get(),
+            "correlation_id": _record_correlation_id(record),
         }
         
         # Add exception info if present
@@ -45,7 +74,9 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, "extra_data"):
             log_data.update(record.extra_data)
         
-        return json.dumps(log_data)
+        return orjson.dumps(
+            log_data, default=str, option=orjson.OPT_UTC_Z
+        ).decode("utf-8")
 
 
 class ColoredFormatter(logging.Formatter):
@@ -59,17 +90,25 @@ class ColoredFormatter(logging.Formatter):
         "CRITICAL": "\033[35m",  # Magenta
     }
     RESET = "\033[0m"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Colored, padded level column built once per level
+        self._prefixes = {
+            level: f"{color}{level:8}{self.RESET} | "
+            for level, color in self.COLORS.items()
+        }
     
     def format(self, record: logging.LogRecord) -> str:
-        color = self.COLORS.get(record.levelname, self.RESET)
-        correlation = correlation_id_var.get()
+        levelname = record.levelname
+        prefix = self._prefixes.get(levelname)
+        if prefix is None:
+            prefix = f"{self.RESET}{levelname:8}{self.RESET} | "
+        correlation = _record_correlation_id(record)
         correlation_str = f"[{correlation[:8]}] " if correlation else ""
         
         formatted = (
-            f"{color}{record.levelname:8}{self.RESET} | "
-            f"{record.name:25} | "
-            f"{correlation_str}"
-            f"{record.getMessage()}"
+            f"{prefix}{record.name:25} | {correlation_str}{record.getMessage()}"
         )
         
         if record.exc_info:
@@ -78,8 +117,26 @@ class ColoredFormatter(logging.Formatter):
         return formatted
 
 
+class ContextQueueHandler(QueueHandler):
+    """
+    Queue handler that snapshots request context before handing off.
+
+    The listener thread can't see the request's ContextVars, so the
+    correlation ID is copied onto the record. Unlike the stock prepare(),
+    exc_info is kept so JSONFormatter still emits a separate "exception".
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record.correlation_id = correlation_id_var.get()
+        return record
+
+
 def setup_logging() -> None:
     """Configure application logging based on environment."""
+    global _log_listener
     settings = get_settings()
     
     # Determine log level
@@ -118,6 +175,7 @@ def setup_logging() -> None:
         "": "app.log",  # Root logger fallback for core, main, etc.
     }
     
+    file_handlers = []
     for module_name, log_file in module_log_files.items():
         file_handler = RotatingFileHandler(
             logs_dir / log_file,
@@ -126,14 +184,21 @@ def setup_logging() -> None:
         )
         file_handler.setLevel(log_level)
         file_handler.setFormatter(JSONFormatter())
-        
         if module_name:
-            # Add handler to specific module logger
-            module_logger = logging.getLogger(module_name)
-            module_logger.addHandler(file_handler)
-        else:
-            # Add to root logger for everything else
-            root_logger.addHandler(file_handler)
+            # Same routing as a handler on the module logger: the module
+            # and its children only
+            file_handler.addFilter(logging.Filter(module_name))
+        file_handlers.append(file_handler)
+
+    # File writes (and rotation) happen on the listener thread, so logging
+    # from request handlers never blocks the event loop on disk I/O
+    shutdown_logging()
+    log_queue: queue.Queue = queue.Queue(-1)
+    _log_listener = QueueListener(
+        log_queue, *file_handlers, respect_handler_level=True
+    )
+    _log_listener.start()
+    root_logger.addHandler(ContextQueueHandler(log_queue))
     
     # Set log levels for noisy libraries
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -142,21 +207,43 @@ def setup_logging() -> None:
     logging.getLogger("asyncio").setLevel(logging.WARNING)
 
 
+def shutdown_logging() -> None:
+    """Flush queued records to the file handlers and stop the listener."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+
+
+atexit.register(shutdown_logging)
+
+
+@lru_cache(maxsize=256)
 def get_logger(name: str) -> logging.Logger:
-    """Get a logger with the given name."""
+    """Get a logger with the given name (memoized; skips logging's module lock)."""
     return logging.getLogger(name)
 
 
 class LoggerAdapter(logging.LoggerAdapter):
     """Logger adapter with extra context support."""
-    
+
+    def __init__(self, logger: logging.Logger, extra: dict[str, Any] | None = None):
+        super().__init__(logger, extra or {})
+        # Shared by every call that passes no extra of its own; logging only
+        # reads it when building the record
+        self._extra_payload = {"extra_data": self.extra}
+
     def process(
         self, msg: str, kwargs: dict[str, Any]
     ) -> tuple[str, dict[str, Any]]:
         # Add extra data to record
-        extra = kwargs.get("extra", {})
-        extra["extra_data"] = self.extra
-        kwargs["extra"] = extra
+        extra = kwargs.get("extra")
+        if extra is None:
+            kwargs["extra"] = self._extra_payload
+        else:
+            extra["extra_data"] = self.extra
         return msg, kwargs
 
 
@@ -170,10 +257,6 @@ def get_context_logger(name: str, **context: Any) -> LoggerAdapter:
 # Performance Logging
 # ============================================================================
 
-import time
-from functools import wraps
-from typing import Callable, TypeVar
-
 T = TypeVar("T")
 
 
@@ -189,41 +272,35 @@ def log_performance(
         threshold_ms: Log warning if execution exceeds this threshold
     """
     logger = get_logger(logger_name)
+    threshold_ns = int(threshold_ms * 1_000_000)
+
+    def _report(name: str, elapsed_ns: int) -> None:
+        # Only format when the record will actually be emitted
+        if elapsed_ns > threshold_ns:
+            logger.warning(f"SLOW: {name} completed in {elapsed_ns / 1e6:.2f}ms")
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{name} completed in {elapsed_ns / 1e6:.2f}ms")
     
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        @wraps(func)
-        async def async_wrapper(*args: Any, **kwargs: Any) -> T:
-            start = time.perf_counter()
-            try:
-                result = await func(*args, **kwargs)
-                return result
-            finally:
-                elapsed_ms = (time.perf_counter() - start) * 1000
-                log_msg = f"{func.__name__} completed in {elapsed_ms:.2f}ms"
-                
-                if elapsed_ms > threshold_ms:
-                    logger.warning(f"SLOW: {log_msg}")
-                else:
-                    logger.debug(log_msg)
-        
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> T:
+                start_ns = time.perf_counter_ns()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    _report(func.__name__, time.perf_counter_ns() - start_ns)
+
+            return async_wrapper
+
         @wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> T:
-            start = time.perf_counter()
+            start_ns = time.perf_counter_ns()
             try:
-                result = func(*args, **kwargs)
-                return result
+                return func(*args, **kwargs)
             finally:
-                elapsed_ms = (time.perf_counter() - start) * 1000
-                log_msg = f"{func.__name__} completed in {elapsed_ms:.2f}ms"
-                
-                if elapsed_ms > threshold_ms:
-                    logger.warning(f"SLOW: {log_msg}")
-                else:
-                    logger.debug(log_msg)
-        
-        import asyncio
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
+                _report(func.__name__, time.perf_counter_ns() - start_ns)
+
         return sync_wrapper
     
     return decorator
@@ -0,0 +1,204 @@
+"""
+Redis Streams Task Queue
+
+Durable background tasks on the shared Redis. Producers append tasks to a
+stream; workers (`python -m app.worker`) read them through a consumer
+group and acknowledge each one after it runs. A task left unacknowledged
+by a crashed worker is reclaimed by another worker once it has been idle
+for TASK_CLAIM_IDLE_SECONDS. Running tasks reset their idle time every
+TASK_HEARTBEAT_SECONDS, so however long they take they are never stolen.
+
+Tasks can carry a dedupe key: while a task with that key is queued, a
+second enqueue is dropped. The key is released when a worker starts it.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
+
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError, ResponseError
+
+from app.core.locking import get_redis
+from app.core.logging import get_logger
+
+logger = get_logger("task_queue")
+
+TASK_STREAM = "tasks"
+TASK_GROUP = "workers"
+TASK_STREAM_MAXLEN = 10_000  # Acknowledged history kept for inspection
+# Must stay below the Redis client's socket_timeout
+TASK_READ_BLOCK_MS = 1_000
+# Live tasks heartbeat well within this, so only dead workers' tasks qualify
+TASK_CLAIM_IDLE_SECONDS = 900
+TASK_HEARTBEAT_SECONDS = 60
+TASK_CLAIM_INTERVAL_SECONDS = 60
+TASK_RETRY_DELAY_SECONDS = 1.0  # Back-off while Redis is unreachable
+
+TaskHandler = Callable[..., Awaitable[None]]
+
+_handlers: dict[str, TaskHandler] = {}
+
+
+def task(name: str) -> Callable[[TaskHandler], TaskHandler]:
+    """Register a coroutine function as the handler for a task name."""
+
+    def register(handler: TaskHandler) -> TaskHandler:
+        _handlers[name] = handler
+        return handler
+
+    return register
+
+
+def _pending_key(dedupe_key: str) -> str:
+    return f"task:pending:{dedupe_key}"
+
+
+async def enqueue(
+    name: str,
+    payload: dict[str, Any],
+    dedupe_key: Optional[str] = None,
+    dedupe_ttl: int = TASK_CLAIM_IDLE_SECONDS,
+) -> bool:
+    """
+    Queue a task for a worker.
+
+    Args:
+        name: Registered task name
+        payload: JSON-serializable keyword arguments for the handler
+        dedupe_key: Drop this enqueue if a task with the same key is queued
+        dedupe_ttl: Seconds before an unclaimed dedupe key lapses
+
+    Returns:
+        True if queued, False if an identical task was already waiting
+
+    Raises:
+        RedisError, OSError: If Redis is unavailable
+    """
+    redis = await get_redis()
+    if dedupe_key and not await redis.set(
+        _pending_key(dedupe_key), "1", nx=True, ex=dedupe_ttl
+    ):
+        logger.info(f"Task {name} already queued for {dedupe_key}")
+        return False
+
+    await redis.xadd(
+        TASK_STREAM,
+        {"name": name, "payload": orjson.dumps(payload), "dedupe": dedupe_key or ""},
+        maxlen=TASK_STREAM_MAXLEN,
+        approximate=True,
+    )
+    return True
+
+
+async def _ensure_group(redis: Redis) -> None:
+    try:
+        await redis.xgroup_create(TASK_STREAM, TASK_GROUP, id="0", mkstream=True)
+    except ResponseError as e:
+        if "BUSYGROUP" not in str(e):
+            raise
+
+
+async def _heartbeat(redis: Redis, consumer: str, message_id: str) -> None:
+    """Keep resetting a running task's idle time so it isn't reclaimed."""
+    while True:
+        await asyncio.sleep(TASK_HEARTBEAT_SECONDS)
+        try:
+            # Claiming our own entry with JUSTID only resets its idle time
+            await redis.xclaim(
+                TASK_STREAM,
+                TASK_GROUP,
+                consumer,
+                min_idle_time=0,
+                message_ids=[message_id],
+                justid=True,
+            )
+        except (RedisError, OSError) as e:
+            logger.warning(f"Task {message_id} heartbeat failed: {e}")
+
+
+async def _process(
+    redis: Redis, consumer: str, message_id: str, fields: dict[str, str]
+) -> None:
+    """Run one task, then acknowledge it whether it succeeded or failed."""
+    name = fields.get("name", "")
+    handler = _handlers.get(name)
+    if handler is None:
+        logger.error(f"No handler registered for task {name!r}")
+    else:
+        heartbeat = asyncio.create_task(_heartbeat(redis, consumer, message_id))
+        try:
+            if fields.get("dedupe"):
+                await redis.delete(_pending_key(fields["dedupe"]))
+            await handler(**orjson.loads(fields.get("payload", "{}")))
+        except Exception:
+            logger.exception(f"Task {name} ({message_id}) failed")
+        finally:
+            heartbeat.cancel()
+    # Not reached on cancellation, so interrupted tasks are reclaimed later
+    try:
+        await redis.xack(TASK_STREAM, TASK_GROUP, message_id)
+    except (RedisError, OSError) as e:
+        logger.warning(f"Could not acknowledge task {message_id}, may rerun: {e}")
+
+
+async def run_worker(consumer: str, concurrency: int) -> None:
+    """
+    Consume tasks until cancelled.
+
+    Args:
+        consumer: Name of this worker within the consumer group
+        concurrency: Maximum tasks running at once
+    """
+    redis = await get_redis()
+    await _ensure_group(redis)
+    loop = asyncio.get_running_loop()
+    running: set[asyncio.Task] = set()
+    next_claim = loop.time()
+
+    def start(message_id: str, fields: dict[str, str]) -> None:
+        job = asyncio.create_task(_process(redis, consumer, message_id, fields))
+        running.add(job)
+        job.add_done_callback(running.discard)
+
+    logger.info(f"Worker {consumer} consuming {TASK_STREAM} ({concurrency} slots)")
+    try:
+        while True:
+            free = concurrency - len(running)
+            if free <= 0:
+                await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                continue
+
+            try:
+                if loop.time() >= next_claim:
+                    next_claim = loop.time() + TASK_CLAIM_INTERVAL_SECONDS
+                    # Reply is [next_id, messages] (plus deleted IDs on Redis 7)
+                    reclaimed = await redis.xautoclaim(
+                        TASK_STREAM,
+                        TASK_GROUP,
+                        consumer,
+                        min_idle_time=TASK_CLAIM_IDLE_SECONDS * 1000,
+                        count=free,
+                    )
+                    for message_id, fields in reclaimed[1]:
+                        logger.warning(f"Reclaimed stalled task {message_id}")
+                        start(message_id, fields)
+                    continue
+
+                entries = await redis.xreadgroup(
+                    TASK_GROUP,
+                    consumer,
+                    {TASK_STREAM: ">"},
+                    count=free,
+                    block=TASK_READ_BLOCK_MS,
+                )
+                for _, messages in entries or []:
+                    for message_id, fields in messages:
+                        start(message_id, fields)
+            except (RedisError, OSError) as e:
+                logger.warning(f"Task queue read failed, retrying: {e}")
+                await asyncio.sleep(TASK_RETRY_DELAY_SECONDS)
+    finally:
+        # Unfinished tasks stay unacknowledged and are reclaimed later
+        for job in running:
+            job.cancel()
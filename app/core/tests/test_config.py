@@ -48,6 +48,20 @@ class TestSettings:
 
         assert isinstance(origins, list)
         assert len(origins) > 0
+        assert settings.cors_origins_list is origins
+
+    def test_provider_settings_load_lazily(self):
+        """Provider sub-settings should be built on first access and cached."""
+        from app.core.config import Settings
+
+        with patch.dict(os.environ, {"TWILIO_ACCOUNT_SID": "AC123"}):
+            settings = Settings()
+            assert "twilio" not in settings.__dict__
+
+            twilio = settings.twilio
+
+        assert twilio.account_sid == "AC123"
+        assert settings.twilio is twilio
 
     def test_ai_provider_valid_values(self):
         """AI provider should be valid enum value."""
@@ -79,6 +93,15 @@ class TestDatabaseConfig:
 
         assert url.startswith("postgresql+asyncpg://")
 
+    def test_checkpoint_database_url_drops_driver(self):
+        """Checkpointer DSN should be the plain psycopg form of the URL."""
+        from app.core.config import Settings
+
+        settings = Settings(database_url="postgresql+asyncpg://u:p@db:5432/aarlp")
+
+        assert settings.checkpoint_database_url == "postgresql://u:p@db:5432/aarlp"
+        assert settings.checkpoint_database_url is settings.checkpoint_database_url
+
 
 class TestAWSConfig:
     """Tests for AWS configuration."""
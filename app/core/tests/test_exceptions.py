@@ -53,6 +53,18 @@ class TestAARLPException:
         assert result["message"] == "Test error"
         assert result["details"]["key"] == "value"
 
+    def test_pickle_round_trip(self):
+        """Pickled errors should keep their slot fields and subclass type."""
+        import pickle
+
+        exc = RecordNotFoundError("Job", "123")
+
+        restored = pickle.loads(pickle.dumps(exc))
+
+        assert type(restored) is RecordNotFoundError
+        assert str(restored) == str(exc)
+        assert restored.to_dict() == exc.to_dict()
+
 
 class TestRecordNotFoundError:
     """Tests for RecordNotFoundError."""
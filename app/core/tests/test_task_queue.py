@@ -0,0 +1,100 @@
+"""
+Core Task Queue Tests
+
+Unit tests for the Redis Streams task queue.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import orjson
+import pytest
+
+from app.core import task_queue
+
+
+@pytest.fixture
+def redis():
+    with patch.object(task_queue, "get_redis", AsyncMock()) as get_redis:
+        yield get_redis.return_value
+
+
+class TestEnqueue:
+    """Tests for queuing tasks."""
+
+    @pytest.mark.asyncio
+    async def test_appends_task_to_stream(self, redis):
+        """A new task should be added to the stream with its payload."""
+        redis.set.return_value = True
+
+        queued = await task_queue.enqueue("greet", {"name": "a"}, dedupe_key="k")
+
+        assert queued
+        fields = redis.xadd.call_args.args[1]
+        assert fields["name"] == "greet"
+        assert orjson.loads(fields["payload"]) == {"name": "a"}
+
+    @pytest.mark.asyncio
+    async def test_duplicate_is_dropped_while_queued(self, redis):
+        """A task whose dedupe key is still pending should not be re-added."""
+        redis.set.return_value = None
+
+        assert not await task_queue.enqueue("greet", {}, dedupe_key="k")
+        redis.xadd.assert_not_called()
+
+
+class TestProcess:
+    """Tests for running a queued task."""
+
+    @pytest.mark.asyncio
+    async def test_runs_handler_and_acknowledges(self, redis):
+        """The handler gets the payload; the dedupe key is released first."""
+        handler = AsyncMock()
+        fields = {"name": "greet", "payload": '{"name": "a"}', "dedupe": "k"}
+
+        with patch.dict(task_queue._handlers, {"greet": handler}):
+            await task_queue._process(redis, "w1", "1-0", fields)
+
+        handler.assert_awaited_once_with(name="a")
+        redis.delete.assert_awaited_once_with("task:pending:k")
+        redis.xack.assert_awaited_once_with("tasks", "workers", "1-0")
+
+    @pytest.mark.asyncio
+    async def test_failed_handler_is_still_acknowledged(self, redis):
+        """A task that raises should not be retried forever."""
+        handler = AsyncMock(side_effect=RuntimeError("boom"))
+        fields = {"name": "greet", "payload": "{}", "dedupe": ""}
+
+        with patch.dict(task_queue._handlers, {"greet": handler}):
+            await task_queue._process(redis, "w1", "1-0", fields)
+
+        redis.xack.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_long_running_task_is_not_reclaimed(self, redis):
+        """A task running past the heartbeat interval should keep resetting idle."""
+
+        async def handler():
+            await asyncio.sleep(0.05)
+
+        fields = {"name": "slow", "payload": "{}", "dedupe": ""}
+
+        with (
+            patch.dict(task_queue._handlers, {"slow": handler}),
+            patch.object(task_queue, "TASK_HEARTBEAT_SECONDS", 0.01),
+        ):
+            await task_queue._process(redis, "w1", "1-0", fields)
+            claims = redis.xclaim.await_count
+            await asyncio.sleep(0.03)
+
+        assert claims >= 2
+        redis.xclaim.assert_awaited_with(
+            "tasks",
+            "workers",
+            "w1",
+            min_idle_time=0,
+            message_ids=["1-0"],
+            justid=True,
+        )
+        assert redis.xclaim.await_count == claims  # Stops once acknowledged
+        redis.xack.assert_awaited_once()
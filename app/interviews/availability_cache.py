@@ -0,0 +1,154 @@
+"""
+Interviewer Availability Cache
+
+Redis cache for interviewer busy times, one entry per interviewer per UTC
+day, so sibling scheduling requests reuse a FreeBusy lookup instead of
+repeating it. Busy times are cached rather than free slots because they
+don't depend on interview length or working hours.
+
+Entries are keyed on a per-interviewer version counter that calendar push
+notifications and our own event inserts bump, so invalidating every cached
+day for an interviewer is a single INCR.
+
+Redis is treated as optional: on connection errors every read is a miss
+and every write is skipped, so scheduling falls back to Google Calendar.
+"""
+
+import hashlib
+import hmac
+from datetime import date, datetime
+
+import orjson
+from redis.exceptions import RedisError
+
+from app.core.config import get_settings
+from app.core.locking import get_redis
+from app.core.logging import get_logger
+from app.interviews.constants import (
+    AVAILABILITY_CACHE_TTL_SECONDS,
+    CALENDAR_WATCH_TTL_SECONDS,
+    AvailabilityCacheKeys,
+)
+
+logger = get_logger(__name__)
+
+BusyTimes = list[tuple[datetime, datetime]]
+
+
+async def get_cached_busy(
+    email: str, days: list[date]
+) -> tuple[int | None, BusyTimes | None]:
+    """
+    Read an interviewer's cached busy times for several days.
+
+    Returns:
+        The cache version to store fresh results under (None if Redis is
+        unavailable) and the busy times, or None unless every day is cached
+    """
+    try:
+        redis = await get_redis()
+        version = await redis.get(AvailabilityCacheKeys.version(email))
+        version = int(version) if version else 0
+        cached = await redis.mget(
+            [AvailabilityCacheKeys.busy(email, version, day) for day in days]
+        )
+    except (RedisError, OSError) as e:
+        logger.warning(f"Availability cache read failed for {email}: {e}")
+        return None, None
+
+    if not all(cached):
+        return version, None
+    parse = datetime.fromisoformat
+    return version, [
+        (parse(start), parse(end))
+        for entry in cached
+        for start, end in orjson.loads(entry)
+    ]
+
+
+async def store_busy(
+    email: str, version: int, busy_by_day: dict[date, BusyTimes]
+) -> None:
+    """
+    Cache an interviewer's busy times, one entry per day.
+
+    Args:
+        email: Interviewer calendar ID
+        version: Version returned by get_cached_busy before the lookup
+        busy_by_day: Busy intervals (naive UTC) overlapping each day
+    """
+    try:
+        redis = await get_redis()
+        async with redis.pipeline(transaction=False) as pipe:
+            for day, busy in busy_by_day.items():
+                pipe.set(
+                    AvailabilityCacheKeys.busy(email, version, day),
+                    orjson.dumps(busy),
+                    ex=AVAILABILITY_CACHE_TTL_SECONDS,
+                )
+            await pipe.execute()
+    except (RedisError, OSError) as e:
+        logger.warning(f"Availability cache write failed for {email}: {e}")
+
+
+async def invalidate_availability(email: str) -> None:
+    """Drop every cached day for an interviewer whose calendar changed."""
+    try:
+        redis = await get_redis()
+        await redis.incr(AvailabilityCacheKeys.version(email))
+    except (RedisError, OSError) as e:
+        logger.warning(f"Availability cache invalidation failed for {email}: {e}")
+
+
+async def claim_calendar_watch(email: str) -> bool:
+    """
+    Claim the right to subscribe to an interviewer's calendar changes.
+
+    Returns:
+        True if no subscription is active and this caller should create one
+    """
+    try:
+        redis = await get_redis()
+        return bool(
+            await redis.set(
+                AvailabilityCacheKeys.watch(email),
+                "1",
+                nx=True,
+                ex=CALENDAR_WATCH_TTL_SECONDS,
+            )
+        )
+    except (RedisError, OSError) as e:
+        logger.warning(f"Calendar watch claim failed for {email}: {e}")
+        return False
+
+
+async def release_calendar_watch(email: str) -> None:
+    """Release a watch claim whose subscription could not be created."""
+    try:
+        redis = await get_redis()
+        await redis.delete(AvailabilityCacheKeys.watch(email))
+    except (RedisError, OSError) as e:
+        logger.warning(f"Calendar watch release failed for {email}: {e}")
+
+
+def _token_digest(email: str) -> str:
+    secret = get_settings().secret_key.encode()
+    return hmac.new(secret, email.encode(), hashlib.sha256).hexdigest()
+
+
+def calendar_channel_token(email: str) -> str:
+    """Token sent with a push subscription, echoed back on every notification."""
+    return f"{_token_digest(email)}:{email}"
+
+
+def verify_channel_token(token: str) -> str | None:
+    """
+    Check a push notification token.
+
+    Returns:
+        The calendar ID it was issued for, or None if it isn't ours
+    """
+    digest, _, email = token.partition(":")
+    if email and hmac.compare_digest(digest, _token_digest(email)):
+        return email
+    return None
@@ -0,0 +1,31 @@
+"""
+Interviews Constants
+"""
+
+from datetime import date
+
+# Availability Cache
+AVAILABILITY_CACHE_TTL_SECONDS = 15 * 60  # Bounds staleness if a push is missed
+CALENDAR_WATCH_TTL_SECONDS = 7 * 24 * 60 * 60  # Push channel lifetime requested
+
+# Push notifications are sent here, relative to the calendar webhook base URL
+CALENDAR_WEBHOOK_PATH = "/interviews/webhooks/google/calendar"
+
+
+class AvailabilityCacheKeys:
+    """Factory for interviewer availability cache keys."""
+
+    @staticmethod
+    def version(email: str) -> str:
+        """Key for an interviewer's cache version counter."""
+        return f"availability:{email}:ver"
+
+    @staticmethod
+    def busy(email: str, version: int, day: date) -> str:
+        """Key for an interviewer's busy times on one UTC day."""
+        return f"availability:{email}:v{version}:{day.isoformat()}"
+
+    @staticmethod
+    def watch(email: str) -> str:
+        """Key marking an active calendar push subscription."""
+        return f"availability:{email}:watch"
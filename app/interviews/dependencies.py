@@ -0,0 +1,29 @@
+"""
+Interviews App Dependencies
+
+FastAPI dependency injection providers for the interviews module.
+"""
+
+from fastapi import Depends
+from openai import AsyncOpenAI
+
+from app.ai.client import get_openai_client
+from app.ai.openai_batcher import Batcher, get_openai_batcher
+from app.core.config import Settings, get_settings
+from app.interviews.services import CalendarService, VoiceService
+
+
+def get_voice_service(
+    settings: Settings = Depends(get_settings),
+    openai: AsyncOpenAI = Depends(get_openai_client),
+    batcher: Batcher = Depends(get_openai_batcher),
+) -> VoiceService:
+    """Provide a VoiceService sharing the process-wide OpenAI client and batcher."""
+    return VoiceService(settings, openai=openai, batcher=batcher)
+
+
+def get_calendar_service(
+    settings: Settings = Depends(get_settings),
+) -> CalendarService:
+    """Provide a CalendarService instance."""
+    return CalendarService(settings)
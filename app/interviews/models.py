@@ -40,5 +40,15 @@ class InterviewRecord(Base):
     candidate = relationship("ApplicantRecord")
     job = relationship("JobRecord")
 
-    # Composite index for querying schedules
-    __table_args__ = (Index("ix_interviews_job_status", "job_id", "status"),)
+    __table_args__ = (
+        # Composite index for querying schedules
+        Index("ix_interviews_job_status", "job_id", "status"),
+        # Covering index for a job's schedule, newest first: the listing
+        # columns ride along so the scan never touches the heap
+        Index(
+            "ix_interviews_job_sched",
+            job_id,
+            scheduled_datetime.desc(),
+            postgresql_include=["meeting_link", "interviewer_email", "status"],
+        ),
+    )
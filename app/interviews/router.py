@@ -2,13 +2,62 @@
 Interviews App Router (API Routes)
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Header, HTTPException, Request, Response
+from twilio.request_validator import RequestValidator
 
-# Placeholder router for Interviews app
-# Future endpoints: Webhook for voice call results, listing interviews, etc.
+from app.ai.constants import VoiceCallSettings
+from app.ai.voice_agent import resolve_call_status
+from app.core.config import get_settings
+from app.interviews.availability_cache import (
+    invalidate_availability,
+    verify_channel_token,
+)
+
+# Future endpoints: listing interviews, recording/response webhooks, etc.
 router = APIRouter()
 
+
 @router.get("/", tags=["Interviews"])
 async def list_interviews():
     """List scheduled interviews (Placeholder)."""
     return {"message": "Interview listing endpoint"}
+
+
+@router.post("/webhooks/twilio/status", tags=["Interviews"], include_in_schema=False)
+async def twilio_status_callback(
+    request: Request,
+    x_twilio_signature: str = Header(default=""),
+) -> Response:
+    """Wake the prescreening call waiting on this call's completion."""
+    twilio = get_settings().twilio
+    # An empty auth token would validate signatures made with an empty key
+    if not twilio.auth_token or not twilio.webhook_base_url:
+        raise HTTPException(status_code=404)
+
+    params = dict(await request.form())
+
+    # Twilio signs the exact URL it was given, so rebuild it from settings
+    # rather than from the (possibly proxied) request URL
+    url = twilio.webhook_base_url.rstrip("/") + VoiceCallSettings.STATUS_CALLBACK_PATH
+    validator = RequestValidator(twilio.auth_token)
+    if not validator.validate(url, params, x_twilio_signature):
+        raise HTTPException(status_code=403, detail="Invalid Twilio signature")
+
+    resolve_call_status(params.get("CallSid", ""), params.get("CallStatus", ""))
+    return Response(status_code=204)
+
+
+@router.post("/webhooks/google/calendar", tags=["Interviews"], include_in_schema=False)
+async def google_calendar_notification(
+    x_goog_channel_token: str = Header(default=""),
+    x_goog_resource_state: str = Header(default=""),
+) -> Response:
+    """Drop cached availability for an interviewer whose calendar changed."""
+    calendar_id = verify_channel_token(x_goog_channel_token)
+    if calendar_id is None:
+        raise HTTPException(status_code=403, detail="Invalid channel token")
+
+    # The first message on a new channel only confirms the subscription
+    if x_goog_resource_state != "sync":
+        await invalidate_availability(calendar_id)
+    return Response(status_code=204)
@@ -8,78 +8,202 @@ Google Calendar integration for:
 """
 
 import asyncio
-from datetime import datetime, timedelta
-from typing import Optional
+from contextlib import aclosing
+from datetime import date, datetime, time, timedelta, timezone
+from typing import TYPE_CHECKING, AsyncIterator, Optional
 from uuid import UUID, uuid4
+import json
 import os
-import pickle
+import threading
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+import numpy as np
 
-from app.core.config import get_settings
+from app.core.config import Settings, get_settings
+from app.core.logging import get_logger
 from app.candidates.schemas import Applicant
+from app.interviews import availability_cache
+from app.interviews.constants import CALENDAR_WATCH_TTL_SECONDS, CALENDAR_WEBHOOK_PATH
 from app.interviews.schemas import InterviewSlot, InterviewStatus
 
+# The Google client libraries are heavy and only needed once a real calendar
+# is used, so they're imported inside the functions that need them
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+    from google_auth_httplib2 import AuthorizedHttp
+
+
+logger = get_logger(__name__)
+settings = get_settings()
 
 # Google Calendar API scopes
 SCOPES = ['https://www.googleapis.com/auth/calendar']
 
+# Event text; notes, when given, follow the description after a blank line
+_SUMMARY_TEMPLATE = "Interview: {name} - {job_title}"
+_DESCRIPTION_TEMPLATE = (
+    "Technical Interview for {job_title}\n"
+    "\n"
+    "Candidate: {name}\n"
+    "Email: {email}\n"
+    "Phone: {phone}"
+)
+
+# Constant parts of every event body, shared rather than rebuilt per event;
+# the API client only serializes them
+_MEET_SOLUTION = {'type': 'hangoutsMeet'}
+_REMINDERS = {
+    'useDefault': False,
+    'overrides': [
+        {'method': 'email', 'minutes': 24 * 60},
+        {'method': 'popup', 'minutes': 30},
+    ],
+}
+
+# Days ahead to search for slots, widened only when too few are free
+SCHEDULING_HORIZONS_DAYS = (3, 7, 14)
+
+# Most sub-requests (and freebusy calendars) Google accepts per call
+CALENDAR_BATCH_LIMIT = 50
+
+# Process-wide credentials and API service, built on first use
+_calendar_lock = threading.Lock()
+_calendar_credentials: Optional["Credentials"] = None
+_calendar_service = None
+
+# httplib2 connections aren't thread-safe, so each executor thread sends
+# requests over its own authorized transport
+_thread_local = threading.local()
+
 
 # ============================================================================
 # Google Calendar Authentication
 # ============================================================================
 
-def get_calendar_credentials() -> Credentials:
+def get_calendar_credentials(
+    app_settings: Optional[Settings] = None,
+) -> "Credentials":
     """
     Get or refresh Google Calendar credentials.
     
     Uses OAuth2 flow for first-time authorization.
+    
+    Args:
+        app_settings: Settings to read file locations from (defaults to the
+            module's settings)
     """
-    settings = get_settings()
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    
+    calendar_settings = (app_settings or settings).google_calendar
     creds = None
     
-    # Load existing token
-    if os.path.exists(settings.google_calendar_token_file):
-        with open(settings.google_calendar_token_file, 'rb') as token:
-            creds = pickle.load(token)
+    # Load existing token (authorized-user JSON)
+    if os.path.exists(calendar_settings.token_file):
+        with open(calendar_settings.token_file, 'r', encoding='utf-8') as token:
+            try:
+                creds = Credentials.from_authorized_user_info(
+                    json.load(token), SCOPES
+                )
+            except ValueError:
+                # Unreadable or legacy (pickled) token: authorize again
+                creds = None
     
     # Refresh or get new credentials
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
             creds.refresh(Request())
         else:
-            if not os.path.exists(settings.google_calendar_credentials_file):
+            if not os.path.exists(calendar_settings.credentials_file):
                 raise FileNotFoundError(
                     f"Google Calendar credentials file not found: "
-                    f"{settings.google_calendar_credentials_file}"
+                    f"{calendar_settings.credentials_file}"
                 )
             
             flow = InstalledAppFlow.from_client_secrets_file(
-                settings.google_calendar_credentials_file,
+                calendar_settings.credentials_file,
                 SCOPES
             )
             creds = flow.run_local_server(port=0)
         
         # Save credentials for future use
-        with open(settings.google_calendar_token_file, 'wb') as token:
-            pickle.dump(creds, token)
+        with open(calendar_settings.token_file, 'w', encoding='utf-8') as token:
+            token.write(creds.to_json())
     
     return creds
 
 
 def get_calendar_service():
-    """Get Google Calendar API service."""
-    creds = get_calendar_credentials()
-    return build('calendar', 'v3', credentials=creds)
+    """
+    Get the Google Calendar API service.
+    
+    Credentials are loaded and the service built once per process; expired
+    access tokens are refreshed by the transport on the next request.
+    """
+    global _calendar_credentials, _calendar_service
+    if _calendar_service is None:
+        from googleapiclient.discovery import build
+        
+        with _calendar_lock:
+            if _calendar_service is None:
+                creds = get_calendar_credentials()
+                _calendar_service = build('calendar', 'v3', credentials=creds)
+                _calendar_credentials = creds
+    return _calendar_service
+
+
+def _calendar_http() -> "AuthorizedHttp":
+    """Authorized transport for the calling thread."""
+    http = getattr(_thread_local, "http", None)
+    if http is None:
+        import httplib2
+        from google_auth_httplib2 import AuthorizedHttp
+        
+        http = AuthorizedHttp(_calendar_credentials, http=httplib2.Http())
+        _thread_local.http = http
+    return http
 
 
 # ============================================================================
 # Availability Checking
 # ============================================================================
 
+async def iter_available_slots(
+    interviewer_email: str,
+    date_range_start: datetime,
+    date_range_end: datetime,
+    duration_minutes: int = 60,
+    working_hours: tuple[int, int] = (9, 17),
+) -> AsyncIterator[datetime]:
+    """
+    Yield available interview slots for an interviewer, earliest first.
+    
+    Busy times are fetched once up front (from the availability cache when
+    possible); slots are converted to datetimes only as the caller consumes
+    them.
+    
+    Args:
+        interviewer_email: Email of the interviewer
+        date_range_start: Start of date range to search
+        date_range_end: End of date range to search
+        duration_minutes: Required duration for interview
+        working_hours: Tuple of (start_hour, end_hour) in 24h format
+    """
+    busy_by_calendar = await cached_busy_times(
+        [interviewer_email], date_range_start, date_range_end
+    )
+    
+    free = _free_slot_array(
+        busy_by_calendar[interviewer_email],
+        date_range_start,
+        date_range_end,
+        duration_minutes,
+        working_hours,
+    )
+    for slot in free:
+        yield slot.item()
+
+
 async def get_available_slots(
     interviewer_email: str,
     date_range_start: datetime,
@@ -100,52 +224,271 @@ async def get_available_slots(
     Returns:
         List of available datetime slots
     """
-    loop = asyncio.get_event_loop()
+    return [
+        slot
+        async for slot in iter_available_slots(
+            interviewer_email,
+            date_range_start,
+            date_range_end,
+            duration_minutes,
+            working_hours,
+        )
+    ]
+
+
+async def _get_calendar_service_async():
+    """Cached service, loading credentials off the event loop on first use."""
+    if _calendar_service is not None:
+        return _calendar_service
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, get_calendar_service)
+
+
+def _execute(request):
+    """Run a prepared API request on this thread's transport. Blocking."""
+    return request.execute(http=_calendar_http())
+
+
+async def query_busy_times(
+    calendar_ids: list[str],
+    date_range_start: datetime,
+    date_range_end: datetime,
+) -> dict[str, list[tuple[datetime, datetime]]]:
+    """
+    Fetch busy intervals for several calendars in as few freebusy calls as
+    the API allows (one per CALENDAR_BATCH_LIMIT calendars).
     
-    def _get_busy_times():
-        service = get_calendar_service()
-        
-        body = {
-            "timeMin": date_range_start.isoformat() + "Z",
-            "timeMax": date_range_end.isoformat() + "Z",
-            "items": [{"id": interviewer_email}],
-        }
-        
-        result = service.freebusy().query(body=body).execute()
-        
-        busy_times = []
-        for busy in result["calendars"].get(interviewer_email, {}).get("busy", []):
-            start = datetime.fromisoformat(busy["start"].replace("Z", "+00:00"))
-            end = datetime.fromisoformat(busy["end"].replace("Z", "+00:00"))
-            busy_times.append((start, end))
-        
-        return busy_times
+    Request bodies are built and responses parsed on the event loop; only
+    the HTTP calls run in the executor.
+    """
+    loop = asyncio.get_running_loop()
+    service = await _get_calendar_service_async()
     
-    busy_times = await loop.run_in_executor(None, _get_busy_times)
+    time_min = date_range_start.isoformat() + "Z"
+    time_max = date_range_end.isoformat() + "Z"
+    chunks = [
+        calendar_ids[offset:offset + CALENDAR_BATCH_LIMIT]
+        for offset in range(0, len(calendar_ids), CALENDAR_BATCH_LIMIT)
+    ]
+    requests = [
+        service.freebusy().query(body={
+            "timeMin": time_min,
+            "timeMax": time_max,
+            "items": [{"id": calendar_id} for calendar_id in chunk],
+        })
+        for chunk in chunks
+    ]
+    results = await asyncio.gather(
+        *(loop.run_in_executor(None, _execute, request) for request in requests)
+    )
     
-    # Generate available slots
-    available_slots = []
-    current = date_range_start.replace(minute=0, second=0, microsecond=0)
+    # fromisoformat parses Google's "Z" suffix natively on Python 3.11+
+    parse = datetime.fromisoformat
+    busy_by_calendar: dict[str, list[tuple[datetime, datetime]]] = {}
+    for chunk, result in zip(chunks, results):
+        calendars = result["calendars"]
+        for calendar_id in chunk:
+            busy_by_calendar[calendar_id] = [
+                (parse(busy["start"]), parse(busy["end"]))
+                for busy in calendars.get(calendar_id, {}).get("busy", [])
+            ]
     
-    while current < date_range_end:
-        # Check if within working hours
-        if working_hours[0] <= current.hour < working_hours[1]:
-            slot_end = current + timedelta(minutes=duration_minutes)
-            
-            # Check if slot conflicts with any busy time
-            is_available = True
-            for busy_start, busy_end in busy_times:
-                if current < busy_end and slot_end > busy_start:
-                    is_available = False
-                    break
-            
-            if is_available:
-                available_slots.append(current)
-        
-        # Move to next slot (30-minute increments)
-        current += timedelta(minutes=30)
+    return busy_by_calendar
+
+
+async def cached_busy_times(
+    calendar_ids: list[str],
+    date_range_start: datetime,
+    date_range_end: datetime,
+) -> dict[str, list[tuple[datetime, datetime]]]:
+    """
+    Busy intervals (naive UTC) per calendar, like query_busy_times, but
+    served from the availability cache where possible.
+    
+    Calendars missing any day of the range are fetched together, over whole
+    UTC days so each day can be cached on its own, and subscribed to push
+    notifications so later changes invalidate them.
+    """
+    first_day = date_range_start.date()
+    last_day = (date_range_end - timedelta(microseconds=1)).date()
+    days = [
+        first_day + timedelta(days=offset)
+        for offset in range((last_day - first_day).days + 1)
+    ]
     
-    return available_slots
+    lookups = await asyncio.gather(
+        *(availability_cache.get_cached_busy(c, days) for c in calendar_ids)
+    )
+    busy_by_calendar: dict[str, list[tuple[datetime, datetime]]] = {}
+    versions: dict[str, Optional[int]] = {}
+    for calendar_id, (version, cached) in zip(calendar_ids, lookups):
+        if cached is None:
+            versions[calendar_id] = version
+        else:
+            busy_by_calendar[calendar_id] = cached
+    
+    if versions:
+        fetched = await query_busy_times(
+            list(versions),
+            datetime.combine(first_day, time.min),
+            datetime.combine(last_day + timedelta(days=1), time.min),
+        )
+        writes = []
+        for calendar_id, version in versions.items():
+            busy = [
+                (_naive_utc(start), _naive_utc(end))
+                for start, end in fetched[calendar_id]
+            ]
+            busy_by_calendar[calendar_id] = busy
+            # No version means Redis is down; don't subscribe to a cache we can't use
+            if version is not None:
+                writes.append(
+                    availability_cache.store_busy(
+                        calendar_id, version, _busy_by_day(busy, days)
+                    )
+                )
+                writes.append(_ensure_calendar_watch(calendar_id))
+        await asyncio.gather(*writes)
+    
+    return {
+        calendar_id: [
+            (start, end)
+            for start, end in busy_by_calendar[calendar_id]
+            if start < date_range_end and end > date_range_start
+        ]
+        for calendar_id in calendar_ids
+    }
+
+
+def _busy_by_day(
+    busy_times: list[tuple[datetime, datetime]],
+    days: list[date],
+) -> dict[date, list[tuple[datetime, datetime]]]:
+    """Group naive UTC busy intervals under every day they overlap."""
+    by_day = {}
+    for day in days:
+        day_start = datetime.combine(day, time.min)
+        day_end = day_start + timedelta(days=1)
+        by_day[day] = [
+            (start, end)
+            for start, end in busy_times
+            if start < day_end and end > day_start
+        ]
+    return by_day
+
+
+async def _ensure_calendar_watch(calendar_id: str) -> None:
+    """Subscribe to changes on a calendar whose busy times were just cached."""
+    base_url = settings.google_calendar.webhook_base_url
+    if not base_url or not await availability_cache.claim_calendar_watch(calendar_id):
+        return
+    
+    loop = asyncio.get_running_loop()
+    service = await _get_calendar_service_async()
+    request = service.events().watch(
+        calendarId=calendar_id,
+        body={
+            "id": uuid4().hex,
+            "type": "web_hook",
+            "address": base_url.rstrip("/") + CALENDAR_WEBHOOK_PATH,
+            "token": availability_cache.calendar_channel_token(calendar_id),
+            "params": {"ttl": str(CALENDAR_WATCH_TTL_SECONDS)},
+        },
+    )
+    try:
+        await loop.run_in_executor(None, _execute, request)
+    except Exception as e:
+        # Cached entries still expire on their own; retry on a later lookup
+        logger.warning("Calendar watch failed for %s: %s", calendar_id, e)
+        await availability_cache.release_calendar_watch(calendar_id)
+
+
+def _naive_utc(moment: datetime) -> datetime:
+    """Drop the offset from an aware datetime after converting to UTC."""
+    if moment.tzinfo is None:
+        return moment
+    return moment.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _merge_busy_times(
+    busy_times: list[tuple[datetime, datetime]],
+) -> tuple[list[datetime], list[datetime]]:
+    """
+    Sort and merge busy intervals into parallel start/end lists.
+    
+    Google returns aware UTC datetimes while the scheduler works in naive
+    UTC, so offsets are normalized away here. After merging, both lists are
+    ascending and the intervals are disjoint.
+    """
+    starts: list[datetime] = []
+    ends: list[datetime] = []
+    for start, end in sorted(busy_times):
+        start, end = _naive_utc(start), _naive_utc(end)
+        if ends and start <= ends[-1]:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+def _find_free_slots(
+    busy_times: list[tuple[datetime, datetime]],
+    date_range_start: datetime,
+    date_range_end: datetime,
+    duration_minutes: int,
+    working_hours: tuple[int, int],
+) -> list[datetime]:
+    """Free slots as datetimes; see _free_slot_array."""
+    return _free_slot_array(
+        busy_times,
+        date_range_start,
+        date_range_end,
+        duration_minutes,
+        working_hours,
+    ).tolist()
+
+
+def _free_slot_array(
+    busy_times: list[tuple[datetime, datetime]],
+    date_range_start: datetime,
+    date_range_end: datetime,
+    duration_minutes: int,
+    working_hours: tuple[int, int],
+) -> np.ndarray:
+    """
+    Filter the 30-minute slot grid against working hours and busy times.
+    
+    The grid is a datetime64 array; working hours are one mask and the
+    overlap test is a vectorized bisect (searchsorted) over the merged busy
+    starts, so each slot only checks the one interval that can overlap it.
+    """
+    first = date_range_start.replace(minute=0, second=0, microsecond=0)
+    grid = np.arange(
+        np.datetime64(first, "m"),
+        np.datetime64(date_range_end, "us"),
+        np.timedelta64(30, "m"),
+    ).astype("datetime64[us]")
+    
+    # Hours since the epoch, mod 24, is the wall-clock hour of naive UTC.
+    # start <= hour < end as one unsigned compare: hours before the start
+    # wrap around to huge values
+    work_start, work_end = working_hours
+    hours = grid.astype("datetime64[h]").astype(np.int64) % 24
+    mask = (hours - work_start).astype(np.uint64) < max(work_end - work_start, 0)
+    
+    busy_starts, busy_ends = _merge_busy_times(busy_times)
+    if busy_starts:
+        starts = np.array(busy_starts, dtype="datetime64[us]")
+        ends = np.array(busy_ends, dtype="datetime64[us]")
+        slot_ends = grid + np.timedelta64(duration_minutes, "m")
+        # Last busy interval starting before each slot ends; disjoint sorted
+        # intervals mean it is the only one that can overlap
+        idx = np.searchsorted(starts, slot_ends, side="left")
+        conflict = (idx > 0) & (ends[np.maximum(idx - 1, 0)] > grid)
+        mask &= ~conflict
+    
+    return grid[mask]
 
 
 # ============================================================================
@@ -174,62 +517,128 @@ async def create_interview_event(
     Returns:
         InterviewSlot with calendar event details
     """
-    loop = asyncio.get_event_loop()
+    body = _build_event(
+        candidate,
+        interviewer_email,
+        scheduled_datetime,
+        duration_minutes,
+        job_title,
+        notes,
+    )
     
-    def _create_event():
-        service = get_calendar_service()
-        
-        end_time = scheduled_datetime + timedelta(minutes=duration_minutes)
-        
-        event = {
-            'summary': f"Interview: {candidate.name} - {job_title}",
-            'description': f"""
-Technical Interview for {job_title}
-
-Candidate: {candidate.name}
-Email: {candidate.email}
-Phone: {candidate.phone or 'N/A'}
-
-{notes or ''}
-            """.strip(),
-            'start': {
-                'dateTime': scheduled_datetime.isoformat(),
-                'timeZone': 'UTC',
-            },
-            'end': {
-                'dateTime': end_time.isoformat(),
-                'timeZone': 'UTC',
-            },
-            'attendees': [
-                {'email': interviewer_email},
-                {'email': candidate.email},
-            ],
-            'conferenceData': {
-                'createRequest': {
-                    'requestId': str(uuid4()),
-                    'conferenceSolutionKey': {'type': 'hangoutsMeet'},
-                },
-            },
-            'reminders': {
-                'useDefault': False,
-                'overrides': [
-                    {'method': 'email', 'minutes': 24 * 60},
-                    {'method': 'popup', 'minutes': 30},
-                ],
+    loop = asyncio.get_running_loop()
+    service = await _get_calendar_service_async()
+    request = service.events().insert(
+        calendarId='primary',
+        body=body,
+        conferenceDataVersion=1,
+        sendUpdates='all',
+    )
+    event = await loop.run_in_executor(None, _execute, request)
+    await availability_cache.invalidate_availability(interviewer_email)
+    
+    return _slot_from_event(
+        event,
+        candidate,
+        interviewer_email,
+        scheduled_datetime,
+        duration_minutes,
+        notes,
+        datetime.now(timezone.utc),
+    )
+
+
+def _build_event(
+    candidate: Applicant,
+    interviewer_email: str,
+    scheduled_datetime: datetime,
+    duration_minutes: int,
+    job_title: str,
+    notes: Optional[str],
+) -> dict:
+    """Google Calendar event body for an interview."""
+    end_time = scheduled_datetime + timedelta(minutes=duration_minutes)
+    
+    description = _DESCRIPTION_TEMPLATE.format(
+        job_title=job_title,
+        name=candidate.name,
+        email=candidate.email,
+        phone=candidate.phone or 'N/A',
+    )
+    if notes:
+        description = f"{description}\n\n{notes.rstrip()}"
+    
+    return {
+        'summary': _SUMMARY_TEMPLATE.format(name=candidate.name, job_title=job_title),
+        'description': description,
+        'start': {
+            'dateTime': scheduled_datetime.isoformat(),
+            'timeZone': 'UTC',
+        },
+        'end': {
+            'dateTime': end_time.isoformat(),
+            'timeZone': 'UTC',
+        },
+        'attendees': [
+            {'email': interviewer_email},
+            {'email': candidate.email},
+        ],
+        'conferenceData': {
+            'createRequest': {
+                'requestId': str(uuid4()),
+                'conferenceSolutionKey': _MEET_SOLUTION,
             },
-        }
-        
-        created_event = service.events().insert(
-            calendarId='primary',
-            body=event,
-            conferenceDataVersion=1,
-            sendUpdates='all',
-        ).execute()
-        
-        return created_event
+        },
+        'reminders': _REMINDERS,
+    }
+
+
+def _insert_events(events: list[dict]) -> list[dict | Exception]:
+    """
+    Insert events through the batch endpoint, CALENDAR_BATCH_LIMIT per HTTP
+    request. Blocking.
+    
+    Returns the created event or the exception for each input, in order.
+    """
+    service = get_calendar_service()
+    results: list[dict | Exception] = [None] * len(events)
     
-    event = await loop.run_in_executor(None, _create_event)
+    def _collect(request_id, response, exception):
+        results[int(request_id)] = exception if exception is not None else response
     
+    for offset in range(0, len(events), CALENDAR_BATCH_LIMIT):
+        indexes = range(offset, min(offset + CALENDAR_BATCH_LIMIT, len(events)))
+        batch = service.new_batch_http_request(callback=_collect)
+        for index in indexes:
+            batch.add(
+                service.events().insert(
+                    calendarId='primary',
+                    body=events[index],
+                    conferenceDataVersion=1,
+                    sendUpdates='all',
+                ),
+                request_id=str(index),
+            )
+        try:
+            batch.execute(http=_calendar_http())
+        except Exception as e:
+            # The whole HTTP request failed; every event in it did too
+            for index in indexes:
+                results[index] = e
+    
+    return results
+
+
+def _slot_from_event(
+    event: dict,
+    candidate: Applicant,
+    interviewer_email: str,
+    scheduled_datetime: datetime,
+    duration_minutes: int,
+    notes: Optional[str],
+    created_at: datetime,
+) -> InterviewSlot:
+    """Build the InterviewSlot for a created calendar event."""
     # Extract meeting link
     meeting_link = None
     if 'conferenceData' in event:
@@ -239,7 +648,8 @@ Phone: {candidate.phone or 'N/A'}
                 meeting_link = ep.get('uri')
                 break
     
-    return InterviewSlot(
+    # Every field is produced here, so skip validation
+    return InterviewSlot.model_construct(
         id=uuid4(),
         candidate_id=candidate.id,
         job_id=uuid4(),  # Would be passed in production
@@ -250,7 +660,7 @@ Phone: {candidate.phone or 'N/A'}
         interviewer_email=interviewer_email,
         status=InterviewStatus.SCHEDULED,
         notes=notes,
-        created_at=datetime.utcnow(),
+        created_at=created_at,
     )
 
 
@@ -284,35 +694,75 @@ async def schedule_interviews(
         # Would get from job configuration in production
         raise ValueError("Interviewer email is required")
     
+    if not candidates:
+        return []
+    
+    now = datetime.now(timezone.utc)
+    
     if not start_date:
-        start_date = datetime.utcnow() + timedelta(days=1)
+        # The slot grid works in naive UTC
+        start_date = now.replace(tzinfo=None) + timedelta(days=1)
         start_date = start_date.replace(hour=9, minute=0, second=0, microsecond=0)
     
-    end_date = start_date + timedelta(days=14)  # Look 2 weeks ahead
-    
-    # Get available slots
-    available_slots = await get_available_slots(
-        interviewer_email=interviewer_email,
-        date_range_start=start_date,
-        date_range_end=end_date,
-        duration_minutes=duration_minutes,
-    )
+    # Widen the search (up to 2 weeks ahead) only while slots are short,
+    # taking no more slots than there are candidates
+    for horizon_days in SCHEDULING_HORIZONS_DAYS:
+        available_slots = []
+        slots = iter_available_slots(
+            interviewer_email=interviewer_email,
+            date_range_start=start_date,
+            date_range_end=start_date + timedelta(days=horizon_days),
+            duration_minutes=duration_minutes,
+        )
+        async with aclosing(slots):
+            async for slot in slots:
+                available_slots.append(slot)
+                if len(available_slots) == len(candidates):
+                    break
+        if len(available_slots) == len(candidates):
+            break
     
     if len(available_slots) < len(candidates):
-        print(f"Warning: Only {len(available_slots)} slots available for {len(candidates)} candidates")
+        logger.warning(
+            "Only %d slots available for %d candidates",
+            len(available_slots),
+            len(candidates),
+        )
+    
+    pairs = list(zip(candidates, available_slots))
+    events = [
+        _build_event(
+            candidate,
+            interviewer_email,
+            slot,
+            duration_minutes,
+            "Technical Interview",
+            None,
+        )
+        for candidate, slot in pairs
+    ]
+    
+    # One batch HTTP request carries up to CALENDAR_BATCH_LIMIT inserts
+    loop = asyncio.get_running_loop()
+    results = await loop.run_in_executor(None, _insert_events, events)
+    if events:
+        await availability_cache.invalidate_availability(interviewer_email)
     
     scheduled = []
-    for candidate, slot in zip(candidates, available_slots):
-        try:
-            interview = await create_interview_event(
-                candidate=candidate,
-                interviewer_email=interviewer_email,
-                scheduled_datetime=slot,
-                duration_minutes=duration_minutes,
+    for (candidate, slot), result in zip(pairs, results):
+        if isinstance(result, Exception):
+            logger.error(
+                "Error scheduling interview for %s: %s",
+                candidate.name,
+                result,
+                exc_info=result,
             )
-            scheduled.append(interview)
-        except Exception as e:
-            print(f"Error scheduling interview for {candidate.name}: {e}")
+            continue
+        scheduled.append(
+            _slot_from_event(
+                result, candidate, interviewer_email, slot, duration_minutes, None, now
+            )
+        )
     
     return scheduled
 
@@ -321,6 +771,8 @@ async def schedule_interviews(
 # Mock Scheduler for Testing
 # ============================================================================
 
+_MOCK_RANDOM_BYTES = 24
+
 async def mock_schedule_interviews(
     job_id: str,
     candidates: list[Applicant],
@@ -329,22 +781,29 @@ async def mock_schedule_interviews(
     Mock interview scheduling for testing without Google Calendar.
     """
     scheduled = []
-    base_time = datetime.utcnow() + timedelta(days=1)
+    now = datetime.now(timezone.utc)
+    base_time = now + timedelta(days=1)
+    job_uuid = UUID(job_id) if isinstance(job_id, str) else job_id
+    
+    # One urandom read for the whole batch: per candidate, 16 bytes for the
+    # slot UUID and 4 each for the mock meeting and event IDs
+    random_bytes = os.urandom(_MOCK_RANDOM_BYTES * len(candidates))
     
     for i, candidate in enumerate(candidates):
         slot_time = base_time + timedelta(hours=i * 2)
+        chunk = random_bytes[i * _MOCK_RANDOM_BYTES:(i + 1) * _MOCK_RANDOM_BYTES]
         
-        interview = InterviewSlot(
-            id=uuid4(),
+        interview = InterviewSlot.model_construct(
+            id=UUID(bytes=chunk[:16], version=4),
             candidate_id=candidate.id,
-            job_id=UUID(job_id) if isinstance(job_id, str) else job_id,
+            job_id=job_uuid,
             scheduled_datetime=slot_time,
             duration_minutes=60,
-            meeting_link=f"https://meet.google.com/mock-{uuid4().hex[:8]}",
-            calendar_event_id=f"mock_event_{uuid4().hex[:8]}",
+            meeting_link=f"https://meet.google.com/mock-{chunk[16:20].hex()}",
+            calendar_event_id=f"mock_event_{chunk[20:24].hex()}",
             interviewer_email="interviewer@example.com",
             status=InterviewStatus.SCHEDULED,
-            created_at=datetime.utcnow(),
+            created_at=now,
         )
         scheduled.append(interview)
     
@@ -4,8 +4,9 @@ Interviews App Schemas
 
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from uuid import UUID, uuid4
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
 
 class InterviewStatus(str, Enum):
     """Status of a scheduled interview."""
@@ -21,10 +22,22 @@ class PrescreeningQuestion(BaseModel):
     question_text: str = Field(..., description="The question to ask the candidate")
     expected_keywords: list[str] = Field(default_factory=list, description="Keywords expected in a good answer")
     max_score: int = Field(default=100, ge=0, le=100, description="Maximum score for this question")
+    
+    @cached_property
+    def scoring_prompt(self) -> str:
+        """Question part of the scoring prompt, built once and reused per answer."""
+        return (
+            f"Question: {self.question_text}. "
+            f"Keywords: {', '.join(self.expected_keywords)}. "
+            f"Max score: {self.max_score}."
+        )
 
 class InterviewSlot(BaseModel):
     """Scheduled interview details."""
     
+    # Built once by the scheduler and only read afterwards
+    model_config = ConfigDict(frozen=True)
+    
     id: UUID = Field(default_factory=uuid4)
     candidate_id: UUID
     job_id: UUID
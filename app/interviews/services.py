@@ -2,24 +2,47 @@
 Interviews App Services
 """
 
-from datetime import datetime, timedelta
-from typing import Optional, Protocol
-from uuid import uuid4
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Optional, Protocol
+from uuid import UUID, uuid4
 
 from app.core.config import Settings
 from app.core.logging import log_performance, get_logger
 from app.core.exceptions import ExternalServiceError
 from app.ai.exceptions import TwilioError
+from app.ai.client import get_openai_client
+from app.ai.constants import LLMCacheSettings
+from app.ai.openai_batcher import Batcher, get_openai_batcher
+from app.ai.voice_scoring import keyword_prescore
+from app.ai.llm_cache import (
+    CacheBackend,
+    RedisCacheBackend,
+    normalize_transcript,
+    score_cache_key,
+)
 from app.interviews.exceptions import GoogleCalendarError
 
 from app.candidates.schemas import Applicant, CandidateResponse
 from app.interviews.schemas import PrescreeningQuestion, InterviewSlot, InterviewStatus
 from app.interviews.models import InterviewRecord
 
-from app.ai.voice_agent import TwilioVoiceProvider, MockVoiceProvider, NovaSonicVoiceProvider
-from app.interviews.scheduler import get_calendar_service, create_interview_event
+from app.ai.voice_agent import (
+    TwilioVoiceProvider,
+    MockVoiceProvider,
+    NovaSonicVoiceProvider,
+)
+from app.interviews.scheduler import (
+    get_calendar_service,
+    create_interview_event,
+    query_busy_times,
+)
 from openai import AsyncOpenAI
-import json
+import orjson
+
+# Fixed scores for answers that are empty or could not be scored
+_NO_RESPONSE = (0, "No response")
+_SCORING_FAILED = (0, "Scoring failed")
 
 
 class VoiceProviderProtocol(Protocol):
@@ -38,10 +61,20 @@ class VoiceProviderProtocol(Protocol):
 class VoiceService:
     """Service layer for voice prescreening operations."""
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(
+        self,
+        settings: Settings,
+        score_cache: Optional[CacheBackend] = None,
+        openai: Optional[AsyncOpenAI] = None,
+        batcher: Optional[Batcher] = None,
+    ) -> None:
         self.settings = settings
         self.logger = get_logger("VoiceService")
+        self.score_cache = score_cache or RedisCacheBackend()
         self._provider: Optional[VoiceProviderProtocol] = None
+        self._openai_client = openai
+        self._openai: Optional[AsyncOpenAI] = None
+        self._batcher = batcher
 
     @property
     def provider(self) -> VoiceProviderProtocol:
@@ -49,6 +82,23 @@ class VoiceService:
             self._provider = self._create_provider()
         return self._provider
 
+    @property
+    def openai(self) -> AsyncOpenAI:
+        # The process-wide client keeps one connection pool across requests
+        if self._openai is None:
+            client = self._openai_client or get_openai_client()
+            # Retries on 429 are left to the batcher, which knows the rate limits;
+            # the copy shares the client's connection pool
+            self._openai = client.with_options(max_retries=0)
+        return self._openai
+
+    @property
+    def batcher(self) -> Batcher:
+        # Rate limits are per account, so all services share one window
+        if self._batcher is None:
+            self._batcher = get_openai_batcher()
+        return self._batcher
+
     def _create_provider(self) -> VoiceProviderProtocol:
         if self.settings.voice_provider == "twilio":
             return TwilioVoiceProvider()
@@ -74,25 +124,54 @@ class VoiceService:
         candidates: list[Applicant],
         questions: list[PrescreeningQuestion],
         job_title: str = "the position",
+        on_result: Optional[
+            Callable[[Applicant, list[CandidateResponse]], Awaitable[None]]
+        ] = None,
     ) -> dict[str, list[CandidateResponse]]:
-        """Conduct prescreening calls."""
+        """Conduct prescreening calls.
+
+        ``on_result`` is awaited with each candidate's responses as soon as
+        their call finishes, so callers can persist them without waiting for
+        the whole batch.
+        """
         self.logger.info(f"Starting prescreening for {len(candidates)} candidates")
         all_responses = {}
 
+        callable_candidates = []
         for candidate in candidates:
             if not candidate.phone:
                 self.logger.warning(
                     f"Skipping candidate {candidate.id}: no phone number"
                 )
                 continue
+            callable_candidates.append(candidate)
+
+        # Calls are I/O-bound; run them together, capped for provider limits
+        semaphore = asyncio.Semaphore(self.settings.voice_call_concurrency)
+        # Identical answers across candidates are scored once per batch
+        shared_scores: dict[str, asyncio.Future] = {}
+
+        async def _call(
+            candidate: Applicant,
+        ) -> tuple[Applicant, list[CandidateResponse]]:
             try:
-                responses = await self._conduct_single_call(
-                    candidate, questions, job_title
-                )
-                all_responses[str(candidate.id)] = responses
+                async with semaphore:
+                    responses = await self._conduct_single_call(
+                        candidate, questions, job_title, shared_scores=shared_scores
+                    )
             except Exception as e:
                 self._handle_error(e, "prescreening_call", reraise=False)
-                all_responses[str(candidate.id)] = []
+                responses = []
+            return candidate, responses
+
+        # Handle each call as it finishes instead of waiting for the slowest
+        for finished in asyncio.as_completed(
+            [_call(candidate) for candidate in callable_candidates]
+        ):
+            candidate, responses = await finished
+            all_responses[str(candidate.id)] = responses
+            if on_result is not None:
+                await on_result(candidate, responses)
 
         self._log_operation(
             "conduct_prescreening",
@@ -106,6 +185,7 @@ class VoiceService:
         candidate: Applicant,
         questions: list[PrescreeningQuestion],
         job_title: str,
+        shared_scores: Optional[dict[str, asyncio.Future]] = None,
     ) -> list[CandidateResponse]:
         self.logger.info(f"Calling candidate {candidate.name}")
         call_id = await self.provider.initiate_call(
@@ -118,10 +198,15 @@ class VoiceService:
         # Here we await results immediately (mock behavior usually).
         call_results = await self.provider.get_call_results(call_id)
 
+        answered = list(zip(questions, call_results))
+        scores = await self._score_responses_batch(
+            [(result.get("transcript", ""), question) for question, result in answered],
+            shared=shared_scores,
+        )
+
         responses = []
-        for question, result in zip(questions, call_results):
+        for (question, result), (score, rationale) in zip(answered, scores):
             transcript = result.get("transcript", "")
-            score, rationale = await self._score_response(transcript, question)
 
             response = CandidateResponse(
                 id=uuid4(),
@@ -141,19 +226,118 @@ class VoiceService:
     async def _score_response(
         self, transcript: str, question: PrescreeningQuestion
     ) -> tuple[int, str]:
-        client = AsyncOpenAI(api_key=self.settings.openai_api_key)
-        prompt = f"""Evaluate response. Question: {question.question_text}. Keywords: {', '.join(question.expected_keywords)}. Response: "{transcript}". Return JSON: {{"score": <0-{question.max_score}>, "rationale": "..."}}"""
+        (result,) = await self._score_responses_batch([(transcript, question)])
+        return result
+
+    async def _score_responses_batch(
+        self,
+        pairs: list[tuple[str, PrescreeningQuestion]],
+        shared: Optional[dict[str, asyncio.Future]] = None,
+    ) -> list[tuple[int, str]]:
+        """
+        Score pairs from cache, sending only the misses to the LLM in one request.
+
+        Args:
+            pairs: (transcript, question) pairs to score
+            shared: In-flight scores by cache key for the current prescreening
+                batch; answers another candidate already gave are awaited
+                instead of being scored again
+        """
+        if shared is None:
+            shared = {}
+        loop = asyncio.get_running_loop()
+
+        scores: list[Optional[tuple[int, str]]] = [None] * len(pairs)
+        waiting: dict[int, asyncio.Future] = {}
+        owned: dict[str, tuple[asyncio.Future, tuple[str, PrescreeningQuestion]]] = {}
+        for index, (transcript, question) in enumerate(pairs):
+            if not normalize_transcript(transcript):
+                scores[index] = _NO_RESPONSE
+                continue
+            prescore = keyword_prescore(transcript, question)
+            if prescore is not None:
+                scores[index] = prescore
+                continue
+            key = score_cache_key(question.id, transcript, self.settings.openai_model)
+            if key not in shared:
+                shared[key] = loop.create_future()
+                owned[key] = (shared[key], (transcript, question))
+            waiting[index] = shared[key]
+
+        try:
+            await self._resolve_scores(owned)
+        finally:
+            # Never leave other candidates waiting on a score we failed to produce
+            for future, _ in owned.values():
+                if not future.done():
+                    future.set_result(_SCORING_FAILED)
+
+        for index, future in waiting.items():
+            scores[index] = await future
+        return scores
+
+    async def _resolve_scores(
+        self,
+        owned: dict[str, tuple[asyncio.Future, tuple[str, PrescreeningQuestion]]],
+    ) -> None:
+        """Fill score futures from the cache, then from one LLM request."""
+        if not owned:
+            return
+
+        keys = list(owned)
+        cached = await self.score_cache.get_many(keys)
+        misses = []
+        for key, entry in zip(keys, cached):
+            if entry:
+                owned[key][0].set_result((entry["score"], entry["rationale"]))
+            else:
+                misses.append(key)
+        if not misses:
+            return
+
+        fresh = await self._request_scores([owned[key][1] for key in misses])
+        if fresh is None:
+            return
+
+        for key, result in zip(misses, fresh):
+            owned[key][0].set_result(result)
+        await self.score_cache.set_many(
+            {
+                key: {"score": score, "rationale": rationale}
+                for key, (score, rationale) in zip(misses, fresh)
+            },
+            ttl=LLMCacheSettings.SCORE_TTL_SECONDS,
+        )
+
+    async def _request_scores(
+        self, pairs: list[tuple[str, PrescreeningQuestion]]
+    ) -> Optional[list[tuple[int, str]]]:
+        """One LLM request scoring every pair; None if the reply is unusable."""
+        items = "\n".join(
+            f'{index}. {question.scoring_prompt} Response: "{transcript}"'
+            for index, (transcript, question) in enumerate(pairs, start=1)
+        )
+        prompt = (
+            "Evaluate each response against its question. Return JSON: "
+            '{"scores": [{"score": <0-max score>, "rationale": "..."}, ...]} '
+            f"with exactly {len(pairs)} entries, in order.\n{items}"
+        )
         try:
-            response = await client.chat.completions.create(
+            # Deterministic output, so cached scores match what a re-run would give
+            response = await self.batcher.add(
+                self.openai.chat.completions.create,
                 model=self.settings.openai_model,
                 messages=[{"role": "user", "content": prompt}],
                 response_format={"type": "json_object"},
+                temperature=0,
             )
-            result = json.loads(response.choices[0].message.content)
-            return result["score"], result["rationale"]
+            scores = orjson.loads(response.choices[0].message.content)["scores"]
+            if len(scores) != len(pairs):
+                raise ValueError(f"expected {len(pairs)} scores, got {len(scores)}")
+            return [(item["score"], item["rationale"]) for item in scores]
         except Exception as e:
             self.logger.error(f"Scoring failed: {e}")
-            return 0, "Scoring failed"
+            return None
 
 
 class CalendarService:
@@ -164,12 +348,11 @@ class CalendarService:
         self.logger = get_logger("CalendarService")
         self._service = None
 
-    @property
-    def calendar_service(self):
+    async def get_service(self):
         if self._service is None:
-            # Point to new utils location
+            # Loading credentials and building the client is blocking I/O
             try:
-                self._service = get_calendar_service()
+                self._service = await asyncio.to_thread(get_calendar_service)
             except FileNotFoundError:
                 self.logger.warning(
                     "Google Calendar credentials not found. Using mock."
@@ -177,6 +360,44 @@ class CalendarService:
                 self._service = None
         return self._service
 
+    async def check_availability_bulk(
+        self,
+        interviewer_emails: list[str],
+        window: tuple[datetime, datetime],
+    ) -> dict[str, list[tuple[datetime, datetime]]]:
+        """
+        Fetch busy ranges for several interviewers at once.
+
+        One FreeBusy query covers up to 50 calendars, so callers scheduling
+        many interviews should prefetch here rather than asking per event.
+
+        Args:
+            interviewer_emails: Calendars to check
+            window: (start, end) of the range; naive values are taken as UTC
+
+        Returns:
+            Busy (start, end) ranges per email, empty for every email in mock mode
+
+        Raises:
+            GoogleCalendarError: If the FreeBusy query fails
+        """
+        if not await self.get_service():
+            return {email: [] for email in interviewer_emails}
+
+        start, end = (
+            (
+                moment.astimezone(timezone.utc).replace(tzinfo=None)
+                if moment.tzinfo is not None
+                else moment
+            )
+            for moment in window
+        )
+        try:
+            return await query_busy_times(interviewer_emails, start, end)
+        except Exception as e:
+            self.logger.warning(f"FreeBusy query failed: {e}")
+            raise GoogleCalendarError(f"Availability lookup failed: {e}") from e
+
     async def schedule_interview(
         self,
         candidate: Applicant,
@@ -189,7 +410,7 @@ class CalendarService:
     ) -> InterviewSlot:
         self.logger.info(f"Scheduling interview for {candidate.name}")
 
-        if self.calendar_service:
+        if await self.get_service():
             try:
                 return await create_interview_event(
                     candidate=candidate,
@@ -0,0 +1,124 @@
+"""
+Interviews Router Tests
+
+Integration tests for the Twilio and Google Calendar webhooks.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from twilio.request_validator import RequestValidator
+
+from app.interviews.availability_cache import calendar_channel_token
+from app.interviews.router import router
+
+BASE_URL = "https://api.example.com"
+CALLBACK_URL = BASE_URL + "/interviews/webhooks/twilio/status"
+
+
+@pytest.fixture
+def client():
+    settings = MagicMock()
+    settings.twilio.auth_token = "secret"
+    settings.twilio.webhook_base_url = BASE_URL
+    app = FastAPI()
+    app.include_router(router, prefix="/interviews")
+    with patch("app.interviews.router.get_settings", return_value=settings):
+        yield TestClient(app)
+
+
+class TestTwilioStatusCallback:
+    """Tests for POST /interviews/webhooks/twilio/status."""
+
+    def test_signed_callback_resolves_call(self, client):
+        """A correctly signed callback should complete the pending call."""
+        form = {"CallSid": "CA1", "CallStatus": "completed"}
+        signature = RequestValidator("secret").compute_signature(CALLBACK_URL, form)
+
+        with patch("app.interviews.router.resolve_call_status") as resolve:
+            response = client.post(
+                "/interviews/webhooks/twilio/status",
+                data=form,
+                headers={"X-Twilio-Signature": signature},
+            )
+
+        assert response.status_code == 204
+        resolve.assert_called_once_with("CA1", "completed")
+
+    def test_unsigned_callback_is_rejected(self, client):
+        """Requests without a valid Twilio signature should get 403."""
+        with patch("app.interviews.router.resolve_call_status") as resolve:
+            response = client.post(
+                "/interviews/webhooks/twilio/status",
+                data={"CallSid": "CA1", "CallStatus": "completed"},
+            )
+
+        assert response.status_code == 403
+        resolve.assert_not_called()
+
+    @pytest.mark.parametrize("setting", ["auth_token", "webhook_base_url"])
+    def test_unconfigured_webhook_is_not_found(self, setting):
+        """Without credentials, an empty-key signature must not be accepted."""
+        settings = MagicMock()
+        settings.twilio.auth_token = "secret"
+        settings.twilio.webhook_base_url = BASE_URL
+        setattr(settings.twilio, setting, "")
+        app = FastAPI()
+        app.include_router(router, prefix="/interviews")
+        form = {"CallSid": "CA1", "CallStatus": "completed"}
+        signature = RequestValidator("").compute_signature(CALLBACK_URL, form)
+
+        with (
+            patch("app.interviews.router.get_settings", return_value=settings),
+            patch("app.interviews.router.resolve_call_status") as resolve,
+        ):
+            response = TestClient(app).post(
+                "/interviews/webhooks/twilio/status",
+                data=form,
+                headers={"X-Twilio-Signature": signature},
+            )
+
+        assert response.status_code == 404
+        resolve.assert_not_called()
+
+
+class TestGoogleCalendarNotification:
+    """Tests for POST /interviews/webhooks/google/calendar."""
+
+    def _notify(self, client, token, state="exists"):
+        with patch("app.interviews.router.invalidate_availability") as invalidate:
+            response = client.post(
+                "/interviews/webhooks/google/calendar",
+                headers={
+                    "X-Goog-Channel-Token": token,
+                    "X-Goog-Resource-State": state,
+                },
+            )
+        return response, invalidate
+
+    def test_change_invalidates_cached_availability(self, client):
+        """A notification with our token should drop that calendar's cache."""
+        token = calendar_channel_token("i@example.com")
+
+        response, invalidate = self._notify(client, token)
+
+        assert response.status_code == 204
+        invalidate.assert_awaited_once_with("i@example.com")
+
+    def test_sync_message_keeps_cache(self, client):
+        """The subscription handshake should not invalidate anything."""
+        token = calendar_channel_token("i@example.com")
+
+        response, invalidate = self._notify(client, token, state="sync")
+
+        assert response.status_code == 204
+        invalidate.assert_not_called()
+
+    def test_forged_token_is_rejected(self, client):
+        """Tokens not signed with our secret should get 403."""
+        response, invalidate = self._notify(client, "0" * 64 + ":i@example.com")
+
+        assert response.status_code == 403
+        invalidate.assert_not_called()
@@ -0,0 +1,272 @@
+"""
+Interview Scheduler Tests
+
+Unit tests for slot finding and batch scheduling.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.candidates.schemas import Applicant
+from app.interviews.scheduler import _find_free_slots
+
+DAY = datetime(2026, 1, 5, 9, 0)
+
+
+def _slot_source(*lookups):
+    """Stand-in for iter_available_slots yielding one lookup per call."""
+    remaining = list(lookups)
+
+    async def _iter(**kwargs):
+        for slot in remaining.pop(0):
+            yield slot
+
+    return MagicMock(side_effect=_iter)
+
+
+class TestFindFreeSlots:
+    """Tests for the free-slot search."""
+
+    def test_empty_calendar_fills_working_hours(self):
+        """Every half hour inside working hours should be offered."""
+        slots = _find_free_slots([], DAY, DAY + timedelta(hours=8), 60, (9, 17))
+
+        assert slots[0] == DAY
+        assert slots[-1] == DAY + timedelta(hours=7, minutes=30)
+        assert len(slots) == 16
+
+    def test_busy_block_is_skipped(self):
+        """Slots overlapping a busy block should be excluded."""
+        busy = [(DAY + timedelta(hours=1), DAY + timedelta(hours=3, minutes=10))]
+
+        slots = _find_free_slots(busy, DAY, DAY + timedelta(hours=5), 60, (9, 17))
+
+        assert DAY in slots
+        assert DAY + timedelta(minutes=30) not in slots
+        assert DAY + timedelta(hours=3) not in slots
+        assert DAY + timedelta(hours=3, minutes=30) in slots
+
+    def test_overlapping_aware_busy_times_are_merged(self):
+        """Overlapping UTC-aware intervals should block their combined span."""
+        utc = DAY.replace(tzinfo=timezone.utc)
+        busy = [
+            (utc + timedelta(hours=2), utc + timedelta(hours=4)),
+            (utc, utc + timedelta(hours=3)),
+        ]
+
+        slots = _find_free_slots(busy, DAY, DAY + timedelta(hours=6), 30, (9, 17))
+
+        assert slots[0] == DAY + timedelta(hours=4)
+
+
+class TestCachedBusyTimes:
+    """Tests for availability-cached busy time lookups."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_freebusy(self):
+        """Fully cached calendars should not reach Google Calendar."""
+        from app.interviews import scheduler
+
+        busy = [(DAY, DAY + timedelta(hours=1))]
+        with (
+            patch.object(
+                scheduler.availability_cache,
+                "get_cached_busy",
+                AsyncMock(return_value=(3, busy)),
+            ),
+            patch.object(scheduler, "query_busy_times") as query,
+        ):
+            result = await scheduler.cached_busy_times(
+                ["i@example.com"], DAY, DAY + timedelta(days=1)
+            )
+
+        query.assert_not_called()
+        assert result == {"i@example.com": busy}
+
+    @pytest.mark.asyncio
+    async def test_miss_fetches_whole_days_and_caches_them(self):
+        """Misses should be fetched over whole UTC days and stored per day."""
+        from app.interviews import scheduler
+
+        utc = DAY.replace(tzinfo=timezone.utc)
+        late = (utc + timedelta(hours=14), utc + timedelta(hours=16))
+        query = AsyncMock(return_value={"i@example.com": [late]})
+        store = AsyncMock()
+        with (
+            patch.object(
+                scheduler.availability_cache,
+                "get_cached_busy",
+                AsyncMock(return_value=(3, None)),
+            ),
+            patch.object(scheduler.availability_cache, "store_busy", store),
+            patch.object(scheduler, "query_busy_times", query),
+            patch.object(scheduler, "_ensure_calendar_watch", AsyncMock()),
+        ):
+            result = await scheduler.cached_busy_times(
+                ["i@example.com"], DAY, DAY + timedelta(hours=8)
+            )
+
+        midnight = DAY.replace(hour=0)
+        query.assert_awaited_once_with(
+            ["i@example.com"], midnight, midnight + timedelta(days=1)
+        )
+        naive = (DAY + timedelta(hours=14), DAY + timedelta(hours=16))
+        store.assert_awaited_once_with("i@example.com", 3, {DAY.date(): [naive]})
+        # Cached for the whole day, but only the requested range is returned
+        assert result == {"i@example.com": []}
+
+
+class TestCalendarService:
+    """Tests for the cached Google Calendar service."""
+
+    def test_service_is_built_once(self):
+        """Credentials should load and the service build only on first use."""
+        from app.interviews import scheduler
+
+        with (
+            patch.object(scheduler, "_calendar_service", None),
+            patch.object(scheduler, "_calendar_credentials", None),
+            patch.object(scheduler, "get_calendar_credentials") as get_creds,
+            patch("googleapiclient.discovery.build") as build,
+        ):
+            first = scheduler.get_calendar_service()
+            second = scheduler.get_calendar_service()
+
+        assert first is second is build.return_value
+        get_creds.assert_called_once()
+        build.assert_called_once()
+
+
+class TestScheduleInterviews:
+    """Tests for batch interview scheduling."""
+
+    @pytest.mark.asyncio
+    async def test_failed_event_does_not_drop_others(self):
+        """One failing insert should not stop the rest of the batch."""
+        from app.interviews import scheduler
+
+        candidates = [
+            Applicant(name=f"Candidate {i}", email=f"c{i}@example.com")
+            for i in range(3)
+        ]
+        slots = [DAY + timedelta(hours=i) for i in range(3)]
+        results = [{"id": "evt-0"}, RuntimeError("quota"), {"id": "evt-2"}]
+
+        with (
+            patch.object(scheduler, "iter_available_slots", _slot_source(slots)),
+            patch.object(scheduler, "_insert_events", return_value=results) as insert,
+        ):
+            scheduled = await scheduler.schedule_interviews(
+                "job", candidates, interviewer_email="i@example.com", start_date=DAY
+            )
+
+        assert len(insert.call_args.args[0]) == 3
+        assert [s.calendar_event_id for s in scheduled] == ["evt-0", "evt-2"]
+        assert [s.candidate_id for s in scheduled] == [
+            candidates[0].id,
+            candidates[2].id,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_search_widens_only_when_short_of_slots(self):
+        """Availability should stop at the first horizon with enough slots."""
+        from app.interviews import scheduler
+
+        candidates = [
+            Applicant(name=f"Candidate {i}", email=f"c{i}@example.com")
+            for i in range(2)
+        ]
+        lookups = [[DAY], [DAY, DAY + timedelta(hours=1)]]
+
+        with (
+            patch.object(
+                scheduler, "iter_available_slots", _slot_source(*lookups)
+            ) as get_slots,
+            patch.object(scheduler, "_insert_events", return_value=[{}, {}]),
+        ):
+            await scheduler.schedule_interviews(
+                "job", candidates, interviewer_email="i@example.com", start_date=DAY
+            )
+
+        ends = [c.kwargs["date_range_end"] for c in get_slots.call_args_list]
+        assert ends == [DAY + timedelta(days=3), DAY + timedelta(days=7)]
+
+    @pytest.mark.asyncio
+    async def test_takes_only_as_many_slots_as_candidates(self):
+        """Slot iteration should stop once every candidate has one."""
+        from app.interviews import scheduler
+
+        candidate = Applicant(name="Candidate", email="c@example.com")
+        busy = AsyncMock(return_value={"i@example.com": []})
+
+        with (
+            patch.object(scheduler, "query_busy_times", busy),
+            patch.object(scheduler, "_insert_events", return_value=[{}]) as insert,
+            patch.object(
+                scheduler.availability_cache,
+                "get_cached_busy",
+                AsyncMock(return_value=(None, None)),
+            ),
+            patch.object(scheduler.availability_cache, "invalidate_availability"),
+        ):
+            scheduled = await scheduler.schedule_interviews(
+                "job", [candidate], interviewer_email="i@example.com", start_date=DAY
+            )
+
+        assert len(insert.call_args.args[0]) == 1
+        assert scheduled[0].scheduled_datetime == DAY
+
+    def test_insert_events_uses_one_batch_request(self):
+        """Up to the batch limit, inserts should share one HTTP request."""
+        from app.interviews import scheduler
+
+        service = MagicMock()
+        batch = service.new_batch_http_request.return_value
+
+        def run_batch(http=None):
+            callback = service.new_batch_http_request.call_args.kwargs["callback"]
+            for call in batch.add.call_args_list:
+                request_id = call.kwargs["request_id"]
+                callback(request_id, {"id": f"evt-{request_id}"}, None)
+
+        batch.execute.side_effect = run_batch
+
+        with (
+            patch.object(scheduler, "get_calendar_service", return_value=service),
+            patch.object(scheduler, "_calendar_http"),
+        ):
+            results = scheduler._insert_events([{}, {}, {}])
+
+        batch.execute.assert_called_once()
+        assert results == [{"id": "evt-0"}, {"id": "evt-1"}, {"id": "evt-2"}]
+
+
+class TestCalendarCredentials:
+    """Tests for OAuth token storage."""
+
+    def test_loads_json_token(self, tmp_path):
+        """A saved authorized-user JSON token should load without re-auth."""
+        from app.interviews import scheduler
+
+        token_file = tmp_path / "token.json"
+        token_file.write_text(
+            json.dumps(
+                {
+                    "token": "access",
+                    "refresh_token": "refresh",
+                    "client_id": "client",
+                    "client_secret": "secret",
+                    "expiry": "2999-01-01T00:00:00Z",
+                }
+            )
+        )
+        settings = MagicMock()
+        settings.google_calendar.token_file = str(token_file)
+
+        creds = scheduler.get_calendar_credentials(settings)
+
+        assert creds.token == "access"
+        assert creds.refresh_token == "refresh"
@@ -0,0 +1,340 @@
+"""
+Interviews Service Tests
+
+Unit tests for voice prescreening orchestration.
+"""
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.ai.openai_batcher import Batcher
+from app.candidates.schemas import Applicant
+from app.interviews.schemas import PrescreeningQuestion
+from app.interviews.exceptions import GoogleCalendarError
+from app.interviews.services import CalendarService, VoiceService
+
+
+class _MemoryCache:
+    """In-process stand-in for the Redis score cache."""
+
+    def __init__(self):
+        self.entries = {}
+
+    async def get_many(self, keys):
+        return [self.entries.get(key) for key in keys]
+
+    async def set_many(self, items, ttl):
+        self.entries.update(items)
+
+
+@pytest.fixture
+def openai_client():
+    client = MagicMock()
+    client.with_options.return_value.chat.completions.create = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def create(openai_client):
+    """Completion call of the scoring client."""
+    return openai_client.with_options.return_value.chat.completions.create
+
+
+@pytest.fixture
+def voice_service(openai_client):
+    settings = MagicMock()
+    settings.voice_call_concurrency = 8
+    settings.openai_model = "gpt-4o"
+    settings.openai_rpm_limit = 500
+    settings.openai_tpm_limit = 30000
+    settings.openai_max_concurrency = 16
+    return VoiceService(
+        settings,
+        score_cache=_MemoryCache(),
+        openai=openai_client,
+        batcher=Batcher(rpm=500, tpm=30000, workers=16),
+    )
+
+
+def _completion(payload: dict) -> MagicMock:
+    completion = MagicMock()
+    completion.choices[0].message.content = json.dumps(payload)
+    return completion
+
+
+def _candidate(name: str, phone: str | None = "+15550000000") -> Applicant:
+    return Applicant(name=name, email=f"{name}@example.com", phone=phone)
+
+
+class TestConductPrescreening:
+    """Tests for VoiceService.conduct_prescreening."""
+
+    @pytest.mark.asyncio
+    async def test_calls_run_concurrently(self, voice_service):
+        """Every callable candidate should be in a call at the same time."""
+        candidates = [_candidate("a"), _candidate("b")]
+        both_started = asyncio.Event()
+        started = []
+
+        async def fake_call(candidate, questions, job_title, shared_scores=None):
+            started.append(candidate)
+            if len(started) == len(candidates):
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return []
+
+        voice_service._conduct_single_call = fake_call
+
+        responses = await voice_service.conduct_prescreening(candidates, [])
+
+        assert set(responses) == {str(c.id) for c in candidates}
+
+    @pytest.mark.asyncio
+    async def test_failures_and_missing_phones(self, voice_service):
+        """A failed call yields no responses; candidates without phones are skipped."""
+        ok, failing, no_phone = (
+            _candidate("ok"),
+            _candidate("bad"),
+            _candidate("none", phone=None),
+        )
+
+        async def fake_call(candidate, questions, job_title, shared_scores=None):
+            if candidate is failing:
+                raise RuntimeError("call dropped")
+            return ["response"]
+
+        voice_service._conduct_single_call = fake_call
+
+        responses = await voice_service.conduct_prescreening(
+            [ok, failing, no_phone], []
+        )
+
+        assert responses == {str(ok.id): ["response"], str(failing.id): []}
+
+    @pytest.mark.asyncio
+    async def test_results_are_handled_as_calls_finish(self, voice_service):
+        """A quick call should be reported while a slow one is still running."""
+        fast, slow = _candidate("fast"), _candidate("slow")
+        release_slow = asyncio.Event()
+        handled = []
+
+        async def fake_call(candidate, questions, job_title, shared_scores=None):
+            if candidate is slow:
+                await asyncio.wait_for(release_slow.wait(), timeout=1)
+            return [candidate.name]
+
+        async def on_result(candidate, responses):
+            handled.append(responses)
+            release_slow.set()
+
+        voice_service._conduct_single_call = fake_call
+
+        await voice_service.conduct_prescreening([slow, fast], [], on_result=on_result)
+
+        assert handled == [["fast"], ["slow"]]
+
+
+class TestScoreResponsesBatch:
+    """Tests for VoiceService._score_responses_batch."""
+
+    @pytest.mark.asyncio
+    async def test_scores_all_pairs_in_one_request(self, voice_service, create):
+        """Every question should be scored by a single completion call."""
+        pairs = [
+            ("Five years", PrescreeningQuestion(question_text="Experience?")),
+            ("Django", PrescreeningQuestion(question_text="Frameworks?")),
+        ]
+        create.return_value = _completion(
+            {
+                "scores": [
+                    {"score": 80, "rationale": "solid"},
+                    {"score": 60, "rationale": "ok"},
+                ]
+            }
+        )
+
+        scores = await voice_service._score_responses_batch(pairs)
+
+        create.assert_called_once()
+        assert scores == [(80, "solid"), (60, "ok")]
+
+    @pytest.mark.asyncio
+    async def test_mismatched_score_count_falls_back(self, voice_service, create):
+        """A reply with the wrong number of scores should not be trusted."""
+        pairs = [
+            ("Yes", PrescreeningQuestion(question_text="Relocate?")),
+            ("No", PrescreeningQuestion(question_text="Visa?")),
+        ]
+        create.return_value = _completion(
+            {"scores": [{"score": 90, "rationale": "great"}]}
+        )
+
+        scores = await voice_service._score_responses_batch(pairs)
+
+        assert scores == [(0, "Scoring failed")] * 2
+
+    @pytest.mark.asyncio
+    async def test_malformed_reply_falls_back(self, voice_service, create):
+        """A reply that is not valid JSON should not break scoring."""
+        pairs = [("Yes", PrescreeningQuestion(question_text="Relocate?"))]
+        create.return_value.choices[0].message.content = '{"scores": [{"score": 90,'
+
+        scores = await voice_service._score_responses_batch(pairs)
+
+        assert scores == [(0, "Scoring failed")]
+
+    def test_injected_client_is_shared_without_retries(
+        self, voice_service, openai_client
+    ):
+        """Scoring should use the injected client, leaving 429s to the batcher."""
+        assert voice_service.openai is voice_service.openai
+        openai_client.with_options.assert_called_once_with(max_retries=0)
+
+    def test_defaults_to_the_process_wide_client(self):
+        """Without an injected client the shared app client should be used."""
+        with patch("app.interviews.services.get_openai_client") as get_client:
+            service = VoiceService(MagicMock(), score_cache=_MemoryCache())
+            client = service.openai
+
+        assert client is get_client.return_value.with_options.return_value
+
+    def test_batcher_is_shared_across_services(self):
+        """Services built per request should share one rate-limit window."""
+        with patch("app.interviews.services.get_openai_batcher") as get_batcher:
+            first = VoiceService(MagicMock(), score_cache=_MemoryCache())
+            second = VoiceService(MagicMock(), score_cache=_MemoryCache())
+
+            assert first.batcher is second.batcher is get_batcher.return_value
+
+    @pytest.mark.asyncio
+    async def test_cached_scores_skip_the_llm(self, voice_service, create):
+        """Repeated answers should be served from cache; only misses are sent."""
+        question = PrescreeningQuestion(question_text="Relocate?")
+        first = {"scores": [{"score": 70, "rationale": "willing"}]}
+        second = {"scores": [{"score": 10, "rationale": "unwilling"}]}
+        create.side_effect = [_completion(first), _completion(second)]
+
+        await voice_service._score_responses_batch([("Yes.", question)])
+        scores = await voice_service._score_responses_batch(
+            [("  yes ", question), ("No", question)]
+        )
+
+        assert scores == [(70, "willing"), (10, "unwilling")]
+        assert create.call_count == 2
+        assert '"No"' in create.call_args.kwargs["messages"][0]["content"]
+        assert '"  yes "' not in create.call_args.kwargs["messages"][0]["content"]
+
+    @pytest.mark.asyncio
+    async def test_shared_answers_are_scored_once(self, voice_service, create):
+        """Candidates in one batch giving the same answer should share a score."""
+        question = PrescreeningQuestion(question_text="Relocate?")
+        payload = {"scores": [{"score": 70, "rationale": "willing"}]}
+        shared = {}
+
+        async def slow_completion(**kwargs):
+            await asyncio.sleep(0)
+            return _completion(payload)
+
+        create.side_effect = slow_completion
+
+        first, second = await asyncio.gather(
+            voice_service._score_responses_batch([("Yes", question)], shared),
+            voice_service._score_responses_batch([("yes.", question)], shared),
+        )
+
+        create.assert_called_once()
+        assert first == second == [(70, "willing")]
+
+    @pytest.mark.asyncio
+    async def test_empty_transcript_skips_the_llm(self, voice_service, create):
+        """Blank answers should get a fixed score without a completion call."""
+        question = PrescreeningQuestion(question_text="Relocate?")
+
+        scores = await voice_service._score_responses_batch([(" ... ", question)])
+
+        create.assert_not_called()
+        assert scores == [(0, "No response")]
+
+    @pytest.mark.asyncio
+    async def test_full_keyword_match_skips_the_llm(self, voice_service, create):
+        """Answers covering every expected keyword should not be sent out."""
+        question = PrescreeningQuestion(
+            question_text="Stack?", expected_keywords=["python"], max_score=80
+        )
+
+        scores = await voice_service._score_responses_batch([("Python", question)])
+
+        create.assert_not_called()
+        assert scores == [(80, "All keywords matched")]
+
+
+class TestCheckAvailabilityBulk:
+    """Tests for CalendarService.check_availability_bulk."""
+
+    @pytest.mark.asyncio
+    async def test_single_query_for_all_interviewers(self):
+        """All interviewers should be looked up together, in naive UTC."""
+        service = CalendarService(MagicMock())
+        service._service = MagicMock()
+        start = datetime(2026, 1, 5, 9, 0, tzinfo=timezone.utc)
+        busy = {"a@example.com": [], "b@example.com": []}
+
+        with patch(
+            "app.interviews.services.query_busy_times", AsyncMock(return_value=busy)
+        ) as query:
+            result = await service.check_availability_bulk(
+                list(busy), (start, start + timedelta(days=1))
+            )
+
+        assert result is busy
+        query.assert_awaited_once_with(
+            ["a@example.com", "b@example.com"],
+            datetime(2026, 1, 5, 9, 0),
+            datetime(2026, 1, 6, 9, 0),
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_query_raises_calendar_error(self):
+        """A FreeBusy failure should surface as a GoogleCalendarError."""
+        service = CalendarService(MagicMock())
+        service._service = MagicMock()
+        start = datetime(2026, 1, 5, 9, 0)
+
+        with patch(
+            "app.interviews.services.query_busy_times",
+            AsyncMock(side_effect=RuntimeError("quota")),
+        ):
+            with pytest.raises(GoogleCalendarError):
+                await service.check_availability_bulk(
+                    ["a@example.com"], (start, start + timedelta(days=1))
+                )
+
+
+class TestScheduleInterview:
+    """Tests for CalendarService.schedule_interview."""
+
+    @pytest.mark.asyncio
+    async def test_missing_credentials_fall_back_to_mock_slot(self):
+        """Without calendar credentials a mock slot should be returned."""
+        service = CalendarService(MagicMock())
+        candidate = _candidate("a")
+        job_id = "00000000-0000-0000-0000-000000000001"
+
+        with patch(
+            "app.interviews.services.get_calendar_service",
+            side_effect=FileNotFoundError,
+        ) as get_service:
+            slot = await service.schedule_interview(
+                candidate,
+                interviewer_email="i@example.com",
+                scheduled_datetime=datetime(2026, 1, 5, 9, 0),
+                job_id=job_id,
+            )
+
+        get_service.assert_called_once()
+        assert str(slot.job_id) == job_id
+        assert slot.calendar_event_id.startswith("mock_event_")
@@ -22,6 +22,13 @@ class MockDataLimits:
     DEFAULT_APPLICANTS = 5
 
 
+class PaginationLimits:
+    """Page sizes for job listings."""
+
+    DEFAULT_PAGE_SIZE = 50
+    MAX_PAGE_SIZE = 100
+
+
 class LockKeys:
     """Factory for distributed lock keys."""
 
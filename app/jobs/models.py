@@ -2,11 +2,14 @@
 Jobs App Database Models
 """
 
-from sqlalchemy import Column, String, DateTime, Index, ForeignKey, Text
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from functools import cached_property
+
+from sqlalchemy import Column, String, DateTime, Index, ForeignKey, Text, Float
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
+from sqlalchemy.orm import deferred, relationship
 
 from app.core.database import Base
+from app.jobs.schemas import GeneratedJD
 
 
 class JobRecord(Base):
@@ -24,6 +27,11 @@ class JobRecord(Base):
         String(20), nullable=False, default="pending", index=True
     )
     generated_jd = Column(JSONB, nullable=True)  # Store complete JD for public access
+    # L2-normalized JD embedding, set on approval. Deferred so list queries
+    # don't pull ~1.5k floats per row; load explicitly with undefer().
+    jd_embedding = deferred(Column(ARRAY(Float), nullable=True), raiseload=True)
+    # Serialized schema.org JSON-LD, rendered once on approval
+    jsonld_cached = deferred(Column(Text, nullable=True), raiseload=True)
     created_at = Column(DateTime(timezone=True), nullable=False, index=True)
     updated_at = Column(DateTime(timezone=True), nullable=False)
     owner_id = Column(
@@ -42,4 +50,37 @@ class JobRecord(Base):
     __table_args__ = (
         Index("ix_jobs_node_created", "current_node", "created_at"),
         Index("ix_jobs_approval_status", "jd_approval_status"),
+        # Serves the per-user job list (newest first) as an index-only scan
+        Index(
+            "ix_jobs_owner_created",
+            owner_id,
+            created_at.desc(),
+            postgresql_include=[
+                "id",
+                "role_title",
+                "company_name",
+                "current_node",
+                "jd_approval_status",
+                "updated_at",
+            ],
+        ),
+        # Covers the public careers listing/feed (newest first, published only)
+        Index(
+            "ix_jobs_public",
+            created_at.desc(),
+            postgresql_where=(jd_approval_status == "approved")
+            & generated_jd.isnot(None),
+        ),
     )
+
+    @cached_property
+    def parsed_jd(self) -> GeneratedJD | None:
+        """
+        Generated JD as a model, built once per loaded instance.
+
+        generated_jd is only written from an already validated GeneratedJD
+        at approval time, so it is constructed without re-validation.
+        """
+        if not self.generated_jd:
+            return None
+        return GeneratedJD.model_construct(**self.generated_jd)
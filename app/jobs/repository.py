@@ -7,14 +7,27 @@ Implements the Repository pattern for clean separation of concerns.
 
 from datetime import datetime, timezone
 from uuid import UUID
-from typing import Optional
+from typing import Optional, Sequence
 
-from sqlalchemy import update, delete
+from sqlalchemy import update, delete, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import load_only, selectinload
 
+from app.jobs.constants import PaginationLimits
 from app.jobs.models import JobRecord
 
+# Columns the job list view reads; everything else stays in the database
+LIST_VIEW_COLUMNS = (
+    JobRecord.id,
+    JobRecord.role_title,
+    JobRecord.company_name,
+    JobRecord.current_node,
+    JobRecord.jd_approval_status,
+    JobRecord.created_at,
+    JobRecord.updated_at,
+)
+
 
 class JobRepository:
     """
@@ -63,19 +76,48 @@ class JobRepository:
         )
         return result.scalar_one_or_none()
 
-    async def update(self, job_id: UUID, **values) -> None:
+    async def get_by_ids(self, job_ids: list[UUID]) -> list[JobRecord]:
+        """
+        Retrieve several job records in one query.
+
+        Args:
+            job_ids: UUIDs of the jobs to retrieve
+
+        Returns:
+            The JobRecords found, in no particular order (missing IDs are skipped)
+        """
+        if not job_ids:
+            return []
+        result = await self.session.execute(
+            select(JobRecord).where(JobRecord.id.in_(job_ids))
+        )
+        return list(result.scalars().all())
+
+    async def update(self, job_id: UUID, **values) -> Optional[JobRecord]:
         """
         Update a job record with the given values.
 
+        Uses UPDATE ... RETURNING, so the refreshed row comes back in the same
+        round trip; any copy already in the session is refreshed in place.
+
         Args:
             job_id: The UUID of the job to update
             **values: Key-value pairs of fields to update
+
+        Returns:
+            The updated JobRecord, or None if no job has that ID
         """
         values["updated_at"] = datetime.now(timezone.utc)
-        await self.session.execute(
-            update(JobRecord).where(JobRecord.id == job_id).values(**values)
+        result = await self.session.execute(
+            update(JobRecord)
+            .where(JobRecord.id == job_id)
+            .values(**values)
+            .returning(JobRecord)
+            .execution_options(populate_existing=True)
         )
+        job = result.scalar_one_or_none()
         await self.session.commit()
+        return job
 
     async def delete(self, job_id: UUID) -> int:
         """
@@ -93,19 +135,82 @@ class JobRepository:
         await self.session.commit()
         return result.rowcount
 
-    async def get_by_user_id(self, user_id: UUID) -> list[JobRecord]:
+    async def get_by_user_id(
+        self,
+        user_id: UUID,
+        limit: int = PaginationLimits.DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+        fields: Optional[Sequence] = LIST_VIEW_COLUMNS,
+    ) -> list[JobRecord]:
         """
-        Retrieve all jobs for a specific user, ordered by created_at desc.
+        Retrieve a page of a user's jobs, ordered by created_at desc.
 
         Args:
             user_id: The UUID of the user whose jobs to retrieve
+            limit: Maximum number of jobs to return
+            offset: Number of jobs to skip
+            fields: Columns to load (others raise on access); None loads all
 
         Returns:
             List of JobRecord instances belonging to the user
         """
-        result = await self.session.execute(
+        statement = self._user_jobs_page(user_id, limit, offset)
+        if fields is not None:
+            statement = statement.options(load_only(*fields, raiseload=True))
+        result = await self.session.execute(statement)
+        return list(result.scalars().all())
+
+    async def get_by_user_id_with_applicants(
+        self,
+        user_id: UUID,
+        limit: int = PaginationLimits.DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+    ) -> list[JobRecord]:
+        """
+        Retrieve a page of a user's jobs with their applicants loaded.
+
+        Applicants for the whole page come from one extra IN query rather
+        than a lazy load per job. Use only where applicants are rendered;
+        plain listings should use get_by_user_id.
+
+        Args:
+            user_id: The UUID of the user whose jobs to retrieve
+            limit: Maximum number of jobs to return
+            offset: Number of jobs to skip
+
+        Returns:
+            List of JobRecord instances with applicants populated
+        """
+        statement = self._user_jobs_page(user_id, limit, offset).options(
+            selectinload(JobRecord.applicants)
+        )
+        result = await self.session.execute(statement)
+        return list(result.scalars().all())
+
+    @staticmethod
+    def _user_jobs_page(user_id: UUID, limit: int, offset: int):
+        """A page of a user's jobs, newest first."""
+        return (
             select(JobRecord)
             .where(JobRecord.owner_id == user_id)
             .order_by(JobRecord.created_at.desc())
+            .limit(limit)
+            .offset(offset)
         )
-        return list(result.scalars().all())
+
+    async def count_by_user(self, user_id: UUID) -> int:
+        """
+        Count the jobs owned by a user without loading them.
+
+        Args:
+            user_id: The UUID of the user whose jobs to count
+
+        Returns:
+            Number of jobs belonging to the user
+        """
+        result = await self.session.execute(
+            select(func.count())
+            .select_from(JobRecord)
+            .where(JobRecord.owner_id == user_id)
+        )
+        return result.scalar_one()
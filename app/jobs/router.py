@@ -5,11 +5,14 @@ Thin HTTP layer that delegates to the service layer.
 Contains no business logic, locking, or background task definitions.
 """
 
-from fastapi import APIRouter, Depends, BackgroundTasks
+from fastapi import APIRouter, Depends, BackgroundTasks, Query, Response
+from fastapi.responses import ORJSONResponse
 
+from app.jobs.constants import PaginationLimits
 from app.jobs.dependencies import get_job_service
 from app.jobs.services import JobService
 from app.jobs.schemas import (
+    GeneratedJD,
     JobInput,
     JobCreateResponse,
     JobStatusResponse,
@@ -25,21 +28,37 @@ from app.core.logging import get_logger
 from app.auth.models import User
 from app.auth.jwt_dependencies import get_current_user
 
-router = APIRouter(prefix="/jobs", tags=["Jobs"])
+# Responses are rendered with orjson rather than the stdlib encoder
+router = APIRouter(
+    prefix="/jobs",
+    tags=["Jobs"],
+    default_response_class=ORJSONResponse,
+)
 logger = get_logger(__name__)
 
 
+def _jd_response(jd: GeneratedJD) -> Response:
+    """JSON response for a JD, serialized in one pass by pydantic-core."""
+    return Response(content=jd.model_dump_json(), media_type="application/json")
+
+
 @router.get(
     "/",
     response_model=JobListResponse,
     summary="List all jobs for current user",
 )
 async def list_jobs(
+    limit: int = Query(
+        PaginationLimits.DEFAULT_PAGE_SIZE, ge=1, le=PaginationLimits.MAX_PAGE_SIZE
+    ),
+    offset: int = Query(0, ge=0),
     service: JobService = Depends(get_job_service),
     user: User = Depends(get_current_user),
 ):
-    """List all jobs created by the current user."""
-    return await service.list_jobs(user)
+    """List a page of the jobs created by the current user."""
+    # Rows are trusted, so skip response-model validation; orjson encodes the
+    # dataclasses directly
+    return ORJSONResponse(await service.list_jobs(user, limit=limit, offset=offset))
 
 
 @router.post(
@@ -61,9 +80,7 @@ async def create_job(
     response, initial_state = await service.create_job(job_input, user)
 
     # Run workflow (including JD generation) in background to avoid blocking
-    background_tasks.add_task(
-        service.execute_graph_background, str(response.job_id), initial_state
-    )
+    await service.dispatch_graph(str(response.job_id), initial_state, background_tasks)
 
     return response
 
@@ -93,7 +110,7 @@ async def get_generated_jd(
 ):
     """Get the AI-generated job description."""
     jd = await service.get_generated_jd(job_id, user)
-    return jd.model_dump()
+    return _jd_response(jd)
 
 
 @router.post(
@@ -124,7 +141,7 @@ async def update_jd(
     updated_jd = await service.update_jd(
         job_id, jd_update.model_dump(exclude_unset=True), user
     )
-    return updated_jd.model_dump()
+    return _jd_response(updated_jd)
 
 
 @router.post(
@@ -139,7 +156,7 @@ async def regenerate_jd(
 ):
     """Regenerate the JD using AI with recruiter feedback."""
     new_jd = await service.regenerate_jd(job_id, request.feedback, user)
-    return new_jd.model_dump()
+    return _jd_response(new_jd)
 
 
 @router.post(
@@ -154,13 +171,12 @@ async def approve_shortlist(
     user: User = Depends(get_current_user),
 ):
     """Approve the shortlisted candidates."""
-    result = await service.approve_shortlist(job_id, user)
+    response, state = await service.approve_shortlist(job_id, user)
 
-    # Resume graph execution in background
-    state = await service.get_job_state(job_id)
-    background_tasks.add_task(service.execute_graph_background, job_id, state)
+    # Resume graph execution in background from the state just saved
+    await service.dispatch_graph(job_id, state, background_tasks)
 
-    return result
+    return response
 
 
 @router.post(
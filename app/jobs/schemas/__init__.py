@@ -8,6 +8,7 @@ Usage: from app.jobs.schemas import JobInput, GeneratedJD, ...
 from app.jobs.schemas.enums import (
     RecruitmentNodeStatus,
     ApprovalStatus,
+    node_status,
 )
 from app.jobs.schemas.fields import (
     JobTitle,
@@ -41,11 +42,16 @@ from app.jobs.schemas.responses import (
     PublicJobResponse,
     PublicJobListResponse,
 )
+from app.jobs.schemas.fast import (
+    JobListItemFast,
+    JobListFast,
+)
 
 __all__ = [
     # Enums
     "RecruitmentNodeStatus",
     "ApprovalStatus",
+    "node_status",
     # Fields
     "JobTitle",
     "CompanyName",
@@ -74,4 +80,7 @@ __all__ = [
     "PublicJobListItem",
     "PublicJobResponse",
     "PublicJobListResponse",
+    # Fast (list endpoints)
+    "JobListItemFast",
+    "JobListFast",
 ]
@@ -21,6 +21,15 @@ class RecruitmentNodeStatus(str, Enum):
     COMPLETED = "completed"
 
 
+# Value-to-member table so hot conversion paths skip Enum.__call__
+_NODE_STATUS_BY_VALUE = {status.value: status for status in RecruitmentNodeStatus}
+
+
+def node_status(value: str) -> RecruitmentNodeStatus:
+    """Look up a node status by value; raises ValueError if unknown."""
+    return _NODE_STATUS_BY_VALUE.get(value) or RecruitmentNodeStatus(value)
+
+
 class ApprovalStatus(str, Enum):
     """Human-in-the-loop approval status."""
 
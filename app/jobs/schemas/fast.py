@@ -0,0 +1,34 @@
+"""
+Fast schemas for Jobs API list endpoints.
+
+Slotted dataclasses mirroring the list response models. Rows come straight
+from our own database, so they skip Pydantic validation and are serialized
+natively by orjson. The Pydantic models in responses.py remain the
+documented response_model and the input-validation boundary.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from app.jobs.schemas.enums import RecruitmentNodeStatus
+
+
+@dataclass(slots=True)
+class JobListItemFast:
+    """Job row as returned by the job list endpoint (see JobListItem)."""
+
+    job_id: UUID
+    role_title: str
+    company_name: str
+    current_node: RecruitmentNodeStatus
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass(slots=True)
+class JobListFast:
+    """Page of jobs with the user's total job count (see JobListResponse)."""
+
+    jobs: list[JobListItemFast]
+    total: int
@@ -6,7 +6,7 @@ Following DRY principle with Annotated types.
 
 from typing import Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # ============================================================================
@@ -92,5 +92,9 @@ SkillsList = Annotated[
 class LocationSalaryMixin(BaseModel):
     """Mixin for location and salary fields (DRY)."""
 
+    # Shared by the JD input/output models: trim strings while validating so
+    # length limits apply to the trimmed text
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     location: LocationStr = None
     salary_range: SalaryRange = None
@@ -2,7 +2,7 @@
 Request schemas for Jobs API endpoints.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.jobs.schemas.fields import (
     JobTitle,
@@ -29,6 +29,8 @@ class JDUpdateRequest(LocationSalaryMixin):
 class JDRegenerateRequest(BaseModel):
     """Request to regenerate JD with feedback."""
 
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     feedback: str = Field(
         ...,
         min_length=10,
@@ -22,7 +22,7 @@ class EmbeddingManager:
         self.pinecone_service = pinecone_service
         self.logger = logger
 
-    async def store_jd_embedding(self, job_id: str, jd: GeneratedJD) -> None:
+    async def store_jd_embedding(self, job_id: str, jd: GeneratedJD) -> list[float]:
         """
         Generate and store job description embedding.
 
@@ -30,6 +30,9 @@ class EmbeddingManager:
             job_id: Job identifier
             jd: Generated job description
 
+        Returns:
+            The generated embedding, so callers can persist it
+
         Raises:
             EmbeddingOperationError: If embedding operation fails
         """
@@ -39,6 +42,7 @@ class EmbeddingManager:
             await self.pinecone_service.upsert_job_embedding(
                 job_id, embedding, metadata
             )
+            return embedding
         except Exception as e:
             raise EmbeddingOperationError(
                 operation="store", job_id=job_id, original_error=str(e)
@@ -7,6 +7,8 @@ Coordinates job operations by delegating to specialized helper services.
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
+from fastapi import BackgroundTasks
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import Settings
@@ -18,7 +20,13 @@ from app.workflow.exceptions import InvalidStateTransitionError
 from app.auth.models import User
 from app.jobs.models import JobRecord
 from app.jobs.repository import JobRepository
-from app.jobs.constants import LockTimeouts, LockKeys, MockDataLimits
+from app.jobs.tasks import enqueue_graph_run, run_graph
+from app.jobs.constants import (
+    LockTimeouts,
+    LockKeys,
+    MockDataLimits,
+    PaginationLimits,
+)
 from app.jobs.schemas import (
     JobInput,
     JobCreateResponse,
@@ -30,13 +38,16 @@ from app.jobs.schemas import (
     ShortlistApprovalResponse,
     MockApplicantsResponse,
     DeleteJobResponse,
-    JobListItem,
-    JobListResponse,
+    JobListItemFast,
+    JobListFast,
+    node_status,
 )
 from app.candidates.schemas import Applicant
+from app.careers.cache import invalidate_careers_cache
+from app.careers.jsonld_generator import serialize_job_jsonld
 from app.workflow import create_initial_state, GraphState
 from app.workflow.engine import WorkflowEngine
-from app.ai.embeddings import PineconeService
+from app.ai.embeddings import PineconeService, normalize_embedding
 
 from app.jobs.services.access_control import JobAccessControl
 from app.jobs.services.embedding_manager import EmbeddingManager
@@ -168,7 +179,7 @@ class JobService:
 
     async def approve_jd(self, job_id: str, user: User) -> JDApprovalResponse:
         """Approve generated JD with distributed locking."""
-        await self.access_control.ensure_access(job_id, user)
+        job_record = await self.access_control.ensure_access(job_id, user)
 
         try:
             async with distributed_lock(
@@ -176,9 +187,23 @@ class JobService:
             ):
                 state = await self.get_job_state(job_id)
                 await self.jd_manager.approve_jd_state(job_id, state)
-                await self.embedding_manager.store_jd_embedding(
+                embedding = await self.embedding_manager.store_jd_embedding(
                     job_id, state.jd.generated_jd
                 )
+                # Persist the unit vector so applications skip the embedding call,
+                # and the JSON-LD so public detail pages skip the generator
+                await self.repository.update(
+                    UUID(job_id),
+                    jd_embedding=normalize_embedding(embedding),
+                    jsonld_cached=serialize_job_jsonld(
+                        job_id,
+                        state.jd.generated_jd,
+                        job_record.company_name,
+                        job_record.company_description,
+                        job_record.created_at,
+                    ),
+                )
+            await invalidate_careers_cache()
 
             self._log_operation("approve_jd", success=True, details={"job_id": job_id})
             return JDApprovalResponse(
@@ -194,6 +219,7 @@ class JobService:
         await self.access_control.ensure_access(job_id, user)
         state = await self.get_job_state(job_id)
         updated_jd = await self.jd_manager.update_jd(job_id, state, jd_update)
+        await invalidate_careers_cache()
 
         self._log_operation("update_jd", success=True, details={"job_id": job_id})
         return updated_jd
@@ -215,8 +241,14 @@ class JobService:
 
     async def approve_shortlist(
         self, job_id: str, user: User
-    ) -> ShortlistApprovalResponse:
-        """Approve shortlisted candidates."""
+    ) -> tuple[ShortlistApprovalResponse, GraphState]:
+        """
+        Approve shortlisted candidates.
+
+        Returns:
+            Tuple of (ShortlistApprovalResponse, updated GraphState for
+            background execution)
+        """
         await self.access_control.ensure_access(job_id, user)
 
         async with distributed_lock(
@@ -232,10 +264,11 @@ class JobService:
             "approve_shortlist", success=True, details={"job_id": job_id}
         )
 
-        return ShortlistApprovalResponse(
+        response = ShortlistApprovalResponse(
             message="Shortlist approved. Voice prescreening will begin.",
             shortlisted_count=len(state.applicants.shortlisted_ids),
         )
+        return response, state
 
     def _validate_shortlist_state(self, state: GraphState) -> None:
         """Validate state allows shortlist approval."""
@@ -251,31 +284,30 @@ class JobService:
         state.applicants.shortlist_approval = ApprovalStatus.APPROVED
         state.updated_at = datetime.now(timezone.utc)
 
-    async def execute_graph_background(self, job_id: str, state: GraphState) -> None:
-        """Execute recruitment graph in background with locking."""
-        try:
-            async with distributed_lock(
-                LockKeys.job_graph(job_id),
-                timeout=LockTimeouts.JOB_GRAPH_EXECUTION,
-            ):
-                await self.workflow_engine.invoke(state, job_id)
+    async def dispatch_graph(
+        self, job_id: str, state: GraphState, background_tasks: BackgroundTasks
+    ) -> None:
+        """
+        Start a graph run after the response is sent.
 
-            self._log_operation(
-                "execute_graph", success=True, details={"job_id": job_id}
-            )
-        except Exception as e:
-            self.logger.exception("Error executing graph", extra={"job_id": job_id})
-            await self._save_error_state(job_id, state, str(e))
+        Uses the task queue when enabled, so the run survives this worker and
+        doesn't occupy it; falls back to in-process BackgroundTasks otherwise
+        or when Redis is unreachable.
+        """
+        if self.settings.task_queue_enabled:
+            try:
+                await enqueue_graph_run(job_id, state)
+                return
+            except (RedisError, OSError) as e:
+                self.logger.warning(
+                    f"Task queue unavailable, running graph in-process: {e}",
+                    extra={"job_id": job_id},
+                )
+        background_tasks.add_task(self.execute_graph_background, job_id, state)
 
-    async def _save_error_state(
-        self, job_id: str, state: GraphState, error: str
-    ) -> None:
-        """Save error message to state (best effort)."""
-        try:
-            state.error_message = error
-            await self.workflow_engine.save_state(job_id, state)
-        except Exception:
-            pass  # Don't raise on error save failure
+    async def execute_graph_background(self, job_id: str, state: GraphState) -> None:
+        """Execute recruitment graph in background with locking."""
+        await run_graph(self.workflow_engine, job_id, state)
 
     async def add_mock_applicants(
         self, job_id: str, user: User, count: int = MockDataLimits.DEFAULT_APPLICANTS
@@ -334,21 +366,38 @@ class JobService:
         rowcount = await self.repository.delete(UUID(job_id))
         if rowcount == 0:
             raise RecordNotFoundError("Job", job_id)
+        await invalidate_careers_cache()
 
         self._log_operation("delete_job", success=True, details={"job_id": job_id})
         return DeleteJobResponse(message=f"Job {job_id} deleted successfully")
 
-    async def list_jobs(self, user: User) -> JobListResponse:
+    async def list_jobs(
+        self,
+        user: User,
+        limit: int = PaginationLimits.DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+    ) -> JobListFast:
         """
-        List all jobs for the current user.
+        List a page of jobs for the current user, newest first.
 
         Args:
             user: Current authenticated user
+            limit: Page size (capped at PaginationLimits.MAX_PAGE_SIZE)
+            offset: Number of jobs to skip
 
         Returns:
-            JobListResponse with list of user's jobs
+            JobListFast with the page of jobs and the user's total job count
         """
-        jobs = await self.repository.get_by_user_id(user.id)
+        limit = max(1, min(limit, PaginationLimits.MAX_PAGE_SIZE))
+        offset = max(0, offset)
+        jobs = await self.repository.get_by_user_id(
+            user.id, limit=limit, offset=offset
+        )
+        # A short first page already holds every job; only count otherwise
+        if offset == 0 and len(jobs) < limit:
+            total = len(jobs)
+        else:
+            total = await self.repository.count_by_user(user.id)
 
         # Keep list status aligned with workflow state for already-running jobs.
         for job in jobs:
@@ -364,11 +413,11 @@ class JobService:
                 )
 
         job_items = [
-            JobListItem(
+            JobListItemFast(
                 job_id=job.id,
                 role_title=job.role_title,
                 company_name=job.company_name,
-                current_node=RecruitmentNodeStatus(job.current_node),
+                current_node=node_status(job.current_node),
                 created_at=job.created_at,
                 updated_at=job.updated_at,
             )
@@ -380,4 +429,4 @@ class JobService:
             success=True,
             details={"user_id": str(user.id), "count": len(job_items)},
         )
-        return JobListResponse(jobs=job_items, total=len(job_items))
+        return JobListFast(jobs=job_items, total=total)
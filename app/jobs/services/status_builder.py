@@ -2,11 +2,14 @@
 Status builder service.
 
 Builds JobStatusResponse from various sources.
+
+Both sources are our own validated data (workflow state, DB rows), so
+responses are built with model_construct and skip field validation.
 """
 
 from uuid import UUID
 
-from app.jobs.schemas import JobStatusResponse, RecruitmentNodeStatus, ApprovalStatus
+from app.jobs.schemas import JobStatusResponse, ApprovalStatus, node_status
 from app.jobs.models import JobRecord
 from app.workflow import GraphState
 
@@ -21,9 +24,9 @@ class StatusBuilder:
     @staticmethod
     def from_state(state: GraphState) -> JobStatusResponse:
         """Build status from workflow state."""
-        return JobStatusResponse(
+        return JobStatusResponse.model_construct(
             job_id=UUID(state.job_id),
-            current_node=RecruitmentNodeStatus(state.current_node),
+            current_node=node_status(state.current_node),
             applicant_count=len(state.applicants.applicants),
             shortlisted_count=len(state.applicants.shortlisted_ids),
             shortlist_approval_status=state.applicants.shortlist_approval,
@@ -39,9 +42,9 @@ class StatusBuilder:
     @staticmethod
     def from_record(job_record: JobRecord) -> JobStatusResponse:
         """Build fallback status from DB record."""
-        return JobStatusResponse(
+        return JobStatusResponse.model_construct(
             job_id=job_record.id,
-            current_node=RecruitmentNodeStatus(job_record.current_node),
+            current_node=node_status(job_record.current_node),
             applicant_count=0,
             shortlisted_count=0,
             shortlist_approval_status=ApprovalStatus.PENDING,
@@ -0,0 +1,78 @@
+"""
+Jobs Background Tasks
+
+Workflow execution for jobs, runnable in-process (FastAPI BackgroundTasks)
+or on a task-queue worker. Both paths share run_graph, so locking and
+error reporting are identical.
+"""
+
+from app.core.locking import distributed_lock
+from app.core.logging import get_logger
+from app.core.task_queue import enqueue, task
+from app.jobs.constants import LockKeys, LockTimeouts
+from app.workflow import GraphState
+from app.workflow.engine import WorkflowEngine
+
+logger = get_logger(__name__)
+
+GRAPH_TASK = "execute_graph"
+
+
+async def run_graph(
+    workflow_engine: WorkflowEngine, job_id: str, state: GraphState
+) -> None:
+    """Execute the recruitment graph under the job's graph lock."""
+    try:
+        async with distributed_lock(
+            LockKeys.job_graph(job_id),
+            timeout=LockTimeouts.JOB_GRAPH_EXECUTION,
+            # Voice prescreening alone can outlast the timeout
+            keep_alive=True,
+        ):
+            await workflow_engine.invoke(state, job_id)
+
+        logger.info(
+            "Operation completed",
+            extra={"operation": "execute_graph", "success": True, "job_id": job_id},
+        )
+    except Exception as e:
+        logger.exception("Error executing graph", extra={"job_id": job_id})
+        await _save_error_state(workflow_engine, job_id, state, str(e))
+
+
+async def _save_error_state(
+    workflow_engine: WorkflowEngine, job_id: str, state: GraphState, error: str
+) -> None:
+    """Save error message to state (best effort)."""
+    try:
+        state.error_message = error
+        await workflow_engine.save_state(job_id, state)
+    except Exception:
+        pass  # Don't raise on error save failure
+
+
+async def enqueue_graph_run(job_id: str, state: GraphState) -> bool:
+    """
+    Queue a graph run for a worker.
+
+    The state travels with the task because a new job's initial state is
+    not checkpointed until the graph first runs.
+
+    Returns:
+        True if queued, False if a run for this job is already waiting
+
+    Raises:
+        RedisError, OSError: If Redis is unavailable
+    """
+    return await enqueue(
+        GRAPH_TASK,
+        {"job_id": job_id, "state": state.model_dump(mode="json")},
+        dedupe_key=LockKeys.job_graph(job_id),
+        dedupe_ttl=LockTimeouts.JOB_GRAPH_EXECUTION,
+    )
+
+
+@task(GRAPH_TASK)
+async def execute_graph_task(job_id: str, state: dict) -> None:
+    """Worker entry point for a queued graph run."""
+    await run_graph(WorkflowEngine(), job_id, GraphState.model_validate(state))
@@ -0,0 +1,103 @@
+"""
+Jobs Repository Tests
+
+Unit tests for JobRepository queries.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+import app.models  # noqa: F401  (configures mappers)
+from app.jobs.repository import JobRepository
+
+
+@pytest.fixture
+def session():
+    session = AsyncMock()
+    session.execute.return_value = MagicMock()
+    return session
+
+
+def _sql(session) -> str:
+    statement = session.execute.call_args.args[0]
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestBulkQueries:
+    """Tests for multi-row lookups."""
+
+    @pytest.mark.asyncio
+    async def test_get_by_ids_uses_one_query(self, session):
+        """All requested jobs should be fetched with a single IN query."""
+        job = MagicMock()
+        session.execute.return_value.scalars.return_value.all.return_value = [job]
+
+        jobs = await JobRepository(session).get_by_ids([uuid4(), uuid4()])
+
+        assert jobs == [job]
+        session.execute.assert_awaited_once()
+        assert "jobs.id IN" in _sql(session)
+
+    @pytest.mark.asyncio
+    async def test_get_by_ids_empty_skips_database(self, session):
+        """No IDs should mean no query."""
+        assert await JobRepository(session).get_by_ids([]) == []
+        session.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_count_by_user_counts_in_sql(self, session):
+        """Counting should happen in the database, not by loading rows."""
+        session.execute.return_value.scalar_one.return_value = 3
+
+        assert await JobRepository(session).count_by_user(uuid4()) == 3
+        assert _sql(session).startswith("SELECT count(*)")
+
+
+class TestGetByUserId:
+    """Tests for the paginated per-user job listing."""
+
+    @pytest.mark.asyncio
+    async def test_pages_and_loads_list_columns_only(self, session):
+        """The query should be limited and skip the large JD columns."""
+        session.execute.return_value.scalars.return_value.all.return_value = []
+
+        await JobRepository(session).get_by_user_id(uuid4(), limit=10, offset=20)
+
+        sql = _sql(session)
+        assert "LIMIT" in sql and "OFFSET" in sql
+        assert "jobs.role_title" in sql
+        assert "jobs.generated_jd" not in sql
+        assert "jobs.company_description" not in sql
+
+    @pytest.mark.asyncio
+    async def test_with_applicants_loads_them_eagerly(self, session):
+        """Applicants should be selectin-loaded for the page, not lazily."""
+        session.execute.return_value.scalars.return_value.all.return_value = []
+
+        await JobRepository(session).get_by_user_id_with_applicants(uuid4())
+
+        statement = session.execute.call_args.args[0]
+        (load,) = statement._with_options
+        assert load.context[0].strategy == (("lazy", "selectin"),)
+        assert "LIMIT" in _sql(session)
+
+
+class TestUpdate:
+    """Tests for JobRepository.update."""
+
+    @pytest.mark.asyncio
+    async def test_returns_updated_row_in_one_statement(self, session):
+        """The refreshed record should come back from the UPDATE itself."""
+        job = MagicMock()
+        session.execute.return_value.scalar_one_or_none.return_value = job
+
+        updated = await JobRepository(session).update(uuid4(), current_node="done")
+
+        assert updated is job
+        session.execute.assert_awaited_once()
+        sql = _sql(session)
+        assert sql.startswith("UPDATE jobs SET")
+        assert "RETURNING" in sql
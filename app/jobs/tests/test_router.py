@@ -83,3 +83,35 @@ class TestJobsResponses:
     def test_job_status_response_schema(self):
         """GET /jobs/status/{id} response should match JobStatusResponse."""
         pass
+
+
+class TestGeneratedJDEndpoint:
+    """Tests for GET /jobs/{job_id}/jd."""
+
+    def test_returns_jd_serialized_by_pydantic(self):
+        """The JD should be sent as its model JSON, field for field."""
+        from fastapi import FastAPI
+
+        from app.auth.jwt_dependencies import get_current_user
+        from app.jobs.dependencies import get_job_service
+        from app.jobs.router import router
+        from app.jobs.schemas import GeneratedJD
+
+        jd = GeneratedJD(
+            job_title="Backend Engineer",
+            summary="Build and run the APIs behind our recruitment platform. " * 2,
+            description="Design, build and operate services end to end. " * 3,
+            requirements=["Python experience"],
+        )
+        service = MagicMock()
+        service.get_generated_jd = AsyncMock(return_value=jd)
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_job_service] = lambda: service
+        app.dependency_overrides[get_current_user] = lambda: MagicMock()
+
+        response = TestClient(app).get(f"/jobs/{uuid4()}/jd")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert GeneratedJD.model_validate_json(response.content) == jd
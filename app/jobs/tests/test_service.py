@@ -140,6 +140,161 @@ class TestJobService:
         """Delete job should remove DB records and Pinecone vectors."""
         pass
 
+    @pytest.mark.asyncio
+    async def test_list_jobs_counts_only_full_pages(
+        self, mock_repository, mock_session, mock_settings
+    ):
+        """A short first page is the total; a full page needs a count query."""
+        from app.jobs.services import JobService
+
+        user = MagicMock(id=uuid4())
+        job = MagicMock(
+            id=uuid4(),
+            role_title="Engineer",
+            company_name="TechCorp",
+            current_node="generate_jd",
+        )
+        job.created_at = job.updated_at = datetime(2026, 1, 5)
+        mock_repository.get_by_user_id.return_value = [job]
+        mock_repository.count_by_user.return_value = 7
+        workflow_engine = MagicMock()
+        workflow_engine.get_state = AsyncMock(return_value=None)
+        service = JobService(
+            session=mock_session,
+            settings=mock_settings,
+            repository=mock_repository,
+            workflow_engine=workflow_engine,
+            pinecone_service=MagicMock(),
+        )
+
+        short_page = await service.list_jobs(user, limit=10)
+        full_page = await service.list_jobs(user, limit=1)
+
+        assert short_page.total == 1
+        assert full_page.total == 7
+        mock_repository.count_by_user.assert_awaited_once_with(user.id)
+
+        # The unvalidated page must still encode to the documented schema
+        import orjson
+
+        from app.jobs.schemas import JobListResponse
+
+        body = orjson.dumps(short_page)
+        validated = JobListResponse.model_validate_json(body)
+        assert validated.jobs[0].job_id == job.id
+        assert validated.jobs[0].current_node.value == "generate_jd"
+
+    @pytest.mark.asyncio
+    async def test_approve_shortlist_returns_saved_state(
+        self, mock_repository, mock_session, mock_settings
+    ):
+        """The approved state should be handed back for background execution."""
+        from contextlib import asynccontextmanager
+
+        from app.jobs.services import JobService
+
+        @asynccontextmanager
+        async def no_lock(*args, **kwargs):
+            yield
+
+        state = MagicMock(current_node="shortlist_candidates")
+        state.applicants.shortlisted_ids = ["a", "b"]
+        workflow_engine = MagicMock()
+        workflow_engine.get_state = AsyncMock(return_value=state)
+        workflow_engine.save_state = AsyncMock()
+        service = JobService(
+            session=mock_session,
+            settings=mock_settings,
+            repository=mock_repository,
+            workflow_engine=workflow_engine,
+            pinecone_service=MagicMock(),
+        )
+        service.access_control = MagicMock(ensure_access=AsyncMock())
+
+        with patch("app.jobs.services.job_service.distributed_lock", no_lock):
+            response, returned = await service.approve_shortlist("job", MagicMock())
+
+        assert returned is state
+        assert response.shortlisted_count == 2
+        workflow_engine.get_state.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("enabled", [False, True])
+    async def test_dispatch_graph_falls_back_in_process(
+        self, enabled, mock_repository, mock_session, mock_settings
+    ):
+        """Without a reachable queue the run should use BackgroundTasks."""
+        from redis.exceptions import ConnectionError
+
+        from app.jobs.services import JobService
+
+        mock_settings.task_queue_enabled = enabled
+        service = JobService(
+            session=mock_session,
+            settings=mock_settings,
+            repository=mock_repository,
+            workflow_engine=MagicMock(),
+            pinecone_service=MagicMock(),
+        )
+        background_tasks = MagicMock()
+        state = MagicMock()
+
+        with patch(
+            "app.jobs.services.job_service.enqueue_graph_run",
+            AsyncMock(side_effect=ConnectionError("down")),
+        ) as enqueue:
+            await service.dispatch_graph("job", state, background_tasks)
+
+        assert enqueue.await_count == int(enabled)
+        background_tasks.add_task.assert_called_once_with(
+            service.execute_graph_background, "job", state
+        )
+
+
+class TestStatusBuilder:
+    """Tests for status responses built without validation."""
+
+    def test_from_state_matches_validated_output(self):
+        """Constructed status JSON should equal a validated model's JSON."""
+        from app.jobs.schemas import JobStatusResponse
+        from app.jobs.services import StatusBuilder
+        from app.workflow import create_initial_state
+
+        state = create_initial_state(
+            JobInput(
+                role_title="Backend Engineer",
+                department="Engineering",
+                company_name="TechCorp",
+            )
+        )
+
+        status = StatusBuilder.from_state(state)
+        validated = JobStatusResponse.model_validate(status.model_dump())
+
+        assert status.model_dump_json() == validated.model_dump_json()
+
+    def test_from_record_matches_validated_output(self):
+        """The DB fallback should serialize exactly like a validated model."""
+        from app.jobs.schemas import JobStatusResponse
+        from app.jobs.services import StatusBuilder
+
+        record = MagicMock(id=uuid4(), current_node="post_job")
+        record.created_at = record.updated_at = datetime(2026, 1, 5)
+
+        status = StatusBuilder.from_record(record)
+        validated = JobStatusResponse.model_validate(status.model_dump())
+
+        assert status.model_dump_json() == validated.model_dump_json()
+
+    def test_unknown_node_is_rejected(self):
+        """Skipping validation must not let unknown node values through."""
+        from app.jobs.services import StatusBuilder
+
+        record = MagicMock(id=uuid4(), current_node="not_a_node")
+
+        with pytest.raises(ValueError):
+            StatusBuilder.from_record(record)
+
 
 class TestJobOwnership:
     """Tests for job ownership validation."""
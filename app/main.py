@@ -16,12 +16,14 @@ from uuid import uuid4
 
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse, HTMLResponse
 
 from app.core.config import get_settings
 from app.core.database import init_database, close_database
 from app.core.logging import (
     setup_logging,
+    shutdown_logging,
     get_logger,
     correlation_id_var,
 )
@@ -32,6 +34,7 @@ from app.core.exceptions import (
     ForbiddenError,
 )
 from app.workflow.exceptions import InvalidStateTransitionError
+from app.ai.pdf_parser import shutdown_pdf_pool, start_pdf_pool
 
 # Import Routers
 from app.jobs.router import router as jobs_router
@@ -54,6 +57,8 @@ async def lifespan(app: FastAPI):
     await init_database()
     logger.info("Database initialized")
 
+    start_pdf_pool()
+
     yield
 
     # Shutdown
@@ -67,8 +72,18 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Error closing Redis: {e}")
 
+    # Close the shared OpenAI connection pool
+    try:
+        from app.ai.client import close_openai_client
+
+        await close_openai_client()
+    except Exception as e:
+        logger.warning(f"Error closing OpenAI client: {e}")
+
+    shutdown_pdf_pool()
     await close_database()
     logger.info("Shutdown complete")
+    shutdown_logging()
 
 
 settings = get_settings()
@@ -91,16 +106,20 @@ app = FastAPI(
 # ============================================================================
 
 # CORS Configuration - Use environment-based origins for security
-origins = [origin.strip() for origin in settings.cors_origins.split(",")]
-
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=origins,
+    allow_origins=settings.cors_origins_list,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
     allow_headers=["*"],
 )
 
+# Compress large JSON/XML payloads (careers listings, feeds). Level 5 keeps
+# CPU cost low while still shrinking list responses substantially; responses
+# under 1KB are passed through untouched. Vary: Accept-Encoding is set by
+# the middleware.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 @app.middleware("http")
 async def correlation_id_middleware(request: Request, call_next):
@@ -0,0 +1,18 @@
+"""
+ORM model registry.
+
+Importing this package registers every table with ``Base.metadata``.
+"""
+
+from app.auth.models import User
+from app.candidates.models import ApplicantRecord, PrescreeningResponseRecord
+from app.interviews.models import InterviewRecord
+from app.jobs.models import JobRecord
+
+__all__ = [
+    "User",
+    "ApplicantRecord",
+    "PrescreeningResponseRecord",
+    "InterviewRecord",
+    "JobRecord",
+]
@@ -0,0 +1,47 @@
+"""
+AARLP Task Worker
+
+Runs queued background tasks (workflow executions) outside the API
+process. Start one or more alongside the API when TASK_QUEUE_ENABLED=true:
+
+    python -m app.worker
+"""
+
+import asyncio
+import os
+import signal
+import socket
+
+import app.jobs.tasks  # noqa: F401  (registers task handlers)
+from app.core.config import get_settings
+from app.core.database import close_database
+from app.core.locking import close_redis
+from app.core.logging import get_logger, setup_logging, shutdown_logging
+from app.core.task_queue import run_worker
+
+logger = get_logger(__name__)
+
+
+async def main() -> None:
+    """Consume tasks until SIGINT/SIGTERM, then release connections."""
+    setup_logging()
+    settings = get_settings()
+    consumer = f"{socket.gethostname()}:{os.getpid()}"
+
+    worker = asyncio.current_task()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, worker.cancel)
+
+    try:
+        await run_worker(consumer, settings.task_worker_concurrency)
+    except asyncio.CancelledError:
+        logger.info("Worker stopping")
+    finally:
+        await close_redis()
+        await close_database()
+        shutdown_logging()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -134,10 +134,9 @@ async def get_recruitment_graph():
     """
     settings = get_settings()
 
-    # Convert asyncpg URL to psycopg-compatible URL
-    db_url = settings.database_url.replace("postgresql+asyncpg", "postgresql")
-
-    async with AsyncPostgresSaver.from_conn_string(db_url) as checkpointer:
+    async with AsyncPostgresSaver.from_conn_string(
+        settings.checkpoint_database_url
+    ) as checkpointer:
         await checkpointer.setup()
         workflow = build_recruitment_graph()
         yield workflow.compile(checkpointer=checkpointer)
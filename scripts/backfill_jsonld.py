@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Backfill cached JSON-LD for approved jobs.
+
+Jobs approved before the jsonld_cached column existed render JSON-LD on
+every detail request. This one-off script renders and stores it for them.
+
+Usage:
+    # Run from the repository root with the app's environment configured
+    PYTHONPATH=. python scripts/backfill_jsonld.py [--dry-run]
+"""
+
+import argparse
+import asyncio
+import sys
+
+from sqlalchemy import select, update
+
+from app.careers.jsonld_generator import serialize_job_jsonld
+from app.core.database import close_database, get_session_factory
+from app.jobs.models import JobRecord
+from app.jobs.schemas.enums import ApprovalStatus
+import app.candidates.models  # noqa: F401  (register mapped classes)
+import app.auth.models  # noqa: F401
+
+
+async def backfill(dry_run: bool) -> int:
+    """Render JSON-LD for approved jobs missing it. Returns the job count."""
+    factory = get_session_factory()
+    async with factory() as session:
+        result = await session.execute(
+            select(JobRecord)
+            .where(JobRecord.jd_approval_status == ApprovalStatus.APPROVED.value)
+            .where(JobRecord.generated_jd.isnot(None))
+            .where(JobRecord.jsonld_cached.is_(None))
+        )
+        jobs = list(result.scalars().all())
+
+        for job in jobs:
+            jsonld = serialize_job_jsonld(
+                str(job.id),
+                job.parsed_jd,
+                job.company_name,
+                job.company_description,
+                job.created_at,
+            )
+            print(f"  {job.id}  {job.parsed_jd.job_title}")
+            if not dry_run:
+                await session.execute(
+                    update(JobRecord)
+                    .where(JobRecord.id == job.id)
+                    .values(jsonld_cached=jsonld)
+                )
+
+        if not dry_run:
+            await session.commit()
+    return len(jobs)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--dry-run", action="store_true", help="List jobs without writing"
+    )
+    args = parser.parse_args()
+
+    async def run() -> int:
+        try:
+            return await backfill(args.dry_run)
+        finally:
+            await close_database()
+
+    count = asyncio.run(run())
+    action = "Would backfill" if args.dry_run else "Backfilled"
+    print(f"\n--- {action} {count} job(s) ---")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())